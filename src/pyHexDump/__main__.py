@@ -25,6 +25,7 @@
 ################################################################################
 # Imports
 ################################################################################
+import os
 import sys
 from pyHexDump.constants import Ret
 from pyHexDump.prg_arg_parser import PrgArgParser
@@ -97,7 +98,12 @@ def main():
         if cmd_exec_func is None:
             ret_status = Ret.ERROR_UNKNOWN_COMMAND
         else:
-            ret_status = cmd_exec_func(prg_arg_parser.get_args())
+            try:
+                ret_status = cmd_exec_func(prg_arg_parser.get_args())
+            except BrokenPipeError:
+                # The reader of the output, e.g. head or less, quit early.
+                # Further output is discarded, to avoid another error at exit.
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
 
     return ret_status
 
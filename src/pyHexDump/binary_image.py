@@ -0,0 +1,589 @@
+"""This module provides the binary image, which gives fast access to the
+    binary data without copying it. Parsed intel hex files can be cached on
+    disk, which are mapped into memory on later loads.
+"""
+
+# MIT License
+#
+# Copyright (c) 2022 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import hashlib
+import mmap
+import os
+import struct
+import time
+from bisect import bisect_right
+from pyHexDump.version import __version__
+
+################################################################################
+# Variables
+################################################################################
+
+# Value returned for addresses without data, same as IntelHex does.
+PADDING = 0xFF
+
+# Intel hex record types
+_RECORD_TYPE_DATA = 0x00
+_RECORD_TYPE_END_OF_FILE = 0x01
+_RECORD_TYPE_EXT_SEGMENT_ADDR = 0x02
+_RECORD_TYPE_EXT_LINEAR_ADDR = 0x04
+
+# Sub directory in the cache directory.
+_CACHE_SUB_DIR = "binary_image"
+
+# Identification of a cached binary image. Increase the format if it changes.
+_CACHE_MAGIC = b"PHDI"
+_CACHE_FORMAT = 2
+
+# Header of a cached binary image: magic, format, number of segments, size and
+# modification time (ns) of the intel hex file, time (ns) of the last check
+# against the intel hex file and SHA-256 of its content.
+# It is followed by the segment table and the raw bytes of all segments.
+_CACHE_HEADER = struct.Struct("<4sIIQqq32s")
+
+# Max. time granularity of a file modification time (ns), e.g. 2 s on FAT.
+_MTIME_GRANULARITY_NS = 2 * 1000 * 1000 * 1000
+
+# Segment table entry: start address, offset of the raw bytes in the file and length.
+_CACHE_SEGMENT = struct.Struct("<QQQ")
+
+# Number of bytes, which are read at once to calculate the content hash.
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+################################################################################
+# Classes
+################################################################################
+
+class BinaryImage():
+    """Binary image, which holds the binary data in a sorted list of contiguous
+        segments. A address is resolved to its segment via binary search and
+        the data is accessed via memoryviews, which avoids any copy.
+        It provides the same byte access like IntelHex, therefore it can be
+        used as binary data for the memory access API.
+    """
+    def __init__(self, segment_list=None):
+        """Initialize the binary image.
+
+        Args:
+            segment_list (list, optional): List of (start address, buffer) tuples.
+                The buffer must support the buffer protocol, e.g. bytearray or mmap.
+                The segments must not overlap. Defaults to None.
+        """
+        self._starts = []
+        self._ends = []
+        self._buffers = []
+
+        if segment_list is not None:
+            for start_addr, buffer in sorted(segment_list, key=lambda segment: segment[0]):
+                data = memoryview(buffer).cast("B")
+
+                if len(data) == 0:
+                    continue
+
+                if (len(self._ends) > 0) and (start_addr < self._ends[-1]):
+                    raise ValueError(f"Segment at 0x{start_addr:08X} overlaps the previous one.")
+
+                self._starts.append(start_addr)
+                self._ends.append(start_addr + len(data))
+                self._buffers.append(data)
+
+    def __getitem__(self, addr):
+        """Get a single byte from the binary data.
+
+        Args:
+            addr (int): Address of the byte
+
+        Returns:
+            int: Byte value; padding if the address contains no data.
+        """
+        idx = self._find_segment(addr)
+
+        if idx < 0:
+            return PADDING
+
+        return self._buffers[idx][addr - self._starts[idx]]
+
+    def __len__(self):
+        return sum(len(buffer) for buffer in self._buffers)
+
+    def _find_segment(self, addr):
+        """Find the segment, which contains the given address.
+
+        Args:
+            addr (int): Address
+
+        Returns:
+            int: Segment index or -1 if the address contains no data.
+        """
+        idx = bisect_right(self._starts, addr) - 1
+
+        if (idx < 0) or (addr >= self._ends[idx]):
+            idx = -1
+
+        return idx
+
+    def minaddr(self):
+        """Get the lowest address with data.
+
+        Returns:
+            int: Lowest address or None if there is no data.
+        """
+        if len(self._starts) == 0:
+            return None
+
+        return self._starts[0]
+
+    def maxaddr(self):
+        """Get the highest address with data.
+
+        Returns:
+            int: Highest address or None if there is no data.
+        """
+        if len(self._ends) == 0:
+            return None
+
+        return self._ends[-1] - 1
+
+    def segments(self):
+        """Get the address ranges, which contain data.
+
+        Returns:
+            list: List of (start, end) tuples, the end address is not included.
+        """
+        return list(zip(self._starts, self._ends))
+
+    def get_bytes(self, addr, size):
+        """Get a contiguous range of bytes. If the range is completely inside
+            one segment, no copy is made. Addresses without data are filled
+            with padding.
+
+        Args:
+            addr (int): Start address
+            size (int): Number of bytes
+
+        Returns:
+            memoryview|bytes: Binary data
+        """
+        idx = self._find_segment(addr)
+
+        # Fast path: The whole range is located in a single segment.
+        if (idx >= 0) and ((addr + size) <= self._ends[idx]):
+            offset = addr - self._starts[idx]
+            return self._buffers[idx][offset:offset + size]
+
+        data = bytearray([PADDING]) * size
+        end_addr = addr + size
+
+        if idx < 0:
+            idx = bisect_right(self._starts, addr)
+
+        while (idx < len(self._starts)) and (self._starts[idx] < end_addr):
+            copy_start = max(addr, self._starts[idx])
+            copy_end = min(end_addr, self._ends[idx])
+            segment_offset = copy_start - self._starts[idx]
+
+            data[copy_start - addr:copy_end - addr] = \
+                self._buffers[idx][segment_offset:segment_offset + copy_end - copy_start]
+
+            idx += 1
+
+        return bytes(data)
+
+################################################################################
+# Functions
+################################################################################
+
+def binary_image_load_bin_file(file_name):
+    """Load a binary file (.bin) by mapping it into memory. The file content
+        is not read in advance, only the accessed pages will be loaded by the
+        operating system.
+
+    Args:
+        file_name (str): File name of the binary file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+
+    Returns:
+        BinaryImage: Binary image
+    """
+    with open(file_name, "rb") as file_descriptor:
+        try:
+            buffer = mmap.mmap(file_descriptor.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file can not be mapped.
+            buffer = b""
+
+    return BinaryImage([(0, buffer)])
+
+def _merge_segments(segment_list):
+    """Merge adjacent segments to contiguous ones.
+
+    Args:
+        segment_list (list): List of [start address, bytearray] items
+
+    Raises:
+        ValueError: If two segments overlap.
+
+    Returns:
+        list: List of (start address, bytearray) tuples, sorted by address.
+    """
+    merged_list = []
+
+    for start_addr, data in sorted(segment_list, key=lambda segment: segment[0]):
+        if len(merged_list) > 0:
+            prev_start_addr, prev_data = merged_list[-1]
+            prev_end_addr = prev_start_addr + len(prev_data)
+
+            if start_addr < prev_end_addr:
+                raise ValueError(f"Address overlap at 0x{start_addr:08X}.")
+
+            if start_addr == prev_end_addr:
+                prev_data.extend(data)
+                continue
+
+        merged_list.append((start_addr, data))
+
+    return merged_list
+
+def _parse_hex_data(content):
+    """Parse the content of a intel hex file (.hex). All data records are
+        merged into a sorted list of contiguous segments.
+
+    Args:
+        content (bytes): Content of the intel hex file
+
+    Raises:
+        ValueError: If the content contains a invalid record.
+
+    Returns:
+        BinaryImage: Binary image
+    """
+    segment_list = []
+    segment = None
+    segment_end_addr = None
+    base_addr = 0
+
+    for line_number, line in enumerate(content.decode("ascii").splitlines(), 1):
+        line = line.strip()
+
+        if len(line) == 0:
+            continue
+
+        if line[0] != ":":
+            raise ValueError(f"Invalid record in line {line_number}.")
+
+        record = bytes.fromhex(line[1:])
+
+        if (len(record) < 5) or (len(record) != record[0] + 5):
+            raise ValueError(f"Invalid record length in line {line_number}.")
+
+        if (sum(record) & 0xFF) != 0:
+            raise ValueError(f"Invalid record checksum in line {line_number}.")
+
+        record_type = record[3]
+        data = record[4:-1]
+
+        if record_type == _RECORD_TYPE_DATA:
+            addr = base_addr + ((record[1] << 8) | record[2])
+
+            # Continue the current segment or start a new one?
+            if addr == segment_end_addr:
+                segment.extend(data)
+            else:
+                segment = bytearray(data)
+                segment_list.append([addr, segment])
+
+            segment_end_addr = addr + len(data)
+
+        elif record_type == _RECORD_TYPE_END_OF_FILE:
+            break
+
+        elif record_type == _RECORD_TYPE_EXT_SEGMENT_ADDR:
+            base_addr = int.from_bytes(data, byteorder="big") << 4
+
+        elif record_type == _RECORD_TYPE_EXT_LINEAR_ADDR:
+            base_addr = int.from_bytes(data, byteorder="big") << 16
+
+        # The start address records are not relevant for the data.
+
+    return BinaryImage(_merge_segments(segment_list))
+
+def _read_hex_file(file_name):
+    """Read the content of a intel hex file and get its status afterwards.
+
+    Args:
+        file_name (str): File name of the intel hex file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+
+    Returns:
+        bytes, os.stat_result: Content and status of the intel hex file
+    """
+    with open(file_name, "rb") as file_descriptor:
+        content = file_descriptor.read()
+        file_stat = os.fstat(file_descriptor.fileno())
+
+    return content, file_stat
+
+def _get_file_digest(file_name):
+    """Calculate the SHA-256 of the file content.
+
+    Args:
+        file_name (str): File name
+
+    Returns:
+        bytes: SHA-256 digest
+    """
+    hash_obj = hashlib.sha256()
+
+    with open(file_name, "rb") as file_descriptor:
+        for chunk in iter(lambda: file_descriptor.read(_HASH_CHUNK_SIZE), b""):
+            hash_obj.update(chunk)
+
+    return hash_obj.digest()
+
+def _get_cache_file_name(cache_dir, file_name):
+    """Get the file name of the cached binary image of a intel hex file.
+        It depends on the absolute path of the intel hex file.
+
+    Args:
+        cache_dir (str): Cache directory
+        file_name (str): File name of the intel hex file
+
+    Returns:
+        str: Cache file name
+    """
+    hash_obj = hashlib.sha256()
+    hash_obj.update(f"{__version__}:{_CACHE_FORMAT}:{os.path.abspath(file_name)}".encode("utf-8"))
+
+    return os.path.join(cache_dir, _CACHE_SUB_DIR, hash_obj.hexdigest() + ".bin")
+
+def _pack_cache_header(segment_count, file_stat, file_digest):
+    """Pack the header of a cached binary image. The current time is stored
+        as time of the check against the intel hex file.
+
+    Args:
+        segment_count (int): Number of segments
+        file_stat (os.stat_result): Status of the intel hex file
+        file_digest (bytes): SHA-256 of the intel hex file content
+
+    Returns:
+        bytes: Header
+    """
+    return _CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_FORMAT, segment_count, file_stat.st_size, \
+                              file_stat.st_mtime_ns, time.time_ns(), file_digest)
+
+def _get_cached_segments(buffer, cache_file_name, file_name):
+    """Get the segments of a cached binary image, if it is still valid for
+        the intel hex file. It is valid, if the size of the intel hex file
+        is the same and its content has the same SHA-256.
+
+        The content is not hashed, if the modification time is the same and
+        was older than the time granularity when the cached binary image was
+        checked. After a successful hash check, the status of the intel hex
+        file and the check time are updated in the cached binary image.
+
+    Args:
+        buffer (mmap): Cached binary image
+        cache_file_name (str): Cache file name
+        file_name (str): File name of the intel hex file
+
+    Raises:
+        OSError: If the intel hex file can't be read.
+        struct.error: If the cached binary image is truncated.
+
+    Returns:
+        list: List of (start address, offset, length) tuples or None if invalid.
+    """
+    magic, cache_format, segment_count, file_size, file_mtime, check_time, file_digest = \
+        _CACHE_HEADER.unpack_from(buffer, 0)
+
+    if (magic != _CACHE_MAGIC) or (cache_format != _CACHE_FORMAT):
+        return None
+
+    file_stat = os.stat(file_name)
+
+    if file_stat.st_size != file_size:
+        return None
+
+    # A modification in the same time granularity step like the check can't
+    # be detected by the modification time.
+    is_unchanged = (file_stat.st_mtime_ns == file_mtime) and \
+                   ((check_time - file_mtime) > _MTIME_GRANULARITY_NS)
+
+    if is_unchanged is False:
+        if _get_file_digest(file_name) != file_digest:
+            return None
+
+        _update_cache_header(cache_file_name, segment_count, file_stat, file_digest)
+
+    segments = [_CACHE_SEGMENT.unpack_from(buffer, _CACHE_HEADER.size + idx * _CACHE_SEGMENT.size)
+                for idx in range(segment_count)]
+
+    for _, offset, length in segments:
+        if (offset + length) > len(buffer):
+            return None
+
+    return segments
+
+def _update_cache_header(cache_file_name, segment_count, file_stat, file_digest):
+    """Update the header of a cached binary image after a successful hash
+        check, so the next check doesn't need to hash the content again.
+        A failure is ignored, because the cache is only a optimization.
+
+    Args:
+        cache_file_name (str): Cache file name
+        segment_count (int): Number of segments
+        file_stat (os.stat_result): Status of the intel hex file
+        file_digest (bytes): SHA-256 of the intel hex file content
+    """
+    try:
+        with open(cache_file_name, "r+b") as file_descriptor:
+            file_descriptor.write(_pack_cache_header(segment_count, file_stat, file_digest))
+    except OSError:
+        pass
+
+def _load_cached_hex_file(cache_file_name, file_name):
+    """Load the cached binary image of a intel hex file by mapping it into memory.
+
+    Args:
+        cache_file_name (str): Cache file name
+        file_name (str): File name of the intel hex file
+
+    Returns:
+        BinaryImage: Binary image or None if not cached or invalid.
+    """
+    try:
+        with open(cache_file_name, "rb") as file_descriptor:
+            buffer = mmap.mmap(file_descriptor.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Not cached yet or empty, which is handled like not cached.
+        return None
+
+    try:
+        segments = _get_cached_segments(buffer, cache_file_name, file_name)
+    except (OSError, struct.error):
+        segments = None
+
+    if segments is None:
+        # Release the mapping, because the cached binary image will be replaced.
+        buffer.close()
+        return None
+
+    data = memoryview(buffer)
+
+    return BinaryImage([(start_addr, data[offset:offset + length]) \
+                        for start_addr, offset, length in segments])
+
+def _store_cached_hex_file(cache_file_name, binary_image, file_stat, file_digest):
+    """Store the binary image of a intel hex file in the cache. A failure is
+        ignored, because the cache is only a optimization.
+
+    Args:
+        cache_file_name (str): Cache file name
+        binary_image (BinaryImage): Binary image
+        file_stat (os.stat_result): Status of the intel hex file after it was read
+        file_digest (bytes): SHA-256 of the parsed intel hex file content
+    """
+    tmp_file_name = f"{cache_file_name}.{os.getpid()}.tmp"
+    segments = binary_image.segments()
+    offset = _CACHE_HEADER.size + len(segments) * _CACHE_SEGMENT.size
+
+    try:
+        os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+
+        with open(tmp_file_name, "wb") as file_descriptor:
+            file_descriptor.write(_pack_cache_header(len(segments), file_stat, file_digest))
+
+            for start_addr, end_addr in segments:
+                file_descriptor.write(_CACHE_SEGMENT.pack(start_addr, offset, end_addr - start_addr))
+                offset += end_addr - start_addr
+
+            for start_addr, end_addr in segments:
+                file_descriptor.write(binary_image.get_bytes(start_addr, end_addr - start_addr))
+
+        # Replace it atomically, because other processes may read it in parallel.
+        os.replace(tmp_file_name, cache_file_name)
+    except OSError:
+        pass
+
+def binary_image_load_hex_file(file_name, cache_dir=None):
+    """Load a intel hex file (.hex). All data records are merged into a sorted
+        list of contiguous segments.
+
+        If a cache directory is given, the parsed binary image is stored there
+        and later loads map it into memory instead of parsing the intel hex
+        file again. The cached binary image is invalid, if the size or the
+        content of the intel hex file changed.
+
+    Args:
+        file_name (str): File name of the intel hex file
+        cache_dir (str, optional): Cache directory. Defaults to None.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the file contains a invalid record.
+
+    Returns:
+        BinaryImage: Binary image
+    """
+    if cache_dir is None:
+        content, _ = _read_hex_file(file_name)
+        return _parse_hex_data(content)
+
+    cache_file_name = _get_cache_file_name(cache_dir, file_name)
+    binary_image = _load_cached_hex_file(cache_file_name, file_name)
+
+    if binary_image is None:
+        # The digest is calculated over the same content, which is parsed.
+        content, file_stat = _read_hex_file(file_name)
+        binary_image = _parse_hex_data(content)
+        _store_cached_hex_file(cache_file_name, binary_image, file_stat, \
+                               hashlib.sha256(content).digest())
+
+    return binary_image
+
+def binary_image_get_bytes(binary_data, addr, size):
+    """Get a contiguous range of bytes from the binary data.
+        Addresses without data are filled with padding.
+
+    Args:
+        binary_data (IntelHex|BinaryImage): Binary data
+        addr (int): Start address
+        size (int): Number of bytes
+
+    Returns:
+        memoryview|bytes: Binary data
+    """
+    if isinstance(binary_data, BinaryImage):
+        return binary_data.get_bytes(addr, size)
+
+    # Any other byte addressable object, e.g. IntelHex.
+    return bytes(binary_data[addr + offset] for offset in range(size))
+
+################################################################################
+# Main
+################################################################################
@@ -27,9 +27,19 @@ or from http://ross.net/crc/download/crc_v3.txt."""
 ################################################################################
 # Imports
 ################################################################################
+from collections import namedtuple
+from functools import partial
+import argparse
+import json
+import toml
 from pyHexDump.constants import Ret
-from pyHexDump.common import common_load_binary_file, common_print_value
-from pyHexDump.mem_access import mem_access_get_api_by_data_type
+from pyHexDump.common import common_load_binary_file, common_print_value, \
+    common_get_binary_files, common_process_binary_files, common_swap_words, \
+    common_get_cache_dir
+from pyHexDump.mem_access import mem_access_get_api_by_data_type, mem_access_get_decoder
+from pyHexDump.crc import crc_get_engine, crc_get_parameters, crc_get_preset_names
+from pyHexDump.digest import digest_calc, digest_get_names
+from pyHexDump.binary_image import binary_image_get_bytes
 
 ################################################################################
 # Variables
@@ -37,6 +47,55 @@ from pyHexDump.mem_access import mem_access_get_api_by_data_type
 
 _CMD_NAME = "checksum"
 
+# CRC parameters, if neither a preset nor the parameter itself is given:
+# polynomial, bit width, seed, reverse input, reverse output, final xor
+_DEFAULT_CRC_PARAMETERS = (0x04C11DB7, 32, 0, False, False, False)
+
+# Checksum range fields of the CRC parameters, in the order of _DEFAULT_CRC_PARAMETERS.
+_CRC_FIELDS = ["polynomial", "bit_width", "seed", "reverse_input", "reverse_output", "final_xor"]
+
+# A address range with the parameter set of its checksum.
+ChecksumRange = namedtuple("ChecksumRange", [
+    "name",
+    "start_address",
+    "end_address",
+    "binary_data_endianess",
+    "polynomial",
+    "bit_width",
+    "seed",
+    "reverse_input",
+    "reverse_output",
+    "final_xor",
+    "verify_address",
+    "verify_data_type",
+    "digests"
+])
+
+# Keys of a range in the range file, which are the same like the long CLI
+# options, and the corresponding checksum range fields.
+_RANGE_FILE_KEYS = {
+    "name": "name",
+    "saddr": "start_address",
+    "eaddr": "end_address",
+    "binaryDataEndianess": "binary_data_endianess",
+    "polynomial": "polynomial",
+    "bitWidth": "bit_width",
+    "seed": "seed",
+    "reverseIn": "reverse_input",
+    "reverseOut": "reverse_output",
+    "finalXOR": "final_xor",
+    "verifyAddr": "verify_address",
+    "verifyDataType": "verify_data_type",
+    "digest": "digests"
+}
+
+# Range file keys with integer values.
+_RANGE_FILE_INT_KEYS = ["saddr", "eaddr", "polynomial", "bitWidth", "seed", "finalXOR", \
+                        "verifyAddr"]
+
+# Data types of a stored checksum, which is verified.
+_VERIFY_DATA_TYPES = ["uint8", "uint16le", "uint16be", "uint32le", "uint32be", "uint64le", "uint64be"]
+
 ################################################################################
 # Classes
 ################################################################################
@@ -45,14 +104,44 @@ _CMD_NAME = "checksum"
 # Functions
 ################################################################################
 
-# pylint: disable=too-many-arguments, too-many-locals
+def _get_checksum_input(mem_access, is_little_endian, start_address, end_address):
+    """Get the bytes in the order they are fed into the checksum calculation.
+        The binary data is read word by word and every word is processed
+        MSB first, which means the bytes of little endian words are swapped.
+        A incomplete word at the end is read completely.
+
+    Args:
+        mem_access (MemAccess): Memory access API, which defines the word size.
+        is_little_endian (bool): True for little endian words, otherwise big endian.
+        start_address (int): Address where to start the calculation
+        end_address (int):  Address where to end the calculation (not included)
+
+    Returns:
+        bytes: Checksum input data
+    """
+    word_size = mem_access.get_size()
+    word_count = 0
+
+    if end_address > start_address:
+        word_count = (end_address - start_address + word_size - 1) // word_size
+
+    data = bytes(mem_access.get_bytes(start_address, word_count * word_size))
+
+    if is_little_endian is True:
+        data = common_swap_words(data, word_size)
+
+    return data
+
+# pylint: disable=too-many-arguments, too-many-locals, unbalanced-tuple-unpacking
 def calc_checksum(binary_data, binary_data_endianess, start_address, end_address,\
-    polynomial, bit_width, seed, reverse_input, reverse_output, final_xor):
+    polynomial=None, bit_width=None, seed=None, reverse_input=None, reverse_output=None, \
+    final_xor=None, preset=None, jobs=1):
     """Calcuate the checksum for the given address in the binary_data and the
-    given number of bytes.
+    given number of bytes. The CRC parameters, which are not given, are taken
+    from the preset.
 
     Args:
-        binary_data (IntelHex): Binary data
+        binary_data (IntelHex|BinaryImage): Binary data
         binary_data_endianess (str): Binary data endianess and data bit width, e.g. uint32le.
         start_address (int): Address where to start the calculation
         end_address (int):  Address where to end the calculation (not included)
@@ -63,60 +152,34 @@ def calc_checksum(binary_data, binary_data_endianess, start_address, end_address
         seed (int): Seed value for the CRC calculation
         reverse_input(bool): Reflect each single input byte if True
         reverse_output(bool): Reflect the final CRC value if True
-        final_xor(bool): Xor the final result with the value 0xff before returning the soulution
+        final_xor(bool|int): Xor the final result with all bits set if True or with the
+                             given value before returning the soulution
+        preset (str, optional): Name of the CRC preset, e.g. "CRC-32". Defaults to None.
+        jobs (int, optional): Number of parallel jobs for large address ranges,
+                              0 means one per CPU core. Defaults to 1.
+
+    Raises:
+        ValueError: If the preset is unknown or a CRC parameter is missing.
 
     Returns:
         checksum: Checksum
     """
-    mem_access = mem_access_get_api_by_data_type(binary_data_endianess)
-    mem_access.set_binary_data(binary_data)
-    offset = 0
-    count = (end_address - start_address) / mem_access.get_size()
+    mem_access = mem_access_get_api_by_data_type(binary_data_endianess, binary_data)
+    data = _get_checksum_input(mem_access, binary_data_endianess.endswith("le"), \
+                               start_address, end_address)
 
-    bit_width_mask = pow(2, bit_width) - 1
-    msb_mask = 1 << bit_width
-    crc = seed
-    word = 0
+    polynomial, bit_width, seed, reverse_input, reverse_output, final_xor = \
+        crc_get_parameters(preset, polynomial, bit_width, seed, reverse_input, reverse_output, \
+                           final_xor)
 
-    polynomial = (1 << bit_width) | polynomial
+    crc = crc_get_engine(polynomial, bit_width, seed, reverse_input, reverse_output, final_xor)
 
-    while count > 0:
-        count -= 1
-
-        word = mem_access.get_value(start_address + offset)
-
-        for idx in range(mem_access.get_size()):
-            # MSB first
-            byte = word >> (8 * (mem_access.get_size() - idx - 1)) & 0xFF
-
-            if reverse_input is True:
-                tmp = f"{byte:08b}"
-                byte = int(tmp[::-1], 2)
-
-            crc = crc ^ (byte << (bit_width - 8))
-
-            for _ in range(8):
-                crc = crc << 1
-
-                if (crc & msb_mask) != 0:
-                    crc = crc ^ polynomial
-
-        offset += mem_access.get_size()
-
-    crc &= bit_width_mask
-
-    if reverse_output is True:
-        tmp = f"{crc:0{bit_width}b}"
-        crc = int(tmp[::-1], 2)
-
-    if final_xor:
-        crc = crc ^ bit_width_mask
-
-    return crc
+    return crc.calc(data, jobs)
 
 # pylint: disable=too-many-arguments
 def _cmd_checksum(binary_file, binary_data_endianess, start_address, end_address, \
-    polynomial, bit_width, seed, reverse_input, reverse_output, final_xor):
+    polynomial, bit_width, seed, reverse_input, reverse_output, final_xor, jobs=1, \
+    cache_dir=None):
     """Print the checksum for the given address and the given number of bytes
     to the console.
 
@@ -133,17 +196,20 @@ def _cmd_checksum(binary_file, binary_data_endianess, start_address, end_address
         reverse_input(bool): Reflect each single input byte if True
         reverse_output(bool): Reflect the final CRC value if True
         final_xor(bool): Xor the final result with the value 0xff before returning the soulution
+        jobs (int, optional): Number of parallel jobs for the calculation. Defaults to 1.
+        cache_dir (str, optional): Cache directory for parsed intel hex files.
+            Defaults to None.
 
     Returns:
         Ret: If successful it will return OK, otherwise a corresponding error code.
     """
-    ret_status, intel_hex = common_load_binary_file(binary_file)
+    ret_status, intel_hex = common_load_binary_file(binary_file, cache_dir)
 
     if ret_status == Ret.OK:
         checksum = calc_checksum(intel_hex, binary_data_endianess,
                                  start_address, end_address, polynomial, \
                                  bit_width, seed, reverse_input, \
-                                 reverse_output, final_xor)
+                                 reverse_output, final_xor, jobs=jobs)
 
         value_width = bit_width // 4
         value_format = "{:0" + str(value_width) + "X}"
@@ -151,6 +217,369 @@ def _cmd_checksum(binary_file, binary_data_endianess, start_address, end_address
 
     return ret_status
 
+def calc_checksums(binary_data, checksum_ranges, jobs=1):
+    """Calculate the checksums of several address ranges in the binary data.
+        The ranges are processed in the order of their addresses.
+
+    Args:
+        binary_data (IntelHex|BinaryImage): Binary data
+        checksum_ranges (list): Checksum ranges
+        jobs (int, optional): Number of parallel jobs per checksum. Defaults to 1.
+
+    Returns:
+        list: List of (checksum range, checksum) tuples, sorted by address.
+    """
+    results = []
+
+    for checksum_range in sorted(checksum_ranges, \
+                                 key=lambda item: (item.start_address, item.end_address)):
+        checksum = calc_checksum(binary_data, checksum_range.binary_data_endianess,
+                                 checksum_range.start_address, checksum_range.end_address,
+                                 checksum_range.polynomial, checksum_range.bit_width,
+                                 checksum_range.seed, checksum_range.reverse_input,
+                                 checksum_range.reverse_output, checksum_range.final_xor,
+                                 jobs=jobs)
+
+        results.append((checksum_range, checksum))
+
+    return results
+
+def verify_checksums(binary_data, checksum_ranges, jobs=1):
+    """Calculate the checksums of several address ranges in the binary data
+        and read the expected checksums, which are stored in the binary data.
+
+    Args:
+        binary_data (IntelHex|BinaryImage): Binary data
+        checksum_ranges (list): Checksum ranges
+        jobs (int, optional): Number of parallel jobs per checksum. Defaults to 1.
+
+    Returns:
+        list: List of (checksum range, checksum, expected checksum) tuples, sorted by address.
+            The expected checksum is None, if the range has no verify address.
+    """
+    results = []
+
+    for checksum_range, checksum in calc_checksums(binary_data, checksum_ranges, jobs):
+        expected = None
+
+        if checksum_range.verify_address is not None:
+            decoder = mem_access_get_decoder(checksum_range.verify_data_type)
+            expected = decoder.decode(binary_data, checksum_range.verify_address)
+
+        results.append((checksum_range, checksum, expected))
+
+    return results
+
+def calc_digests(binary_data, names, start_address, end_address):
+    """Calculate several digests over a address range of the binary data
+        in a single pass. The data is used in the order it is stored.
+
+    Args:
+        binary_data (IntelHex|BinaryImage): Binary data
+        names (list): Digest names, e.g. "sha256".
+        start_address (int): Address where to start the calculation
+        end_address (int):  Address where to end the calculation (not included)
+
+    Raises:
+        ValueError: If a digest is unknown.
+
+    Returns:
+        dict: Hex string of every digest by its name
+    """
+    digests = {}
+
+    if len(names) > 0:
+        data = binary_image_get_bytes(binary_data, start_address, \
+                                      max(end_address - start_address, 0))
+        digests = digest_calc(data, names)
+
+    return digests
+
+def _get_range_name(checksum_range):
+    """Get the name of a checksum range. Without name, the address range is used.
+
+    Args:
+        checksum_range (ChecksumRange): Checksum range
+
+    Returns:
+        str: Name
+    """
+    name = checksum_range.name
+
+    if name is None:
+        name = f"{checksum_range.start_address:08X}-{checksum_range.end_address:08X}"
+
+    return name
+
+def _get_verify_result(checksum, expected):
+    """Get the verification result of a checksum.
+
+    Args:
+        checksum (int): Calculated checksum
+        expected (int): Expected checksum or None if not verified.
+
+    Returns:
+        str: "OK", "FAILED" or "-" if not verified.
+    """
+    result = "-"
+
+    if expected is not None:
+        result = "OK" if checksum == expected else "FAILED"
+
+    return result
+
+def _print_checksums_json(results):
+    """Print the checksums of several address ranges in JSON format.
+
+    Args:
+        results (list): List of (checksum range, checksum, expected checksum, digests) tuples
+    """
+    items = []
+
+    for checksum_range, checksum, expected, digests in results:
+        item = {
+            "name": _get_range_name(checksum_range),
+            "saddr": checksum_range.start_address,
+            "eaddr": checksum_range.end_address,
+            "checksum": checksum
+        }
+
+        if expected is not None:
+            item["expected"] = expected
+            item["valid"] = checksum == expected
+
+        if len(digests) > 0:
+            item["digests"] = digests
+
+        items.append(item)
+
+    print(json.dumps(items, indent=4))
+
+def _print_checksums_table(results):
+    """Print the checksums of several address ranges as table. The digests
+        of a range are printed below it, one per line.
+
+    Args:
+        results (list): List of (checksum range, checksum, expected checksum, digests) tuples
+    """
+    is_verified = any(result[2] is not None for result in results)
+    name_width = max([len("Name")] + [len(_get_range_name(result[0])) for result in results])
+    value_width = max([len("Checksum")] + [(result[0].bit_width + 3) // 4 for result in results])
+    header = f"{'Name':<{name_width}} {'Start':<8} {'End':<8} Checksum"
+
+    if is_verified is True:
+        header = f"{header:<{name_width + 18 + value_width}} {'Expected':<{value_width}} Result"
+
+    print(header)
+
+    for checksum_range, checksum, expected, digests in results:
+        digits = (checksum_range.bit_width + 3) // 4
+        line = f"{_get_range_name(checksum_range):<{name_width}} " \
+               f"{checksum_range.start_address:08X} " \
+               f"{checksum_range.end_address:08X} " \
+               f"{checksum:0{digits}X}"
+
+        if is_verified is True:
+            expected_str = "-" if expected is None else f"{expected:0{digits}X}"
+            line = f"{line:<{name_width + 18 + value_width}} " \
+                   f"{expected_str:<{value_width}} " \
+                   f"{_get_verify_result(checksum, expected)}"
+
+        print(line)
+
+        for name, value in digests.items():
+            print(f"{'':<{name_width}} {name}: {value}")
+
+def _print_checksums(results, output_format):
+    """Print the checksums of several address ranges. If any checksum is
+        verified, the expected checksum and the result are printed too.
+
+    Args:
+        results (list): List of (checksum range, checksum, expected checksum, digests) tuples
+        output_format (str): "table" or "json"
+    """
+    if output_format == "json":
+        _print_checksums_json(results)
+    else:
+        _print_checksums_table(results)
+
+def _cmd_checksum_ranges(binary_file, checksum_ranges, output_format, jobs=1, cache_dir=None):
+    """Print the checksums of several address ranges to the console.
+        The binary file is loaded only once for all of them.
+
+    Args:
+        binary_file (str): File name of the binary file
+        checksum_ranges (list): Checksum ranges
+        output_format (str): "table" or "json"
+        jobs (int, optional): Number of parallel jobs per checksum. Defaults to 1.
+        cache_dir (str, optional): Cache directory for parsed intel hex files.
+            Defaults to None.
+
+    Returns:
+        Ret: If successful it will return OK, otherwise a corresponding error code.
+            If a verified checksum doesn't match, Ret.ERROR_CHECKSUM_MISMATCH is returned.
+    """
+    ret_status, binary_data = common_load_binary_file(binary_file, cache_dir)
+
+    if ret_status == Ret.OK:
+        results = [(checksum_range, checksum, expected, \
+                    calc_digests(binary_data, checksum_range.digests, \
+                                 checksum_range.start_address, checksum_range.end_address)) \
+                   for checksum_range, checksum, expected \
+                   in verify_checksums(binary_data, checksum_ranges, jobs)]
+
+        _print_checksums(results, output_format)
+
+        if any(_get_verify_result(checksum, expected) == "FAILED" \
+               for _, checksum, expected, _ in results):
+            ret_status = Ret.ERROR_CHECKSUM_MISMATCH
+
+    return ret_status
+
+def _get_range_fields(idx, item):
+    """Get the checksum range fields of a single range in the range file.
+
+    Args:
+        idx (int): Index of the range in the range file
+        item (dict): Range from the range file
+
+    Raises:
+        ValueError: If a key or value is invalid.
+
+    Returns:
+        dict: Checksum range fields
+    """
+    fields = {}
+
+    # The preset overrides the CRC parameters of the CLI options.
+    if "preset" in item:
+        fields.update(zip(_CRC_FIELDS, crc_get_parameters(item["preset"])))
+
+    for key, value in item.items():
+        if key == "preset":
+            continue
+
+        if key not in _RANGE_FILE_KEYS:
+            raise ValueError(f"Unknown key \"{key}\" in {idx + 1}. range.")
+
+        if (key in _RANGE_FILE_INT_KEYS) and isinstance(value, str):
+            value = int(value, 0)
+
+        # A single digest or a list of digests.
+        if key == "digest":
+            value = tuple(name.lower() for name in ([value] if isinstance(value, str) else value))
+
+        fields[_RANGE_FILE_KEYS[key]] = value
+
+    return fields
+
+def _load_range_file(file_name, default_range):
+    """Load the checksum ranges from a JSON or TOML (.toml) file. It contains
+        a list of ranges, each with the keys of the long CLI options, e.g.
+
+        {
+            "ranges": [{
+                "name": "UCB00_BMHD",
+                "saddr": "0xAF400000",
+                "eaddr": "0xAF400008",
+                "binaryDataEndianess": "uint32le",
+                "preset": "CRC-32",
+                "verifyAddr": "0xAF400008",
+                "digest": ["sha256"]
+            }]
+        }
+
+        The parameters which are not given by a range are taken from the
+        default range, which contains the CRC parameters of the CLI options.
+
+    Args:
+        file_name (str): File name of the range file
+        default_range (ChecksumRange): Default parameters
+
+    Returns:
+        Ret, list: Status information and checksum ranges
+    """
+    ret_status = Ret.OK
+    checksum_ranges = []
+
+    try:
+        with open(file_name, encoding="utf-8") as file_descriptor:
+            if file_name.endswith(".toml"):
+                range_dict = toml.load(file_descriptor)
+            else:
+                range_dict = json.load(file_descriptor)
+
+        for idx, item in enumerate(range_dict.get("ranges", [])):
+            checksum_range = default_range._replace(**_get_range_fields(idx, item))
+
+            if (checksum_range.start_address is None) or (checksum_range.end_address is None):
+                raise ValueError(f"\"saddr\" or \"eaddr\" is missing in {idx + 1}. range.")
+
+            if any(name not in digest_get_names() for name in checksum_range.digests):
+                raise ValueError(f"Unknown \"digest\" in {idx + 1}. range.")
+
+            if checksum_range.verify_data_type not in _VERIFY_DATA_TYPES:
+                raise ValueError(f"Invalid \"verifyDataType\" in {idx + 1}. range.")
+
+            checksum_ranges.append(checksum_range)
+
+    except FileNotFoundError:
+        ret_status = Ret.ERROR_CONFIG_FILE_NOT_FOUND
+
+    except (ValueError, TypeError, AttributeError, toml.TomlDecodeError) as error:
+        print(f"Error: Invalid range file {file_name}: {error}")
+        ret_status = Ret.ERROR
+
+    return ret_status, checksum_ranges
+
+def _parse_range(value):
+    """Parse a address range in the format SADDR:EADDR from the CLI.
+
+    Args:
+        value (str): Address range
+
+    Raises:
+        argparse.ArgumentTypeError: If the format is invalid.
+
+    Returns:
+        tuple: Start and end address
+    """
+    try:
+        start_address, end_address = [int(address, 0) for address in value.split(":")]
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"Invalid address range {value}, " \
+                                         "expected SADDR:EADDR.") from error
+
+    return start_address, end_address
+
+def _get_crc_parameters(args):
+    """Get the CRC parameters from the program arguments. The parameters,
+        which are not given, are taken from the preset or are the default ones.
+
+    Args:
+        args (obj): Program arguments
+
+    Returns:
+        tuple: polynomial, bit width, seed, reverse input, reverse output and final xor
+    """
+    preset = getattr(args, "preset", None)
+    final_xor = args.finalXOR
+
+    # A final xor value overrides the final xor with all bits set.
+    if getattr(args, "finalXORValue", None) is not None:
+        final_xor = args.finalXORValue
+
+    crc_parameters = [args.polynomial, args.bitWidth, args.seed, args.reverseIn, \
+                      args.reverseOut, final_xor]
+
+    if preset is None:
+        crc_parameters = [default if value is None else value \
+                          for value, default in zip(crc_parameters, _DEFAULT_CRC_PARAMETERS)]
+    else:
+        crc_parameters = crc_get_parameters(preset, *crc_parameters)
+
+    return tuple(crc_parameters)
+
 def _exec(args):
     """Determine the required parameters from the program arguments and execute the command.
 
@@ -160,12 +589,90 @@ def _exec(args):
     Returns:
         Ret: If successful, it will return Ret.OK otherwise a corresponding error.
     """
-    return _cmd_checksum(args.binaryFile[0], \
-                         args.binaryDataEndianess, \
-                         args.saddr, args.eaddr,\
-                         args.polynomial, args.bitWidth, \
-                         args.seed, args.reverseIn, \
-                         args.reverseOut, args.finalXOR)
+    # Batch processing is optional
+    manifest_file = getattr(args, "manifestFile", None)
+    output = getattr(args, "output", None)
+    jobs = getattr(args, "jobs", 1)
+
+    # Cache is optional
+    cache_dir = common_get_cache_dir(args)
+
+    # Multiple ranges are optional
+    range_file = getattr(args, "rangeFile", None)
+    ranges = getattr(args, "range", None)
+    output_format = getattr(args, "outputFormat", None)
+    checksum_ranges = []
+
+    # The CLI options are the parameters of all ranges, which don't define them.
+    default_range = ChecksumRange(None, args.saddr, args.eaddr, args.binaryDataEndianess,
+                                  *_get_crc_parameters(args),
+                                  getattr(args, "verifyAddr", None),
+                                  getattr(args, "verifyDataType", "uint32le"),
+                                  tuple(getattr(args, "digest", None) or ()))
+
+    # The addresses belong only to the range given by the CLI options.
+    parameter_range = default_range._replace(start_address=None, end_address=None,
+                                             verify_address=None)
+
+    ret_status, binary_files = common_get_binary_files(args.binaryFile, manifest_file)
+
+    # A single binary file uses the jobs to calculate every checksum in parallel instead.
+    crc_jobs = 1
+    if len(binary_files) == 1:
+        crc_jobs = jobs
+        jobs = 1
+
+    if (ret_status == Ret.OK) and (range_file is not None):
+        ret_status, checksum_ranges = _load_range_file(range_file, parameter_range)
+
+    if ret_status != Ret.OK:
+        return ret_status
+
+    if ranges is not None:
+        for start_address, end_address in ranges:
+            checksum_ranges.append(parameter_range._replace(start_address=start_address,
+                                                            end_address=end_address))
+
+    # A single range, given by start and end address, is printed as plain checksum.
+    if (len(checksum_ranges) == 0) and (output_format is None) and \
+         (default_range.verify_address is None) and (len(default_range.digests) == 0):
+
+        if (args.saddr is None) or (args.eaddr is None):
+            print("Error: No address range given, use --saddr and --eaddr, --range or --rangeFile.")
+            ret_status = Ret.ERROR
+        else:
+            ret_status = common_process_binary_files(binary_files, output, \
+                partial(_cmd_checksum,
+                        binary_data_endianess=default_range.binary_data_endianess,
+                        start_address=default_range.start_address,
+                        end_address=default_range.end_address,
+                        polynomial=default_range.polynomial,
+                        bit_width=default_range.bit_width,
+                        seed=default_range.seed,
+                        reverse_input=default_range.reverse_input,
+                        reverse_output=default_range.reverse_output,
+                        final_xor=default_range.final_xor,
+                        jobs=crc_jobs,
+                        cache_dir=cache_dir), \
+                jobs)
+
+    else:
+        # The start and end address of the CLI options are a range too.
+        if (args.saddr is not None) and (args.eaddr is not None):
+            checksum_ranges.append(default_range)
+
+        if output_format is None:
+            output_format = "table"
+
+        ret_status = common_process_binary_files(binary_files, output, \
+            partial(_cmd_checksum_ranges,
+                    checksum_ranges=checksum_ranges,
+                    output_format=output_format,
+                    jobs=crc_jobs,
+                    cache_dir=cache_dir), \
+            jobs)
+
+    return ret_status
 
 def cmd_register(arg_sub_parsers):
     """Register the command specific CLI argument parser and get command
@@ -190,8 +697,8 @@ def cmd_register(arg_sub_parsers):
         "binaryFile",
         metavar="BINARY_FILE",
         type=str,
-        nargs=1,
-        help="Binary file in intel hex format (.hex) or binary (.bin)."
+        nargs="*",
+        help="Binary files in intel hex format (.hex) or binary (.bin). Glob patterns are supported."
     )
     parser.add_argument(
         "-bde",
@@ -208,7 +715,8 @@ def cmd_register(arg_sub_parsers):
         "--saddr",
         metavar="SADDR",
         type=lambda x: int(x, 0), # Support "0x" notation
-        required=True,
+        required=False,
+        default=None,
         help="The calculation starts at this address."
     )
     parser.add_argument(
@@ -216,7 +724,8 @@ def cmd_register(arg_sub_parsers):
         "--eaddr",
         metavar="EADDR",
         type=lambda x: int(x, 0), # Support "0x" notation
-        required=True,
+        required=False,
+        default=None,
         help="The calculation ends at this address. (not included)"
     )
     parser.add_argument(
@@ -225,9 +734,9 @@ def cmd_register(arg_sub_parsers):
         metavar="POLYNOMIAL",
         type=lambda x: int(x, 0), # Support "0x" notation
         required=False,
-        default=0x04C11DB7,
+        default=None,
         help="The polynomial for the CRC calculation.\n" \
-            "(default: 0x%(default)x)"
+            "(default: 0x4c11db7)"
     )
     parser.add_argument(
         "-bw",
@@ -235,9 +744,9 @@ def cmd_register(arg_sub_parsers):
         metavar="BIT_WIDTH",
         type=lambda x: int(x, 0), # Support "0x" notation
         required=False,
-        default=32,
+        default=None,
         help="The bit width of the CRC calculation.\n" \
-            "(default: %(default)s)"
+            "(default: 32)"
     )
     parser.add_argument(
         "-s",
@@ -245,35 +754,193 @@ def cmd_register(arg_sub_parsers):
         metavar="SEED",
         type=lambda x: int(x, 0), # Support "0x" notation
         required=False,
-        default=0,
+        default=None,
         help="The seed value for the CRC calculation.\n" \
-            "(default: %(default)d)"
+            "(default: 0)"
     )
     parser.add_argument(
         "-ri",
         "--reverseIn",
         action="store_true",
         required=False,
-        default=False,
+        default=None,
         help="Use reverse input.\n" \
-            "(default: %(default)s)"
+            "(default: False)"
     )
     parser.add_argument(
         "-ro",
         "--reverseOut",
         action="store_true",
         required=False,
-        default=False,
+        default=None,
         help="Use reverse output.\n" \
-            "(default: %(default)s)"
+            "(default: False)"
     )
     parser.add_argument(
         "-fx",
         "--finalXOR",
         action="store_true",
         required=False,
-        default=False,
+        default=None,
         help="Use a final XOR with all bits 1.\n" \
+            "(default: False)"
+    )
+    parser.add_argument(
+        "-nri",
+        "--noReverseIn",
+        dest="reverseIn",
+        action="store_false",
+        required=False,
+        default=None,
+        help="Don't use reverse input, e.g. to override the preset."
+    )
+    parser.add_argument(
+        "-nro",
+        "--noReverseOut",
+        dest="reverseOut",
+        action="store_false",
+        required=False,
+        default=None,
+        help="Don't use reverse output, e.g. to override the preset."
+    )
+    parser.add_argument(
+        "-nfx",
+        "--noFinalXOR",
+        dest="finalXOR",
+        action="store_false",
+        required=False,
+        default=None,
+        help="Don't use a final XOR, e.g. to override the preset."
+    )
+    parser.add_argument(
+        "-fxv",
+        "--finalXORValue",
+        metavar="FINAL_XOR_VALUE",
+        type=lambda x: int(x, 0), # Support "0x" notation
+        required=False,
+        default=None,
+        help="Use a final XOR with this value instead of all bits 1."
+    )
+    parser.add_argument(
+        "-ps",
+        "--preset",
+        metavar="PRESET",
+        type=str.upper,
+        choices=crc_get_preset_names(),
+        required=False,
+        default=None,
+        help="Name of the CRC preset, which defines all CRC parameters not given " \
+            "explicitly: " + ", ".join(crc_get_preset_names())
+    )
+    parser.add_argument(
+        "-va",
+        "--verifyAddr",
+        metavar="VERIFY_ADDR",
+        type=lambda x: int(x, 0), # Support "0x" notation
+        required=False,
+        default=None,
+        help="Address of the stored checksum, which to verify. " \
+            "A mismatch results in a error exit code."
+    )
+    parser.add_argument(
+        "-vdt",
+        "--verifyDataType",
+        metavar="VERIFY_DATA_TYPE",
+        choices=_VERIFY_DATA_TYPES,
+        required=False,
+        default="uint32le",
+        help="Data type of the stored checksum. (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-d",
+        "--digest",
+        metavar="DIGEST",
+        type=str.lower,
+        choices=digest_get_names(),
+        action="append",
+        required=False,
+        help="Digest, which to calculate additionally over the address range, " \
+            "e.g. sha256. Can be applied several times: " + ", ".join(digest_get_names())
+    )
+    parser.add_argument(
+        "-r",
+        "--range",
+        metavar="SADDR:EADDR",
+        type=_parse_range,
+        action="append",
+        required=False,
+        help="Address range, which to calculate with the CRC parameters of the CLI. " \
+            "Can be applied several times."
+    )
+    parser.add_argument(
+        "-rf",
+        "--rangeFile",
+        metavar="RANGE_FILE",
+        type=str,
+        required=False,
+        default=None,
+        help="File in JSON or TOML (.toml) format with a list of address ranges, " \
+            "each with its own CRC parameters."
+    )
+    parser.add_argument(
+        "-of",
+        "--outputFormat",
+        metavar="OUTPUT_FORMAT",
+        choices=["table", "json"],
+        required=False,
+        default=None,
+        help="Output format of the checksums (table, json). " \
+            "Without, a single range is printed as plain checksum, otherwise as table."
+    )
+    parser.add_argument(
+        "-mf",
+        "--manifestFile",
+        metavar="MANIFEST_FILE",
+        type=str,
+        required=False,
+        default=None,
+        help="File with one binary file per line, which are processed in addition."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="OUTPUT",
+        type=str,
+        required=False,
+        default=None,
+        help="Write the result to this file instead of stdout. It may contain the " \
+            "placeholders {name}, {stem} and {index} to get one file per binary file."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="JOBS",
+        type=int,
+        required=False,
+        default=1,
+        help="Number of binary files which are processed in parallel, 0 means one per CPU core. " \
+            "A single binary file uses them to calculate large checksums in parallel.\n" \
+            "(default: %(default)s)"
+    )
+
+    parser.add_argument(
+        "-cd",
+        "--cacheDir",
+        metavar="CACHE_DIR",
+        type=str,
+        required=False,
+        default=None,
+        help="Directory where to cache the parsed intel hex files.\n" \
+            "(default: PYHEXDUMP_CACHE_DIR environment variable, otherwise no cache)"
+    )
+
+    parser.add_argument(
+        "-nc",
+        "--noCache",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Don't cache the parsed intel hex files on disk.\n" \
             "(default: %(default)s)"
     )
 
@@ -25,8 +25,12 @@
 ################################################################################
 # Imports
 ################################################################################
+from functools import partial
+import sys
 from pyHexDump.constants import Ret
-from pyHexDump.common import common_load_binary_file, common_dump_intel_hex
+from pyHexDump.common import common_load_binary_file, common_dump_intel_hex, \
+    common_get_binary_files, common_process_binary_files, common_dump_stream, \
+    common_get_cache_dir
 from pyHexDump.mem_access import mem_access_get_api_by_data_type
 
 ################################################################################
@@ -35,6 +39,9 @@ from pyHexDump.mem_access import mem_access_get_api_by_data_type
 
 _CMD_NAME = "dump"
 
+# Binary file name, which means to read from stdin.
+_STDIN_FILE_NAME = "-"
+
 ################################################################################
 # Classes
 ################################################################################
@@ -43,25 +50,82 @@ _CMD_NAME = "dump"
 # Functions
 ################################################################################
 
-def _cmd_dump(binary_file, addr, count, data_type):
+def _cmd_dump_stream(binary_file, addr, count, data_type, squeeze):
+    """Dump a raw binary file or stdin to the console, while it is read.
+
+    Args:
+        binary_file (str): File name of the binary file or "-" for stdin.
+        addr (int): Address where to start the dump
+        count (int): Number of elements which to dump, 0 means until the end.
+        data_type (str): Data type of a element (uint8, uint16le, uint16be, uint32le, uint32be)
+        squeeze (bool): Print a single * instead of lines with the same data like the previous line.
+
+    Returns:
+        Ret: If successful it will return OK, otherwise a corresponding error code.
+    """
+    ret_status = Ret.OK
+    mem_access = mem_access_get_api_by_data_type(data_type)
+
+    if binary_file == _STDIN_FILE_NAME:
+        ret_status = common_dump_stream(mem_access, sys.stdin.buffer, addr, count, \
+                                        squeeze=squeeze)
+    else:
+        try:
+            with open(binary_file, "rb") as file_descriptor:
+                ret_status = common_dump_stream(mem_access, file_descriptor, addr, count, \
+                                                squeeze=squeeze)
+        except FileNotFoundError:
+            ret_status = Ret.ERROR_INPUT_FILE_NOT_FOUND
+
+    if ret_status == Ret.OK:
+        print("")
+
+    return ret_status
+
+# pylint: disable=too-many-arguments
+def _cmd_dump(binary_file, addr, count, data_type, is_stream=False, skip_gaps=False, \
+    squeeze=False, cache_dir=None):
     """Dump binary file to the console at the given address. It will contain a
         number of elements (count) depended on the data type (data_type).
 
     Args:
-        binary_file (str): File name of the binary file
+        binary_file (str): File name of the binary file or "-" for stdin.
         addr (int): Address where to start the dump
-        count (int): Number of elements which to dump
+        count (int): Number of elements which to dump, 0 means until the end of the data.
         data_type (str): Data type of a element (uint8, uint16le, uint16be, uint32le, uint32be)
+        is_stream (bool, optional): Dump raw binary data while it is read.
+            Intel hex files are always loaded completely. Defaults to False.
+        skip_gaps (bool, optional): Skip the lines without data and mark the
+            gap instead. Not applied for streaming. Defaults to False.
+        squeeze (bool, optional): Print a single * instead of lines with the
+            same data like the previous line. Defaults to False.
+        cache_dir (str, optional): Cache directory for parsed intel hex files.
+            Defaults to None.
 
     Returns:
         Ret: If successful it will return OK, otherwise a corresponding error code.
     """
-    ret_status, intel_hex = common_load_binary_file(binary_file)
+    # Stdin can only be streamed.
+    if (binary_file == _STDIN_FILE_NAME) or \
+       ((is_stream is True) and (binary_file.endswith(".hex") is False)):
+        return _cmd_dump_stream(binary_file, addr, count, data_type, squeeze)
+
+    ret_status, intel_hex = common_load_binary_file(binary_file, cache_dir)
 
     if ret_status == Ret.OK:
-        mem_access = mem_access_get_api_by_data_type(data_type)
-        mem_access.set_binary_data(intel_hex)
-        ret_status = common_dump_intel_hex(mem_access, addr, count)
+        mem_access = mem_access_get_api_by_data_type(data_type, intel_hex)
+
+        # Dump until the end of the data?
+        if (count == 0) and (intel_hex.maxaddr() is not None):
+            count = max(0, intel_hex.maxaddr() + 1 - addr)
+            count = (count + mem_access.get_size() - 1) // mem_access.get_size()
+
+        segments = None
+        if skip_gaps is True:
+            segments = intel_hex.segments()
+
+        ret_status = common_dump_intel_hex(mem_access, addr, count, \
+                                           segments=segments, squeeze=squeeze)
         print("")
 
     return ret_status
@@ -75,7 +139,21 @@ def _exec(args):
     Returns:
         Ret: If successful, it will return Ret.OK otherwise a corresponding error.
     """
-    return _cmd_dump(args.binaryFile[0], args.addr, args.count, args.dataType)
+    # Batch processing is optional
+    manifest_file = getattr(args, "manifestFile", None)
+    output = getattr(args, "output", None)
+
+    ret_status, binary_files = common_get_binary_files(args.binaryFile, manifest_file)
+
+    if ret_status == Ret.OK:
+        ret_status = common_process_binary_files(binary_files, output, \
+            partial(_cmd_dump, addr=args.addr, count=args.count, data_type=args.dataType, \
+                    is_stream=getattr(args, "stream", False),
+                    skip_gaps=getattr(args, "skipGaps", False),
+                    squeeze=getattr(args, "squeeze", False),
+                    cache_dir=common_get_cache_dir(args)))
+
+    return ret_status
 
 def cmd_register(arg_sub_parsers):
     """Register the command specific CLI argument parser and get command
@@ -100,8 +178,9 @@ def cmd_register(arg_sub_parsers):
         "binaryFile",
         metavar="BINARY_FILE",
         type=str,
-        nargs=1,
-        help="Binary file in intel hex format (.hex) or binary (.bin)."
+        nargs="*",
+        help="Binary files in intel hex format (.hex) or binary (.bin). Glob patterns are supported.\n" \
+            "Use - to read binary data from stdin."
     )
     parser.add_argument(
         "-a",
@@ -120,7 +199,7 @@ def cmd_register(arg_sub_parsers):
         type=lambda x: int(x, 0), # Support "0x" notation
         required=False,
         default=64,
-        help="The number of elements (choosen by datatype) in the dump.\n" \
+        help="The number of elements (choosen by datatype) in the dump, 0 dumps until the end.\n" \
             "(default: %(default)d)"
     )
     parser.add_argument(
@@ -134,6 +213,74 @@ def cmd_register(arg_sub_parsers):
         help="The type of a single data element.\n" \
             "(default: %(default)s)"
     )
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Dump binary files (.bin) while they are read, which needs less memory " \
+            "and shows the first lines immediately.\n" \
+            "(default: %(default)s)"
+    )
+    parser.add_argument(
+        "-sg",
+        "--skipGaps",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Skip the lines without data and print a single gap line instead.\n" \
+            "(default: %(default)s)"
+    )
+    parser.add_argument(
+        "-sq",
+        "--squeeze",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Print a single * instead of lines with the same data like the previous line.\n" \
+            "(default: %(default)s)"
+    )
+    parser.add_argument(
+        "-mf",
+        "--manifestFile",
+        metavar="MANIFEST_FILE",
+        type=str,
+        required=False,
+        default=None,
+        help="File with one binary file per line, which are processed in addition."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="OUTPUT",
+        type=str,
+        required=False,
+        default=None,
+        help="Write the result to this file instead of stdout. It may contain the " \
+            "placeholders {name}, {stem} and {index} to get one file per binary file."
+    )
+
+    parser.add_argument(
+        "-cd",
+        "--cacheDir",
+        metavar="CACHE_DIR",
+        type=str,
+        required=False,
+        default=None,
+        help="Directory where to cache the parsed intel hex files.\n" \
+            "(default: PYHEXDUMP_CACHE_DIR environment variable, otherwise no cache)"
+    )
+
+    parser.add_argument(
+        "-nc",
+        "--noCache",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Don't cache the parsed intel hex files on disk.\n" \
+            "(default: %(default)s)"
+    )
 
     return cmd_par_dict
 
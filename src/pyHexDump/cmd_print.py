@@ -30,16 +30,20 @@
 ################################################################################
 # Imports
 ################################################################################
-from mako.template import Template
+from functools import partial
 from mako.exceptions import SyntaxException, RichTraceback
 from pyHexDump.constants import Ret
 from pyHexDump.common import \
     common_load_binary_file, \
-    common_load_template_file
-from pyHexDump.macros import get_macro_dict, set_binary_data
+    common_load_template_file, \
+    common_get_cache_dir, \
+    common_get_binary_files, \
+    common_process_binary_files
+from pyHexDump.macros import get_macro_dict, set_binary_data, get_macro_cache_statistics
 from pyHexDump.bunch import dict_to_bunch
-from pyHexDump.config_model import ConfigModel
+from pyHexDump.layout_plan import layout_plan_load
 from pyHexDump.tmpl_model import TmplModel
+from pyHexDump.tmpl_cache import tmpl_cache_get_template
 
 ################################################################################
 # Variables
@@ -48,6 +52,9 @@ from pyHexDump.tmpl_model import TmplModel
 _CMD_NAME = "print"
 _IS_VERBOSE = False
 
+# Errors in the template, which are reported to the user.
+_TEMPLATE_ERRORS = (ValueError, NameError, TypeError, AttributeError, SyntaxException)
+
 ################################################################################
 # Classes
 ################################################################################
@@ -87,12 +94,62 @@ def _print_config_elements(tmpl_element_dict, show_only_in_hex, namespace=""):
 
     return ret_status
 
-def _print_template(tmpl_model, template, constants): # pylint: disable=too-many-locals
+def _handle_template_error(error):
+    """Print the relevant information about a error in the template.
+
+    Args:
+        error (Exception): Error raised during compiling or rendering the template.
+
+    Returns:
+        Ret: Always Ret.ERROR_TEMPLATE
+    """
+    print(f"{type(error).__name__} in template:\n")
+
+    if isinstance(error, (ValueError, NameError)):
+        print(error)
+    else:
+        # Show only relevant part of trace
+        traceback = RichTraceback()
+        show = False
+        for (filename, lineno, function, line) in traceback.traceback:
+            if show is False and function == "render_body":
+                show = True
+
+            if show is True:
+                print(f"File {filename}, line {lineno}, in {function}")
+                print(line, "\n")
+                print(f"{str(traceback.error.__class__.__name__)}: {traceback}")
+
+    return Ret.ERROR_TEMPLATE
+
+def _compile_template(template, cache_dir):
+    """Compile the template. The result is cached, so it is done only once
+        per process, even if several binary files are printed with it.
+        With a cache directory, it is even reused across program runs.
+
+    Args:
+        template (str): The template content
+        cache_dir (str): Cache directory or None
+
+    Returns:
+        Ret, Template: Status information and the compiled template
+    """
+    ret_status = Ret.OK
+    tmpl = None
+
+    try:
+        tmpl = tmpl_cache_get_template(template, cache_dir)
+    except _TEMPLATE_ERRORS as error:
+        ret_status = _handle_template_error(error)
+
+    return ret_status, tmpl
+
+def _print_template(tmpl_model, tmpl, constants):
     """Print a generated report from template and configuration element dictionary.
 
     Args:
         tmpl_model (obj): The template element model
-        template (str): The template content
+        tmpl (Template): The compiled template
         constants (dict): Dictionary of constants to be used in the template.
 
     Returns:
@@ -123,27 +180,13 @@ def _print_template(tmpl_model, template, constants): # pylint: disable=too-many
     tmpl_element_bunch = dict_to_bunch(tmpl_element_dict)
 
     try:
-        tmpl = Template(template, strict_undefined=True)
         print(tmpl.render(**tmpl_element_bunch))
-    except (ValueError, NameError) as error:
-        print(f"{type(error).__name__} in template:\n")
-        print(error)
-        ret_status = Ret.ERROR_TEMPLATE
-    except (TypeError, AttributeError, SyntaxException) as error:
-        # Show only relevant part of trace
-        traceback = RichTraceback()
-        show = False
-        print(f"{type(error).__name__} in template:\n")
-        for (filename, lineno, function, line) in traceback.traceback:
-            if show is False and function == "render_body":
-                show = True
-
-            if show is True:
-                print(f"File {filename}, line {lineno}, in {function}")
-                print(line, "\n")
-                print(f"{str(traceback.error.__class__.__name__)}: {traceback}")
+    except _TEMPLATE_ERRORS as error:
+        ret_status = _handle_template_error(error)
 
-        ret_status = Ret.ERROR_TEMPLATE
+    if _IS_VERBOSE is True:
+        hits, misses, bypasses = get_macro_cache_statistics()
+        print(f"Macro cache: {hits} hits, {misses} misses, {bypasses} bypasses")
 
     return ret_status
 
@@ -166,14 +209,64 @@ def _constants_to_dict(constants):
 
     return constants_dict
 
-def _cmd_print(binary_file, config_file, template_file, show_only_in_hex, constants):
+# pylint: disable=too-many-arguments
+def _print_binary_file(binary_file, layout_plan, template, show_only_in_hex, constants, cache_dir):
+    """Print the configuration element values of a single binary file.
+
+    Args:
+        binary_file (str): File name of the binary file
+        layout_plan (LayoutPlan): Compiled configuration
+        template (str): The template content or None
+        show_only_in_hex (bool): Show values only in hex format. Only applied without template.
+        constants (dict): Dictionary of constants to be used in the template.
+        cache_dir (str): Cache directory for the compiled template and the parsed
+            intel hex file or None.
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a error code.
+    """
+    ret_status, binary_data = common_load_binary_file(binary_file, cache_dir)
+
+    # Is binary file successful loaded?
+    if ret_status == Ret.OK:
+        # With a template, only the elements used by it are read from the binary data.
+        tmpl_model = TmplModel(template is not None)
+
+        tmpl_model.load_from_layout_plan(binary_data, layout_plan)
+
+        # If there is no template file available, only the elements in the
+        # configuration will be printed. Otherwise the template is used to
+        # print a corresponding report.
+        if template is None:
+            ret_status = _print_config_elements(tmpl_model.get(), show_only_in_hex)
+        else:
+            # The compiled template is cached, so it is compiled only once per process.
+            ret_status, tmpl = _compile_template(template, cache_dir)
+
+            if ret_status == Ret.OK:
+                # Ensure that the macros can access the binary data
+                set_binary_data(binary_data)
+
+                ret_status = _print_template(tmpl_model, tmpl, constants)
+
+    return ret_status
+
+# pylint: disable=too-many-arguments
+def _cmd_print(binary_files, output, jobs, cache_dir, config_file, template_file, show_only_in_hex, constants): # pylint: disable=line-too-long
     """Print configuration element values. The configuration file contains the
         elements with its meta data. A template may be used to format the
         output. If no template is available, the configuration elements will
         be printed in the order they are defined in the configuration file.
 
+        The configuration and the template are loaded only once for all
+        binary files.
+
     Args:
-        binary_file (str): File name of the binary file
+        binary_files (list): File names of the binary files
+        output (str): Output file name pattern or None for stdout.
+        jobs (int): Number of binary files which are processed in parallel.
+        cache_dir (str): Cache directory for the compiled configuration and
+            template and the parsed intel hex files or None to disable the cache.
         config_file (str): File name of the configuration file
         template_file (str): File name of the template file
         show_only_in_hex (bool): Show values only in hex format. Only applied without template.
@@ -182,39 +275,34 @@ def _cmd_print(binary_file, config_file, template_file, show_only_in_hex, consta
     Returns:
         Ret: If successful, it will return Ret.OK otherwise a error code.
     """
-    ret_status, binary_data = common_load_binary_file(binary_file)
+    template = None
+    constants_dict = {}
 
-    # Is binary file successful loaded?
-    if ret_status == Ret.OK:
-        config_model = ConfigModel()
+    # The compiled configuration is cached, because the same configuration
+    # is typically used for many binary files.
+    ret_status, layout_plan = layout_plan_load(config_file, cache_dir)
 
-        ret_status = config_model.load(config_file)
+    # Is configuration file successful loaded and template available?
+    if (ret_status == Ret.OK) and (template_file is not None):
+        ret_status, template = common_load_template_file(template_file)
 
-        # Is configuration file successful loaded?
+        # Is template file successful loaded? Any error in the template is
+        # reported once here and not for every binary file.
         if ret_status == Ret.OK:
-            tmpl_model = TmplModel()
+            ret_status, _ = _compile_template(template, cache_dir)
 
-            tmpl_model.load_from_config_elements(binary_data, config_model.get())
+        if constants is not None:
+            constants_dict = _constants_to_dict(constants)
 
-            # If there is no template file available, only the elements in the
-            # configuration will be printed. Otherwise the template is used to
-            # print a corresponding report.
-            if template_file is None:
-                ret_status = _print_config_elements(tmpl_model.get(), show_only_in_hex) # pylint: disable=line-too-long
-            else:
-                ret_status, template = common_load_template_file(template_file)
-
-                # Is template file successful loaded?
-                if ret_status == Ret.OK:
-
-                    # Ensure that the macros can access the binary data
-                    set_binary_data(binary_data)
-
-                    constants_dict = {}
-                    if constants is not None:
-                        constants_dict = _constants_to_dict(constants)
-
-                    ret_status = _print_template(tmpl_model, template, constants_dict)
+    if ret_status == Ret.OK:
+        ret_status = common_process_binary_files(binary_files, output, \
+            partial(_print_binary_file,
+                    layout_plan=layout_plan,
+                    template=template,
+                    show_only_in_hex=show_only_in_hex,
+                    constants=constants_dict,
+                    cache_dir=cache_dir), \
+            jobs)
 
     return ret_status
 
@@ -233,7 +321,20 @@ def _exec(args):
     # Constants are optional
     constants = getattr(args, 'constant', None)
 
-    return _cmd_print(args.binaryFile[0], args.configFile[0], args.templateFile, args.onlyInHex, constants) # pylint: disable=line-too-long,too-many-function-args
+    # Batch processing is optional
+    manifest_file = getattr(args, "manifestFile", None)
+    output = getattr(args, "output", None)
+    jobs = getattr(args, "jobs", 1)
+
+    # Cache is optional
+    cache_dir = common_get_cache_dir(args)
+
+    ret_status, binary_files = common_get_binary_files(args.binaryFile, manifest_file)
+
+    if ret_status == Ret.OK:
+        ret_status = _cmd_print(binary_files, output, jobs, cache_dir, args.configFile[0], args.templateFile, args.onlyInHex, constants) # pylint: disable=line-too-long
+
+    return ret_status
 
 def cmd_register(arg_sub_parsers):
     """Register the command specific CLI argument parser and get command
@@ -258,8 +359,8 @@ def cmd_register(arg_sub_parsers):
         "binaryFile",
         metavar="BINARY_FILE",
         type=str,
-        nargs=1,
-        help="Binary file in intel hex format (.hex) or binary (.bin)."
+        nargs="*",
+        help="Binary files in intel hex format (.hex) or binary (.bin). Glob patterns are supported."
     )
 
     parser.add_argument(
@@ -309,6 +410,61 @@ def cmd_register(arg_sub_parsers):
                 "Can be applied several times. Example --constant name:value"
     )
 
+    parser.add_argument(
+        "-mf",
+        "--manifestFile",
+        metavar="MANIFEST_FILE",
+        type=str,
+        required=False,
+        default=None,
+        help="File with one binary file per line, which are processed in addition."
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="OUTPUT",
+        type=str,
+        required=False,
+        default=None,
+        help="Write the result to this file instead of stdout. It may contain the " \
+            "placeholders {name}, {stem} and {index} to get one file per binary file."
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="JOBS",
+        type=int,
+        required=False,
+        default=1,
+        help="Number of binary files which are processed in parallel, 0 means one per CPU core.\n" \
+            "(default: %(default)s)"
+    )
+
+    parser.add_argument(
+        "-cd",
+        "--cacheDir",
+        metavar="CACHE_DIR",
+        type=str,
+        required=False,
+        default=None,
+        help="Directory where to cache the compiled configuration and template and the " \
+            "parsed intel hex files.\n" \
+            "(default: PYHEXDUMP_CACHE_DIR environment variable, otherwise no cache)"
+    )
+
+    parser.add_argument(
+        "-nc",
+        "--noCache",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Don't cache the compiled configuration and template and the parsed intel hex " \
+            "files on disk.\n" \
+            "(default: %(default)s)"
+    )
+
     return cmd_par_dict
 
 ################################################################################
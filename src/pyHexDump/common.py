@@ -25,15 +25,36 @@
 ################################################################################
 # Imports
 ################################################################################
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import contextlib
+import glob
+import io
 import json
+import os
+import sys
 
-from intelhex import IntelHex
 from pyHexDump.constants import Ret
+from pyHexDump.binary_image import BinaryImage, \
+    binary_image_load_bin_file, binary_image_load_hex_file
+from pyHexDump.mem_access import MemAccessInteger
 
 ################################################################################
 # Variables
 ################################################################################
 
+# Environment variable to choose the cache directory.
+_CACHE_DIR_ENV = "PYHEXDUMP_CACHE_DIR"
+
+# Number of lines, which are written at once by the dump.
+_DUMP_CHUNK_LINES = 4096
+
+# Number of bytes, which are skipped at once in a stream which is not seekable.
+_STREAM_SKIP_SIZE = 65536
+
+# Function which processes a single binary file in a worker process.
+_WORKER_PROCESS_FUNC = None
+
 ################################################################################
 # Classes
 ################################################################################
@@ -42,33 +63,272 @@ from pyHexDump.constants import Ret
 # Functions
 ################################################################################
 
-def common_load_binary_file(file_name):
+def common_get_cache_dir(args=None):
+    """Get the directory where to cache data, which is expensive to create
+        and can be reused across program runs, e.g. compiled configurations.
+        It can be chosen by the PYHEXDUMP_CACHE_DIR environment variable.
+        Without a configured cache directory nothing is cached on disk.
+
+        If the program arguments are given, the --cacheDir option has
+        precedence and the --noCache option disables the cache.
+
+    Args:
+        args (obj, optional): Program arguments. Defaults to None.
+
+    Returns:
+        str: Cache directory or None if the cache is disabled.
+    """
+    cache_dir = getattr(args, "cacheDir", None)
+
+    if getattr(args, "noCache", False) is True:
+        return None
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(_CACHE_DIR_ENV, None)
+
+    return cache_dir
+
+def common_load_binary_file(file_name, cache_dir=None):
     """Load binary file which to dump.
 
         If any error happen, it will return the error code and None instead of
         the file content.
 
+        Intel hex files are parsed into contiguous segments. All other files
+        are handled as raw binary and mapped into memory, which avoids to read
+        the whole file in advance.
+
     Args:
         file_name (str): File name of the binary file
+        cache_dir (str, optional): Cache directory for parsed intel hex files.
+            Defaults to None.
 
     Returns:
-        Ret, IntelHex: Status information and file content
+        Ret, BinaryImage: Status information and file content
     """
     ret_status = Ret.OK
-    intel_hex_file = IntelHex()
-    file_format = "bin"
-
-    # Intel hex file? All others are handled as binary.
-    if file_name.endswith(".hex"):
-        file_format = "hex"
+    binary_data = None
 
     try:
-        intel_hex_file.fromfile(file_name, format=file_format)
+        # Intel hex file? All others are handled as binary.
+        if file_name.endswith(".hex"):
+            binary_data = binary_image_load_hex_file(file_name, cache_dir)
+        else:
+            binary_data = binary_image_load_bin_file(file_name)
+
     except FileNotFoundError:
         ret_status = Ret.ERROR_INPUT_FILE_NOT_FOUND
-        intel_hex_file = None
+        binary_data = None
+
+    except (ValueError, OSError):
+        # Not readable, e.g. a directory, missing permissions or not mappable.
+        ret_status = Ret.ERROR_INPUT_FILE_INVALID
+        binary_data = None
+
+    return ret_status, binary_data
+
+def common_get_binary_files(binary_files, manifest_file=None):
+    """Get the binary files which to process. Glob patterns are expanded.
+        A manifest file contains one binary file per line, empty lines and
+        lines starting with # are ignored. Relative paths in the manifest
+        are relative to the manifest file.
+
+        If a pattern doesn't match any file, it is kept as it is, so the
+        missing file will be reported during processing.
+
+    Args:
+        binary_files (list): File names or glob patterns of the binary files
+        manifest_file (str, optional): File name of the manifest file. Defaults to None.
+
+    Returns:
+        Ret, list: Status information and the binary file names
+    """
+    ret_status = Ret.OK
+    patterns = list(binary_files)
+    file_names = []
+
+    if manifest_file is not None:
+        manifest_dir = os.path.dirname(manifest_file)
+
+        try:
+            with open(manifest_file, encoding="utf-8") as file_descriptor:
+                for line in file_descriptor:
+                    line = line.strip()
+
+                    if (len(line) > 0) and (line.startswith("#") is False):
+                        patterns.append(os.path.join(manifest_dir, line))
+
+        except FileNotFoundError:
+            ret_status = Ret.ERROR_INPUT_FILE_NOT_FOUND
+
+    for pattern in patterns:
+        matches = []
+
+        if glob.has_magic(pattern) is True:
+            matches = sorted(glob.glob(pattern))
+
+        if len(matches) == 0:
+            file_names.append(pattern)
+        else:
+            file_names.extend(matches)
+
+    if (ret_status == Ret.OK) and (len(file_names) == 0):
+        ret_status = Ret.ERROR_INPUT_FILE_NOT_FOUND
+
+    return ret_status, file_names
+
+def _get_output_file_name(output, binary_file, index):
+    """Get the output file name of a binary file.
+        The output may contain the placeholders {name} (file name),
+        {stem} (file name without extension) and {index} (index in the batch).
+
+    Args:
+        output (str): Output file name pattern
+        binary_file (str): File name of the binary file
+        index (int): Index of the binary file in the batch, starting with 0.
+
+    Returns:
+        str: Output file name
+    """
+    name = os.path.basename(binary_file)
+    stem = os.path.splitext(name)[0]
+
+    return output.format(name=name, stem=stem, index=index)
+
+def _init_worker(process_func):
+    """Initialize a worker process of the process pool. The function, which
+        processes a binary file, is transferred only once per worker.
+
+    Args:
+        process_func (function): Function which processes a single binary file.
+    """
+    global _WORKER_PROCESS_FUNC # pylint: disable=global-statement
+    _WORKER_PROCESS_FUNC = process_func
+
+def _process_in_worker(binary_file):
+    """Process a single binary file in a worker process. Its output is
+        captured, so the main process can write it in the right order.
+
+    Args:
+        binary_file (str): File name of the binary file
+
+    Returns:
+        Ret, str: Status information and output
+    """
+    output = io.StringIO()
 
-    return ret_status, intel_hex_file
+    with contextlib.redirect_stdout(output):
+        ret_status = _WORKER_PROCESS_FUNC(binary_file)
+
+    return ret_status, output.getvalue()
+
+def _get_worker_result(future):
+    """Wait for the result of a worker process and print its output.
+
+    Args:
+        future (Future): Result of the worker process
+
+    Returns:
+        Ret: Status information of the worker process
+    """
+    try:
+        ret_status, output = future.result()
+        print(output, end="")
+
+    except Exception as error: # pylint: disable=broad-exception-caught
+        print(f"Error: {type(error).__name__}: {error}", file=sys.stderr)
+        ret_status = Ret.ERROR
+
+    return ret_status
+
+# pylint: disable=too-many-locals
+def common_process_binary_files(binary_files, output, process_func, jobs=1):
+    """Process every binary file with the given function. The output of each
+        file is written to stdout or to the output file. If several binary
+        files write to the same output, every result starts with a header
+        line which contains the binary file name.
+
+        A failure of a single binary file is reported to stderr, but doesn't
+        abort the processing of the others.
+
+        With more than one job, the binary files are processed in parallel
+        by a pool of processes. The output is written in the same order like
+        without parallel processing.
+
+    Args:
+        binary_files (list): File names of the binary files
+        output (str): Output file name pattern, see _get_output_file_name().
+            If None, the output is written to stdout.
+        process_func (function): Function which processes a single binary file.
+            It gets the binary file name and returns the status information.
+            For parallel processing it must be picklable, e.g. a partial of
+            a module function.
+        jobs (int, optional): Number of parallel processes, 0 means one per
+            CPU core. Defaults to 1.
+
+    Returns:
+        Ret: If all are successful, it will return Ret.OK otherwise the first error.
+    """
+    ret_status = Ret.OK
+    output_file_names = [None] * len(binary_files)
+    opened_file_names = set()
+    headed_file_names = set()
+
+    if output is not None:
+        output_file_names = [_get_output_file_name(output, binary_file, idx) \
+                             for idx, binary_file in enumerate(binary_files)]
+
+    if jobs == 0:
+        jobs = os.cpu_count()
+
+    with contextlib.ExitStack() as pool_stack:
+        if (jobs > 1) and (len(binary_files) > 1):
+            executor = pool_stack.enter_context(ProcessPoolExecutor(max_workers=jobs,
+                                                                    initializer=_init_worker,
+                                                                    initargs=(process_func,)))
+            run_funcs = [partial(_get_worker_result, executor.submit(_process_in_worker, \
+                binary_file)) for binary_file in binary_files]
+        else:
+            run_funcs = [partial(process_func, binary_file) for binary_file in binary_files]
+
+        for binary_file, output_file_name, run_func in \
+            zip(binary_files, output_file_names, run_funcs):
+            is_header_required = output_file_names.count(output_file_name) > 1
+
+            try:
+                with contextlib.ExitStack() as stack:
+                    if output_file_name is not None:
+                        # The first result overwrites the file, all others are appended.
+                        mode = "a" if output_file_name in opened_file_names else "w"
+                        opened_file_names.add(output_file_name)
+                        stack.enter_context(contextlib.redirect_stdout(
+                            stack.enter_context(open(output_file_name, mode, encoding="utf-8"))))
+
+                    if is_header_required is True:
+                        # Separate it from the result of the previous binary file.
+                        if output_file_name in headed_file_names:
+                            print("")
+
+                        headed_file_names.add(output_file_name)
+                        print(f"==> {binary_file} <==")
+
+                    file_ret_status = run_func()
+
+            except BrokenPipeError:
+                # Nobody reads the output anymore, therefore processing further files is useless.
+                raise
+
+            except OSError as error:
+                print(f"Error: {error}", file=sys.stderr)
+                file_ret_status = Ret.ERROR
+
+            if file_ret_status != Ret.OK:
+                print(f"Error: {binary_file}: {file_ret_status.name}", file=sys.stderr)
+
+                if ret_status == Ret.OK:
+                    ret_status = file_ret_status
+
+    return ret_status
 
 def common_load_json_file(file_name):
     """Load JSON file to dictionary.
@@ -135,46 +395,300 @@ def common_print_value(value, value_format="{:02X}"):
     # Array of values?
     if isinstance(value, list):
         # Print the array with a space between
-        for idx, element in enumerate(value):
-            if idx > 0:
-                print(" ", end="")
-            print(value_format.format(element), end="")
+        print(" ".join(value_format.format(element) for element in value), end="")
     else:
         # Print the single value
         print(value_format.format(value), end="")
 
+def common_swap_words(data, word_size):
+    """Swap the byte order of every word in the data.
+
+    Args:
+        data (bytes): Data, which length is a multiple of the word size.
+        word_size (int): Word size in byte
+
+    Returns:
+        bytes: Data with swapped words
+    """
+    if word_size <= 1:
+        return bytes(data)
+
+    swapped_data = bytearray(len(data))
+
+    for idx in range(word_size):
+        swapped_data[idx::word_size] = data[word_size - idx - 1::word_size]
+
+    return bytes(swapped_data)
+
+def _is_raw_hex_format_possible(mem_access):
+    """Check whether the values can be formatted in hex directly from the
+        raw bytes. This is possible for unsigned integers only.
+
+    Args:
+        mem_access (MemAccess): The memory access API.
+
+    Returns:
+        bool: True if possible, otherwise False.
+    """
+    return isinstance(mem_access, MemAccessInteger) and (mem_access.is_unsigned() is True)
+
+def _get_msb_first_bytes(mem_access, addr, length):
+    """Get the raw bytes with the most significant byte of every value first.
+
+    Args:
+        mem_access (MemAccess): The memory access API.
+        addr (int): The memory start address.
+        length (int): Number of bytes, a multiple of the data type size.
+
+    Returns:
+        bytes: Raw bytes
+    """
+    data = mem_access.get_bytes(addr, length)
+
+    if mem_access.is_little_endian() is True:
+        data = common_swap_words(data, mem_access.get_size())
+    else:
+        data = bytes(data)
+
+    return data
+
+def common_format_values(mem_access, addr, count):
+    """Format a number of consecutive values in hex, separated by a space.
+        Unsigned values are formatted directly from the raw bytes, which
+        avoids to decode every single value.
+
+    Args:
+        mem_access (MemAccess): The memory access API.
+        addr (int): The memory start address.
+        count (int): The number of values.
+
+    Returns:
+        str: Formatted values
+    """
+    value_size = mem_access.get_size()
+
+    if _is_raw_hex_format_possible(mem_access) is True:
+        text = _get_msb_first_bytes(mem_access, addr, count * value_size).hex(" ", value_size)
+        text = text.upper()
+    else:
+        value_format = "{:0" + str(2 * value_size) + "X}"
+        text = " ".join(value_format.format(value) for value in mem_access.get_values(addr, count))
+
+    return text
+
 def common_print_line(mem_access, addr, count):
     """Print a single line in the format:
         <address>: <data>
 
     Args:
-        intel_hex_file (intelhex): The intel hex object.
         mem_access (MemAccess): The memory access API.
         addr (int): The memory start address.
         count (int): The number of elements to show.
     """
-    common_print_address(addr)
-    print(": ", end="")
+    print(f"{addr:04X}: {common_format_values(mem_access, addr, count)}", end="")
+
+def _format_dump_lines(mem_access, addr, count, next_line, line_idx_range):
+    """Format a range of dump lines.
+
+    Args:
+        mem_access (MemAccess): Memory access API
+        addr (int): Address of the first line of the dump
+        count (int): Number of elements of the whole dump
+        next_line (int): Number of bytes per line
+        line_idx_range (range): Indices of the lines which to format
+
+    Returns:
+        list: Lines
+    """
+    value_size = mem_access.get_size()
+    line_element_cnt = next_line // value_size
+    lines = []
+
+    # If the lines are contiguous, the data of all lines is read at once.
+    if (_is_raw_hex_format_possible(mem_access) is True) and ((next_line % value_size) == 0):
+        first_element_idx = line_idx_range.start * line_element_cnt
+        element_cnt = min(len(line_idx_range) * line_element_cnt, count - first_element_idx)
+        data = _get_msb_first_bytes(mem_access, addr + line_idx_range.start * next_line, \
+                                    element_cnt * value_size)
+
+        # Every value takes two characters per byte and a separator.
+        text = data.hex(" ", value_size).upper()
+        line_length = line_element_cnt * (2 * value_size + 1)
+        line_addr = addr + line_idx_range.start * next_line
+
+        for offset in range(0, len(text), line_length):
+            lines.append(f"{line_addr:04X}: {text[offset:offset + line_length - 1]}")
+            line_addr += next_line
+    else:
+        for line_idx in line_idx_range:
+            line_addr = addr + line_idx * next_line
+            element_cnt = min(line_element_cnt, count - line_idx * line_element_cnt)
+
+            lines.append(f"{line_addr:04X}: " \
+                         f"{common_format_values(mem_access, line_addr, element_cnt)}")
+
+    return lines
+
+def _get_line_idx_ranges(segments, addr, line_cnt, next_line):
+    """Get the ranges of dump lines, which contain data of any segment.
+
+    Args:
+        segments (list): List of (start, end) tuples, the end address is not included.
+        addr (int): Address of the first line of the dump
+        line_cnt (int): Number of lines of the whole dump
+        next_line (int): Number of bytes per line
+
+    Returns:
+        list: Ranges of line indices
+    """
+    line_idx_ranges = []
+
+    for start_addr, end_addr in segments:
+        if end_addr <= addr:
+            continue
+
+        first_line_idx = max(0, (start_addr - addr) // next_line)
+        end_line_idx = min(line_cnt, (end_addr - 1 - addr) // next_line + 1)
+
+        if first_line_idx >= line_cnt:
+            break
+
+        # Segments which share a line are merged.
+        if (len(line_idx_ranges) > 0) and (first_line_idx <= line_idx_ranges[-1].stop):
+            line_idx_ranges[-1] = range(line_idx_ranges[-1].start, \
+                                        max(line_idx_ranges[-1].stop, end_line_idx))
+        else:
+            line_idx_ranges.append(range(first_line_idx, end_line_idx))
+
+    return line_idx_ranges
+
+def _get_gap_line(start_addr, end_addr):
+    """Get the line, which marks a gap without data in the dump.
+
+    Args:
+        start_addr (int): Start address of the gap
+        end_addr (int): End address of the gap (not included)
+
+    Returns:
+        str: Gap line
+    """
+    return f"-- gap 0x{start_addr:08X} - 0x{end_addr:08X} ({end_addr - start_addr} bytes) --"
+
+def _get_dump_lines(mem_access, addr, count, next_line, segments):
+    """Get the lines of a dump. They are formatted in chunks of several lines.
+
+    Args:
+        mem_access (MemAccess): Memory access API
+        addr (int): Address
+        count (int): Number of elements
+        next_line (int): Number of bytes per line
+        segments (list): Address ranges with data or None to dump everything.
+
+    Yields:
+        list: Lines
+    """
+    line_element_cnt = next_line // mem_access.get_size()
+    line_cnt = 0
+
+    if line_element_cnt > 0:
+        line_cnt = (count + line_element_cnt - 1) // line_element_cnt
+
+    if segments is None:
+        line_idx_ranges = [range(0, line_cnt)]
+    else:
+        line_idx_ranges = _get_line_idx_ranges(segments, addr, line_cnt, next_line)
+
+    line_idx = 0
+
+    for line_idx_range in line_idx_ranges:
+        if line_idx_range.start > line_idx:
+            yield [_get_gap_line(addr + line_idx * next_line, \
+                                 addr + line_idx_range.start * next_line)]
+
+        for chunk_start in range(line_idx_range.start, line_idx_range.stop, _DUMP_CHUNK_LINES):
+            chunk_range = range(chunk_start, min(chunk_start + _DUMP_CHUNK_LINES, \
+                                                 line_idx_range.stop))
+
+            yield _format_dump_lines(mem_access, addr, count, next_line, chunk_range)
+
+        line_idx = line_idx_range.stop
+
+    if line_idx < line_cnt:
+        yield [_get_gap_line(addr + line_idx * next_line, addr + count * mem_access.get_size())]
+
+def _squeeze_dump_lines(chunks):
+    """Replace lines with the same data like the previous line by a single *.
+
+    Args:
+        chunks (iterable): Chunks of dump lines
+
+    Yields:
+        list: Lines
+    """
+    prev_data = None
+    is_squeezed = False
+
+    for chunk in chunks:
+        lines = []
+
+        for line in chunk:
+            _, separator, data = line.partition(": ")
 
-    value_width = 2 * mem_access.get_size()
-    value_format = "{:0" + str(value_width) + "X}"
-    for idx in range(count):
-        # Print space between each value
-        if idx > 0:
-            print(" ", end="")
+            # Lines without data, e.g. gap lines, are never squeezed.
+            if separator == "":
+                data = None
+            elif data == prev_data:
+                if is_squeezed is False:
+                    is_squeezed = True
+                    lines.append("*")
+                continue
 
-        offset = idx * mem_access.get_size()
-        common_print_value(mem_access.get_value(addr + offset), value_format)
+            prev_data = data
+            is_squeezed = False
+            lines.append(line)
 
-def common_dump_intel_hex(mem_access, addr, count, next_line=16):
+        if len(lines) > 0:
+            yield lines
+
+def _write_dump_lines(chunks, is_flushed=False):
+    """Write the dump lines to stdout, a whole chunk of lines at once.
+        The last line is not terminated by a newline.
+
+    Args:
+        chunks (iterable): Chunks of dump lines
+        is_flushed (bool, optional): Flush stdout after every chunk. Defaults to False.
+    """
+    is_first_chunk = True
+
+    for chunk in chunks:
+        # Print newline not for the first line but for all following lines
+        if is_first_chunk is False:
+            sys.stdout.write("\n")
+
+        sys.stdout.write("\n".join(chunk))
+        is_first_chunk = False
+
+        if is_flushed is True:
+            sys.stdout.flush()
+
+# pylint: disable=too-many-arguments
+def common_dump_intel_hex(mem_access, addr, count, next_line=16, segments=None, squeeze=False):
     """Dump some data, starting with the address in the format "<addr>: <data>".
         The address and the data is printed in hex.
 
+        The lines are formatted completely and written in chunks of several
+        lines, which avoids a write access per value.
+
     Args:
         mem_access (MemAccess): Memory access API
         addr (int): Address
         count (int): Number of elements
         next_line (int): A newline will be printed after this number of bytes.
+        segments (list, optional): Address ranges with data, see BinaryImage.segments().
+            Lines without data are skipped and a gap line is printed instead.
+            Defaults to None, which dumps all lines.
+        squeeze (bool, optional): Print a single * instead of lines with
+            the same data like the previous line. Defaults to False.
 
     Returns:
         Ret: If successful, it will return Ret.OK otherwise a error code.
@@ -183,29 +697,127 @@ def common_dump_intel_hex(mem_access, addr, count, next_line=16):
     if next_line == 0:
         next_line = mem_access.get_size() * count
 
-    full_line_cnt = next_line // mem_access.get_size()
-    full_lines_cnt = 0
-    last_line_element_cnt = 0
+    chunks = _get_dump_lines(mem_access, addr, count, next_line, segments)
 
-    if full_line_cnt > 0:
-        full_lines_cnt = count // full_line_cnt
-        last_line_element_cnt = count % full_line_cnt
+    if squeeze is True:
+        chunks = _squeeze_dump_lines(chunks)
 
-    offset = 0
-    for index in range(full_lines_cnt):
-        # Print newline not for the first line but for all following lines
-        if index > 0:
-            print("")
+    _write_dump_lines(chunks)
+
+    return Ret.OK
+
+def _read_stream(file_descriptor, length):
+    """Read the given number of bytes from the stream. Less bytes are only
+        returned at the end of the stream, even if the stream is a pipe.
+
+    Args:
+        file_descriptor (obj): Binary stream
+        length (int): Number of bytes
+
+    Returns:
+        bytes: Data
+    """
+    data = file_descriptor.read(length)
+
+    while 0 < len(data) < length:
+        more_data = file_descriptor.read(length - len(data))
+
+        if len(more_data) == 0:
+            break
+
+        data += more_data
+
+    return data
+
+def _skip_stream(file_descriptor, length):
+    """Skip the given number of bytes in the stream.
+
+    Args:
+        file_descriptor (obj): Binary stream
+        length (int): Number of bytes
+    """
+    if file_descriptor.seekable() is True:
+        file_descriptor.seek(length, os.SEEK_CUR)
+    else:
+        while length > 0:
+            skipped_length = len(_read_stream(file_descriptor, min(length, _STREAM_SKIP_SIZE)))
+
+            if skipped_length == 0:
+                break
+
+            length -= skipped_length
+
+def _get_stream_dump_lines(mem_access, file_descriptor, addr, count, next_line):
+    """Get the lines of a streamed dump. The stream is read and formatted in
+        chunks of several lines. With a count, the end of the stream is padded
+        up to the count like the dump of a file.
+
+    Args:
+        mem_access (MemAccess): Memory access API
+        file_descriptor (obj): Binary stream
+        addr (int): Address, which is the offset in the stream.
+        count (int): Number of elements or 0 to dump until the end of the stream.
+        next_line (int): Number of bytes per line
+
+    Yields:
+        list: Lines
+    """
+    value_size = mem_access.get_size()
+    chunk_size = _DUMP_CHUNK_LINES * next_line
+    remaining_cnt = count
+    chunk_addr = addr
+
+    while (count == 0) or (remaining_cnt > 0):
+        data = _read_stream(file_descriptor, chunk_size)
+
+        if count > 0:
+            # Missing data at the end of the stream is padded by the binary image.
+            element_cnt = min(chunk_size // value_size, remaining_cnt)
+            remaining_cnt -= element_cnt
+
+        elif len(data) == 0:
+            break
+
+        else:
+            element_cnt = (len(data) + value_size - 1) // value_size
+
+        chunk_mem_access = mem_access.bind(BinaryImage([(chunk_addr, data)]))
+
+        yield from _get_dump_lines(chunk_mem_access, chunk_addr, element_cnt, next_line, None)
+
+        chunk_addr += chunk_size
+
+# pylint: disable=too-many-arguments
+def common_dump_stream(mem_access, file_descriptor, addr, count, next_line=16, squeeze=False):
+    """Dump raw binary data from a stream, like common_dump_intel_hex() does.
+        The stream is read in chunks, which are dumped and flushed at once.
+        Therefore the memory consumption doesn't depend on the stream size
+        and the output starts immediately. Without a count the dump stops at
+        the end of the stream, otherwise the missing data is padded.
+
+    Args:
+        mem_access (MemAccess): Memory access API
+        file_descriptor (obj): Binary stream, e.g. a file or stdin.
+        addr (int): Address, which is the offset in the stream.
+        count (int): Number of elements or 0 to dump until the end of the stream.
+        next_line (int): A newline will be printed after this number of bytes.
+        squeeze (bool, optional): Print a single * instead of lines with
+            the same data like the previous line. Defaults to False.
+
+    Returns:
+        Ret: If successful, it will return Ret.OK otherwise a error code.
+    """
+    # A chunk shall contain complete lines.
+    next_line = max(next_line, mem_access.get_size())
+
+    _skip_stream(file_descriptor, addr)
 
-        offset = index * next_line
-        common_print_line(mem_access, addr + offset, full_line_cnt)
+    chunks = _get_stream_dump_lines(mem_access, file_descriptor, addr, count, next_line)
 
-    if last_line_element_cnt > 0:
-        # Print newline only if this is not the first line (no full lines available)
-        if full_lines_cnt > 0:
-            print("")
+    if squeeze is True:
+        chunks = _squeeze_dump_lines(chunks)
 
-        common_print_line(mem_access, addr + offset, last_line_element_cnt)
+    _write_dump_lines(chunks, True)
 
     return Ret.OK
 
@@ -26,7 +26,7 @@
 ################################################################################
 # Imports
 ################################################################################
-from pyHexDump.mem_access import mem_access_get_api_by_data_type
+from pyHexDump.mem_access import mem_access_get_decoder
 
 ################################################################################
 # Variables
@@ -57,30 +57,54 @@ class ConfigElement:
         self.addr = addr
         self.data_type = data_type
         self.count = count
+        self._elements = None
+        self._size = None
         self.elements = elements
 
+    @property
+    def elements(self):
+        """Get the configuration elements of the structure.
+
+        Returns:
+            dict: Configuration elements or None in case of a built-in data type.
+        """
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements):
+        """Set the configuration elements of the structure.
+            The size will be calculated again on next request.
+
+        Args:
+            elements (dict): Configuration elements or None in case of a built-in data type.
+        """
+        self._elements = elements
+        self._size = None
+
     @property
     def size(self):
         """Get the size of the configuration element.
+            It is calculated only once.
 
         Returns:
             int: Size of the configuration element in bytes.
         """
-        size = 0
+        if self._size is None:
+            size = 0
 
-        if self.elements is None:
-            mem_access = mem_access_get_api_by_data_type(self.data_type)
-            assert mem_access is not None, f"Unsupported data type: {self.data_type}"
+            if self.elements is None:
+                decoder = mem_access_get_decoder(self.data_type)
+                assert decoder is not None, f"Unsupported data type: {self.data_type}"
 
-            size = mem_access.get_size()
+                size = decoder.get_size()
 
-        else:
-            for _, config_element in self.elements.items():
-                size += config_element.size
+            else:
+                for _, config_element in self.elements.items():
+                    size += config_element.size
 
-        size *= self.count
+            self._size = size * self.count
 
-        return size
+        return self._size
 
 class PaddingElement(ConfigElement):
     """
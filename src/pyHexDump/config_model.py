@@ -28,7 +28,7 @@
 ################################################################################
 from pyHexDump.constants import Ret
 from pyHexDump.common import common_load_json_file
-from pyHexDump.mem_access import mem_access_get_api_by_data_type
+from pyHexDump.mem_access import mem_access_get_decoder
 from pyHexDump.config_element import ConfigElement, PaddingElement
 
 ################################################################################
@@ -45,6 +45,9 @@ class ConfigModel():
     def __init__(self):
         self._list = []
 
+        # Structure definitions by their name
+        self._structure_dict = {}
+
     def load(self, file_name):
         """Load configuration model from file.
 
@@ -54,10 +57,19 @@ class ConfigModel():
         ret_status, config_dict = common_load_json_file(file_name)
 
         if ret_status == Ret.OK:
-            self._list = self._get_config_elements(config_dict)
+            self.load_from_dict(config_dict)
 
         return ret_status
 
+    def load_from_dict(self, config_dict):
+        """Load configuration model from the configuration items.
+
+        Args:
+            config_dict (dict): Configuration items
+        """
+        self._structure_dict = self._get_structure_dict(config_dict)
+        self._list = self._get_config_elements(config_dict)
+
     def get(self):
         """Get list of configuration elements.
 
@@ -66,32 +78,46 @@ class ConfigModel():
         """
         return self._list
 
-    def _find_structure_definition(self, config_dict, structure_name):
-        """Find a structure definition by its name.
+    def _get_structure_dict(self, config_dict):
+        """Get all structure definitions by their name. If a name is defined
+            several times, the first definition is used.
 
         Args:
             config_dict (dict): Configuration items
-            structure_name (str): Name of the structure
 
         Returns:
-            dict: If structure found, it will return its definition otherwise None.
+            dict: Structure definitions
         """
-        structure_pos = None
+        structure_dict = {}
 
         if "structures" in config_dict:
             for idx, item in enumerate(config_dict["structures"]):
                 if "name" in item:
-                    name = item["name"]
-                    if name == structure_name:
-                        if "elements" in item:
-                            structure_pos = item["elements"]
-                        else:
-                            print(f"Warning: \"elements\" is missing for {name} element.")
-                        break
-
+                    if item["name"] not in structure_dict:
+                        structure_dict[item["name"]] = item
                 else:
                     print(f"Warning: \"name\" is missing for {idx + 1}. structure element.")
 
+        return structure_dict
+
+    def _find_structure_definition(self, structure_name):
+        """Find a structure definition by its name.
+
+        Args:
+            structure_name (str): Name of the structure
+
+        Returns:
+            dict: If structure found, it will return its definition otherwise None.
+        """
+        structure_pos = None
+        item = self._structure_dict.get(structure_name, None)
+
+        if item is not None:
+            if "elements" in item:
+                structure_pos = item["elements"]
+            else:
+                print(f"Warning: \"elements\" is missing for {structure_name} element.")
+
         return structure_pos
 
     def _get_name_from_config_item(self, item):
@@ -222,9 +248,8 @@ class ConfigModel():
             if isinstance(data_type, str) is True:
 
                 # Is it a custom datatype which is defined separately?
-                mem_access = mem_access_get_api_by_data_type(data_type)
-                if mem_access is None:
-                    sub_structure_definition = self._find_structure_definition(config_dict, data_type)
+                if mem_access_get_decoder(data_type) is None:
+                    sub_structure_definition = self._find_structure_definition(data_type)
 
                     if sub_structure_definition is None:
                         print(f"Warning: Data type {data_type} not found.")
@@ -319,8 +344,8 @@ class ConfigModel():
             if isinstance(data_type, str) is True:
 
                 # Is it a custom datatype which is defined separately?
-                if mem_access_get_api_by_data_type(data_type) is None:
-                    structure_definition = self._find_structure_definition(config_dict, data_type)
+                if mem_access_get_decoder(data_type) is None:
+                    structure_definition = self._find_structure_definition(data_type)
 
                     if structure_definition is None:
                         print(f"Warning: Data type {data_type} not found.")
@@ -42,6 +42,8 @@ class Ret(IntEnum):
     ERROR_UNKNOWN_COMMAND = 5
     ERROR_TEMPLATE = 6
     ERROR_CRC_CACLULATION = 7
+    ERROR_INPUT_FILE_INVALID = 8
+    ERROR_CHECKSUM_MISMATCH = 9
 
 ################################################################################
 # Classes
@@ -0,0 +1,596 @@
+"""This module provides a table driven CRC engine.
+The lookup tables are calculated once per parameter set and cached across
+calls. Multiple bytes are processed per step (slicing-by-N), if the CRC is
+16, 32 or 64 bit wide. See http://ross.net/crc/download/crc_v3.txt for the algorithm.
+The CRC-32 and CRC-CCITT polynomials are calculated by the native implementations
+of the Python standard library (zlib, binascii) instead.
+Well known parameter sets are provided as presets, see
+https://reveng.sourceforge.io/crc-catalogue/ for their definition.
+Large data can be calculated in parallel chunks, whose CRCs are combined
+by multiplying the CRC register with x^n in GF(2), like zlib's crc32_combine().
+"""
+
+# MIT License
+#
+# Copyright (c) 2022 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
+import binascii
+import os
+import struct
+import zlib
+
+################################################################################
+# Variables
+################################################################################
+
+# Translation table to reflect the bits of every byte, used with bytes.translate().
+_REFLECT_BYTE_TABLE = bytes(int(f"{value:08b}"[::-1], 2) for value in range(256))
+
+# Parameter sets (polynomial, bit width), which are natively implemented
+# by the Python standard library.
+_NATIVE_CRC32 = (0x04C11DB7, 32)      # zlib.crc32()
+_NATIVE_CRC_CCITT = (0x1021, 16)      # binascii.crc_hqx()
+
+# Struct formats to read N bytes at once for slicing-by-N.
+_SLICE_FORMATS = {
+    8: ">Q",
+    4: ">I",
+    2: ">H"
+}
+
+# Number of bytes, which are fed at once into the CRC register. The words and
+# the reflected bytes are created per block, which bounds the memory usage
+# independent of the data size. It is a multiple of every slice width.
+_FEED_BLOCK_SIZE = 64 * 1024
+
+# Minimum number of bytes of a chunk, which is calculated in parallel.
+# Smaller data is calculated sequential, because it is faster than
+# distributing it.
+_PARALLEL_MIN_CHUNK_SIZE = 1024 * 1024
+
+# A CRC parameter set with its check value, which is the CRC of "123456789".
+CrcPreset = namedtuple("CrcPreset", [
+    "polynomial",
+    "bit_width",
+    "seed",
+    "reverse_input",
+    "reverse_output",
+    "final_xor",
+    "check"
+])
+
+# Well known CRC parameter sets by name.
+_CRC_PRESETS = {
+    "CRC-8": CrcPreset(0x07, 8, 0x00, False, False, 0x00, 0xF4),
+    "CRC-8/AUTOSAR": CrcPreset(0x2F, 8, 0xFF, False, False, 0xFF, 0xDF),
+    "CRC-8/SAE-J1850": CrcPreset(0x1D, 8, 0xFF, False, False, 0xFF, 0x4B),
+    "CRC-16/ARC": CrcPreset(0x8005, 16, 0x0000, True, True, 0x0000, 0xBB3D),
+    "CRC-16/CCITT-FALSE": CrcPreset(0x1021, 16, 0xFFFF, False, False, 0x0000, 0x29B1),
+    "CRC-16/KERMIT": CrcPreset(0x1021, 16, 0x0000, True, True, 0x0000, 0x2189),
+    "CRC-16/MODBUS": CrcPreset(0x8005, 16, 0xFFFF, True, True, 0x0000, 0x4B37),
+    "CRC-16/XMODEM": CrcPreset(0x1021, 16, 0x0000, False, False, 0x0000, 0x31C3),
+    "CRC-32": CrcPreset(0x04C11DB7, 32, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xCBF43926),
+    "CRC-32/AUTOSAR": CrcPreset(0xF4ACFB13, 32, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0x1697D06A),
+    "CRC-32/BZIP2": CrcPreset(0x04C11DB7, 32, 0xFFFFFFFF, False, False, 0xFFFFFFFF, 0xFC891918),
+    "CRC-32/MPEG-2": CrcPreset(0x04C11DB7, 32, 0xFFFFFFFF, False, False, 0x00000000, 0x0376E6E7),
+    "CRC-32C": CrcPreset(0x1EDC6F41, 32, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xE3069283),
+    "CRC-64/ECMA-182": CrcPreset(0x42F0E1EBA9EA3693, 64, 0x0, False, False, 0x0, \
+                                 0x6C40DF5F0B497347),
+    "CRC-64/XZ": CrcPreset(0x42F0E1EBA9EA3693, 64, 0xFFFFFFFFFFFFFFFF, True, True, \
+                           0xFFFFFFFFFFFFFFFF, 0x995DC9BBDF1939FA)
+}
+
+# Aliases of the preset names.
+_CRC_PRESET_ALIASES = {
+    "CRC-8H2F": "CRC-8/AUTOSAR",
+    "CRC-16/IBM-3740": "CRC-16/CCITT-FALSE",
+    "CRC-32/ISO-HDLC": "CRC-32",
+    "CRC-32P4": "CRC-32/AUTOSAR",
+    "CRC-32/ISCSI": "CRC-32C",
+    "CRC-64": "CRC-64/ECMA-182"
+}
+
+################################################################################
+# Classes
+################################################################################
+
+class Crc(): # pylint: disable=too-many-instance-attributes
+    """CRC engine for a specific parameter set.
+        The CRC register is processed MSB first, a reflected input is realized
+        by reflecting every input byte.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, polynomial, bit_width, seed, reverse_input, reverse_output, final_xor, \
+        use_native=True):
+        """Initialize the CRC engine.
+
+        Args:
+            polynomial (int): Generator polynomial without the highest bit.
+            bit_width (int): Number of bits of the CRC.
+            seed (int): Seed value of the CRC register.
+            reverse_input (bool): Reflect each single input byte if True.
+            reverse_output (bool): Reflect the final CRC value if True.
+            final_xor (bool|int): Xor the final CRC value with all bits set if True
+                or with the given value.
+            use_native (bool, optional): Use the native implementation of the
+                Python standard library, if the parameter set is supported.
+                Defaults to True.
+        """
+        self._parameters = (polynomial, bit_width, seed, reverse_input, reverse_output, \
+                            final_xor, use_native)
+        self._bit_width = bit_width
+        self._mask = (1 << bit_width) - 1
+        self._seed = seed & self._mask
+        self._reverse_input = reverse_input
+        self._reverse_output = reverse_output
+
+        # A bool stands for a final xor with all bits set.
+        if isinstance(final_xor, bool):
+            self._final_xor = self._mask if final_xor is True else 0
+        else:
+            self._final_xor = final_xor & self._mask
+
+        # A CRC smaller than a byte is calculated in the upper bits of a 8-bit register.
+        self._register_width = max(bit_width, 8)
+        self._register_shift = self._register_width - bit_width
+        self._register_mask = (1 << self._register_width) - 1
+        self._polynomial = (polynomial << self._register_shift) & self._register_mask
+
+        # Slicing-by-N is used, if the register is exactly N bytes wide.
+        self._slice_count = 1
+        if (self._register_width % 8) == 0 and (self._register_width // 8) in _SLICE_FORMATS:
+            self._slice_count = self._register_width // 8
+
+        # The lookup tables are retrieved on first use.
+        self._tables = None
+
+        # Is the parameter set natively supported?
+        self._native_update = None
+
+        # Does the calculation release the GIL, which allows to use threads?
+        self._is_gil_released = False
+
+        if use_native is True:
+            if (polynomial, bit_width) == _NATIVE_CRC32:
+                self._native_update = self._update_zlib
+                self._is_gil_released = True
+            elif (polynomial, bit_width) == _NATIVE_CRC_CCITT:
+                self._native_update = self._update_binascii
+
+    def calc(self, data, jobs=1):
+        """Calculate the CRC over the given data. With more than one job,
+            large data is split into chunks, which are calculated in parallel.
+            The result is the same like the sequential calculation.
+
+        Args:
+            data (bytes): Data
+            jobs (int, optional): Number of parallel jobs, 0 means one per
+                CPU core. Defaults to 1.
+
+        Returns:
+            int: CRC
+        """
+        register = self._seed << self._register_shift
+
+        if jobs == 0:
+            jobs = os.cpu_count()
+
+        if (jobs > 1) and (len(data) >= (2 * _PARALLEL_MIN_CHUNK_SIZE)):
+            register = self._feed_parallel(register, data, jobs)
+        else:
+            register = self.feed(register, data)
+
+        return self.finalize(register)
+
+    def feed(self, register, data):
+        """Feed input data into the CRC register. In contrast to update(),
+            the input data is reflected, if configured. The data is fed in
+            blocks, so the memory usage doesn't depend on its size.
+
+        Args:
+            register (int): Current CRC register value
+            data (bytes): Data
+
+        Returns:
+            int: Updated CRC register value
+        """
+        data = memoryview(data).cast("B")
+
+        for offset in range(0, len(data), _FEED_BLOCK_SIZE):
+            block = data[offset:offset + _FEED_BLOCK_SIZE]
+
+            if self._native_update is not None:
+                register = self._native_update(register, block)
+            else:
+                if self._reverse_input is True:
+                    block = bytes(block).translate(_REFLECT_BYTE_TABLE)
+
+                register = self.update(register, block)
+
+        return register
+
+    def combine(self, register, register_b, length_b):
+        """Combine the CRC register of the data A with the CRC register of
+            the following data B. The result is the same like feeding B
+            after A into the register.
+
+        Args:
+            register (int): CRC register value after feeding A
+            register_b (int): CRC register value after feeding B into a zero register
+            length_b (int): Number of bytes of B
+
+        Returns:
+            int: CRC register value of A followed by B
+        """
+        # Feeding zeros is linear, therefore the register after A is shifted
+        # over B and the register of B is added.
+        shift = _crc_get_x_pow(8 * length_b, self._polynomial, self._register_width)
+
+        return _crc_mul_mod(register, shift, self._polynomial, self._register_width) ^ register_b
+
+    def update(self, register, data):
+        """Feed data into the CRC register. The input data is used as it is,
+            means it is not reflected.
+
+        Args:
+            register (int): Current CRC register value
+            data (bytes): Data
+
+        Returns:
+            int: Updated CRC register value
+        """
+        sliced_length = 0
+
+        if self._tables is None:
+            self._tables = _crc_get_tables(self._polynomial, self._register_width, \
+                                           self._slice_count)
+
+        if self._slice_count > 1:
+            sliced_length = len(data) - (len(data) % self._slice_count)
+            register = self._update_sliced(register, data, sliced_length)
+
+        return self._update_bytewise(register, data, sliced_length)
+
+    def finalize(self, register):
+        """Get the CRC from the CRC register value. It considers the output
+            reflection and the final xor.
+
+        Args:
+            register (int): CRC register value
+
+        Returns:
+            int: CRC
+        """
+        crc = (register >> self._register_shift) & self._mask
+
+        if self._reverse_output is True:
+            crc = crc_reflect(crc, self._bit_width)
+
+        return crc ^ self._final_xor
+
+    def _feed_parallel(self, register, data, jobs):
+        chunk_size = max(_PARALLEL_MIN_CHUNK_SIZE, (len(data) + jobs - 1) // jobs)
+        data = memoryview(data)
+        chunks = [data[offset:offset + chunk_size] for offset in range(0, len(data), chunk_size)]
+
+        # zlib releases the GIL, all others are calculated by separate processes.
+        if self._is_gil_released is True:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                chunk_registers = list(executor.map(partial(self.feed, 0), chunks))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                chunk_registers = list(executor.map(_crc_feed_chunk, repeat(self._parameters), \
+                                                    [bytes(chunk) for chunk in chunks]))
+
+        for chunk, chunk_register in zip(chunks, chunk_registers):
+            register = self.combine(register, chunk_register, len(chunk))
+
+        return register
+
+    def _update_zlib(self, register, data):
+        # zlib calculates the reflected CRC-32 and inverts the register before
+        # and after the calculation. A not reflected input is therefore
+        # reflected in advance and the register is converted back and forth.
+        if self._reverse_input is False:
+            data = bytes(data).translate(_REFLECT_BYTE_TABLE)
+
+        value = zlib.crc32(data, crc_reflect(register, 32) ^ 0xFFFFFFFF)
+
+        return crc_reflect(value ^ 0xFFFFFFFF, 32)
+
+    def _update_binascii(self, register, data):
+        # binascii calculates the CRC-CCITT MSB first like the table driven engine.
+        if self._reverse_input is True:
+            data = bytes(data).translate(_REFLECT_BYTE_TABLE)
+
+        return binascii.crc_hqx(data, register)
+
+    def _update_bytewise(self, register, data, offset):
+        table = self._tables[0]
+        data = memoryview(data)[offset:]
+
+        if self._register_width == 8:
+            for byte in data:
+                register = table[register ^ byte]
+        else:
+            shift = self._register_width - 8
+            mask = self._register_mask
+
+            for byte in data:
+                register = ((register << 8) & mask) ^ table[((register >> shift) ^ byte) & 0xFF]
+
+        return register
+
+    # pylint: disable=too-many-locals, unbalanced-tuple-unpacking
+    def _update_sliced(self, register, data, length):
+        # The register width is the same as the slice width. Therefore every
+        # word replaces the whole register and each of its bytes is looked up
+        # in the table, which considers the number of following bytes.
+        word_count = length // self._slice_count
+        words = struct.unpack_from(_SLICE_FORMATS[self._slice_count][0] + str(word_count) + \
+                                   _SLICE_FORMATS[self._slice_count][1], data)
+
+        if self._slice_count == 2:
+            table_0, table_1 = self._tables
+
+            for word in words:
+                value = register ^ word
+                register = table_1[value >> 8] ^ table_0[value & 0xFF]
+
+        elif self._slice_count == 4:
+            table_0, table_1, table_2, table_3 = self._tables
+
+            for word in words:
+                value = register ^ word
+                register = table_3[value >> 24] ^ table_2[(value >> 16) & 0xFF] ^ \
+                    table_1[(value >> 8) & 0xFF] ^ table_0[value & 0xFF]
+
+        else:
+            table_0, table_1, table_2, table_3, table_4, table_5, table_6, table_7 = self._tables
+
+            for word in words:
+                value = register ^ word
+                register = table_7[value >> 56] ^ table_6[(value >> 48) & 0xFF] ^ \
+                    table_5[(value >> 40) & 0xFF] ^ table_4[(value >> 32) & 0xFF] ^ \
+                    table_3[(value >> 24) & 0xFF] ^ table_2[(value >> 16) & 0xFF] ^ \
+                    table_1[(value >> 8) & 0xFF] ^ table_0[value & 0xFF]
+
+        return register
+
+################################################################################
+# Functions
+################################################################################
+
+def crc_reflect(value, bit_width):
+    """Reflect the bits of a value.
+
+    Args:
+        value (int): Value
+        bit_width (int): Number of bits to reflect
+
+    Returns:
+        int: Reflected value
+    """
+    return int(f"{value:0{bit_width}b}"[::-1], 2)
+
+def crc_get_preset_names():
+    """Get the names of all CRC presets, including their aliases.
+
+    Returns:
+        list: Sorted preset names
+    """
+    return sorted(list(_CRC_PRESETS) + list(_CRC_PRESET_ALIASES))
+
+def crc_get_preset(name):
+    """Get a CRC preset by its name. The name is case insensitive.
+
+    Args:
+        name (str): Preset name, e.g. "CRC-32"
+
+    Returns:
+        CrcPreset: CRC preset or None if unknown.
+    """
+    name = name.upper()
+    name = _CRC_PRESET_ALIASES.get(name, name)
+
+    return _CRC_PRESETS.get(name, None)
+
+# pylint: disable=too-many-arguments
+def crc_get_parameters(preset_name, polynomial=None, bit_width=None, seed=None, \
+    reverse_input=None, reverse_output=None, final_xor=None):
+    """Get a complete CRC parameter set. Parameters, which are not given,
+        are taken from the preset.
+
+    Args:
+        preset_name (str): Preset name or None
+        polynomial (int, optional): Generator polynomial. Defaults to None.
+        bit_width (int, optional): Number of bits of the CRC. Defaults to None.
+        seed (int, optional): Seed value. Defaults to None.
+        reverse_input (bool, optional): Reflect each single input byte. Defaults to None.
+        reverse_output (bool, optional): Reflect the final CRC value. Defaults to None.
+        final_xor (bool|int, optional): Final xor. Defaults to None.
+
+    Raises:
+        ValueError: If the preset is unknown or a parameter is missing.
+
+    Returns:
+        tuple: polynomial, bit width, seed, reverse input, reverse output and final xor
+    """
+    parameters = [polynomial, bit_width, seed, reverse_input, reverse_output, final_xor]
+
+    if preset_name is not None:
+        preset = crc_get_preset(preset_name)
+
+        if preset is None:
+            raise ValueError(f"Unknown CRC preset {preset_name}.")
+
+        parameters = [preset[idx] if value is None else value \
+                      for idx, value in enumerate(parameters)]
+
+    if None in parameters:
+        raise ValueError("CRC parameter is missing.")
+
+    return tuple(parameters)
+
+# pylint: disable=too-many-arguments
+@lru_cache(maxsize=None, typed=True)
+def crc_get_engine(polynomial, bit_width, seed, reverse_input, reverse_output, final_xor, \
+    use_native=True):
+    """Get the CRC engine for a parameter set. The engines are cached, so
+        they and their lookup tables are created only once per process.
+
+    Args:
+        polynomial (int): Generator polynomial without the highest bit.
+        bit_width (int): Number of bits of the CRC.
+        seed (int): Seed value of the CRC register.
+        reverse_input (bool): Reflect each single input byte if True.
+        reverse_output (bool): Reflect the final CRC value if True.
+        final_xor (bool|int): Xor the final CRC value with all bits set if True
+            or with the given value.
+        use_native (bool, optional): Use the native implementation of the
+            Python standard library, if the parameter set is supported.
+            Defaults to True.
+
+    Returns:
+        Crc: CRC engine
+    """
+    # The cache is typed, because a final xor of True is different to 1.
+    return Crc(polynomial, bit_width, seed, reverse_input, reverse_output, final_xor, use_native)
+
+def _crc_feed_chunk(parameters, data):
+    """Feed a chunk of data into a zero CRC register. It runs in a worker
+        process, which creates its CRC engine once per parameter set.
+
+    Args:
+        parameters (tuple): Parameters of the CRC engine
+        data (bytes): Chunk of data
+
+    Returns:
+        int: CRC register value
+    """
+    return crc_get_engine(*parameters).feed(0, data)
+
+def _crc_mul_mod(value_a, value_b, polynomial, bit_width):
+    """Multiply two polynomials in GF(2) modulo the generator polynomial.
+
+    Args:
+        value_a (int): Polynomial A
+        value_b (int): Polynomial B
+        polynomial (int): Generator polynomial without the highest bit.
+        bit_width (int): Degree of the generator polynomial
+
+    Returns:
+        int: Product
+    """
+    msb_mask = 1 << (bit_width - 1)
+    mask = (1 << bit_width) - 1
+    product = 0
+
+    while value_a != 0:
+        if (value_a & 1) != 0:
+            product ^= value_b
+
+        value_a >>= 1
+
+        if (value_b & msb_mask) != 0:
+            value_b = ((value_b << 1) ^ polynomial) & mask
+        else:
+            value_b = (value_b << 1) & mask
+
+    return product
+
+@lru_cache(maxsize=None)
+def _crc_get_x_pow(exponent, polynomial, bit_width):
+    """Calculate x^exponent modulo the generator polynomial in GF(2) by
+        square and multiply. The results are cached, because the chunks
+        have mostly the same size.
+
+    Args:
+        exponent (int): Exponent
+        polynomial (int): Generator polynomial without the highest bit.
+        bit_width (int): Degree of the generator polynomial, at least 2.
+
+    Returns:
+        int: x^exponent modulo the generator polynomial
+    """
+    result = 1
+    base = 2 # x
+
+    while exponent != 0:
+        if (exponent & 1) != 0:
+            result = _crc_mul_mod(result, base, polynomial, bit_width)
+
+        base = _crc_mul_mod(base, base, polynomial, bit_width)
+        exponent >>= 1
+
+    return result
+
+@lru_cache(maxsize=None)
+def _crc_get_tables(polynomial, bit_width, slice_count):
+    """Calculate the lookup tables for the CRC calculation. The first table
+        is the classic byte wise table. Every following table considers one
+        more zero byte after the input byte, which is used for slicing-by-N.
+        The tables are cached, so they are calculated only once per parameter set.
+
+    Args:
+        polynomial (int): Generator polynomial without the highest bit.
+        bit_width (int): Number of bits of the CRC register, at least 8.
+        slice_count (int): Number of tables
+
+    Returns:
+        tuple: Lookup tables
+    """
+    mask = (1 << bit_width) - 1
+    msb_mask = 1 << (bit_width - 1)
+    shift = bit_width - 8
+    table = []
+
+    for byte in range(256):
+        register = byte << shift
+
+        for _ in range(8):
+            if (register & msb_mask) != 0:
+                register = ((register << 1) ^ polynomial) & mask
+            else:
+                register = (register << 1) & mask
+
+        table.append(register)
+
+    tables = [tuple(table)]
+
+    for _ in range(1, slice_count):
+        prev_table = tables[-1]
+        tables.append(tuple(((value << 8) & mask) ^ table[value >> shift]
+                            for value in prev_table))
+
+    return tuple(tables)
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,230 @@
+"""This module provides a registry of digests, which are calculated over
+    binary data besides the CRC, e.g. SHA-256 or a Fletcher checksum.
+    Every digest provides the hashlib interface: update() and hexdigest().
+    Several digests are calculated in a single pass over the data.
+"""
+
+# MIT License
+#
+# Copyright (c) 2022 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from functools import partial
+from itertools import accumulate
+import hashlib
+import struct
+import zlib
+
+################################################################################
+# Variables
+################################################################################
+
+# Number of bytes, which are fed into all digests at once. It is small
+# enough to stay in the CPU cache while every digest processes it.
+_CHUNK_SIZE = 64 * 1024
+
+################################################################################
+# Classes
+################################################################################
+
+class SumDigest():
+    """Additive checksum, which is the sum of all bytes modulo 2^bit width.
+    """
+    def __init__(self, bit_width):
+        """Initialize the additive checksum.
+
+        Args:
+            bit_width (int): Number of bits of the checksum
+        """
+        self._bit_width = bit_width
+        self._value = 0
+
+    def update(self, data):
+        """Feed data into the checksum.
+
+        Args:
+            data (bytes): Data
+        """
+        self._value = (self._value + sum(data)) & ((1 << self._bit_width) - 1)
+
+    def hexdigest(self):
+        """Get the checksum as hex string.
+
+        Returns:
+            str: Checksum
+        """
+        return f"{self._value:0{self._bit_width // 4}x}"
+
+class FletcherDigest():
+    """Fletcher checksum over 8-bit (Fletcher-16) or 16-bit little endian
+        words (Fletcher-32). A incomplete word at the end is padded with zero.
+    """
+    def __init__(self, bit_width):
+        """Initialize the Fletcher checksum.
+
+        Args:
+            bit_width (int): Number of bits of the checksum, 16 or 32.
+        """
+        self._bit_width = bit_width
+        self._word_size = bit_width // 16
+        self._modulo = (1 << (bit_width // 2)) - 1
+        self._sum_1 = 0
+        self._sum_2 = 0
+        self._pending = b""
+
+    def update(self, data):
+        """Feed data into the checksum.
+
+        Args:
+            data (bytes): Data
+        """
+        if len(self._pending) > 0:
+            data = self._pending + bytes(data)
+
+        word_count = len(data) // self._word_size
+        self._pending = bytes(data[word_count * self._word_size:])
+
+        if self._word_size == 1:
+            words = data[:word_count]
+        else:
+            words = struct.unpack_from(f"<{word_count}H", data)
+
+        # The second sum adds the first sum after every word, which is the
+        # sum of all prefix sums of this data.
+        self._sum_2 = (self._sum_2 + word_count * self._sum_1 + sum(accumulate(words))) \
+            % self._modulo
+        self._sum_1 = (self._sum_1 + sum(words)) % self._modulo
+
+    def hexdigest(self):
+        """Get the checksum as hex string.
+
+        Returns:
+            str: Checksum
+        """
+        sum_1 = self._sum_1
+        sum_2 = self._sum_2
+
+        if len(self._pending) > 0:
+            word = int.from_bytes(self._pending, byteorder="little")
+            sum_1 = (sum_1 + word) % self._modulo
+            sum_2 = (sum_2 + sum_1) % self._modulo
+
+        return f"{(sum_2 << (self._bit_width // 2)) | sum_1:0{self._bit_width // 4}x}"
+
+class AdlerDigest():
+    """Adler-32 checksum, calculated by zlib.
+    """
+    def __init__(self):
+        """Initialize the Adler-32 checksum.
+        """
+        self._value = zlib.adler32(b"")
+
+    def update(self, data):
+        """Feed data into the checksum.
+
+        Args:
+            data (bytes): Data
+        """
+        self._value = zlib.adler32(data, self._value)
+
+    def hexdigest(self):
+        """Get the checksum as hex string.
+
+        Returns:
+            str: Checksum
+        """
+        return f"{self._value:08x}"
+
+################################################################################
+# Functions
+################################################################################
+
+# Factories of all digests by name. Every factory returns a new digest object.
+_DIGESTS = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "md5": hashlib.md5,
+    "sum8": partial(SumDigest, 8),
+    "sum16": partial(SumDigest, 16),
+    "sum32": partial(SumDigest, 32),
+    "fletcher16": partial(FletcherDigest, 16),
+    "fletcher32": partial(FletcherDigest, 32),
+    "adler32": AdlerDigest
+}
+
+def digest_register(name, factory):
+    """Register a digest. A already registered digest with the same name
+        is replaced.
+
+    Args:
+        name (str): Name of the digest, e.g. "sha512".
+        factory (function): Function without arguments, which returns a new
+            digest object with the methods update() and hexdigest().
+    """
+    _DIGESTS[name.lower()] = factory
+
+def digest_get_names():
+    """Get the names of all registered digests.
+
+    Returns:
+        list: Sorted digest names
+    """
+    return sorted(_DIGESTS)
+
+def digest_calc(data, names):
+    """Calculate several digests over the same data in a single pass.
+        The data is fed in chunks to all of them, without copying it.
+
+    Args:
+        data (bytes): Data, e.g. a memoryview of the binary image.
+        names (list): Digest names
+
+    Raises:
+        ValueError: If a digest is unknown.
+
+    Returns:
+        dict: Hex string of every digest by its name
+    """
+    digests = {}
+
+    for name in names:
+        factory = _DIGESTS.get(name.lower(), None)
+
+        if factory is None:
+            raise ValueError(f"Unknown digest {name}.")
+
+        digests[name] = factory()
+
+    data = memoryview(data).cast("B")
+
+    for offset in range(0, len(data), _CHUNK_SIZE):
+        chunk = data[offset:offset + _CHUNK_SIZE]
+
+        for digest in digests.values():
+            digest.update(chunk)
+
+    return {name: digest.hexdigest() for name, digest in digests.items()}
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,340 @@
+"""Layout plan
+    A layout plan is the compiled form of a configuration. It is a flat and
+    immutable list of all built-in elements with their absolute address,
+    which is independent of the binary data. It is cached on disk, keyed by
+    the content of the configuration file, together with the warnings of
+    the configuration, which are printed again on every load.
+"""
+
+# MIT License
+#
+# Copyright (c) 2022 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+from collections import namedtuple
+import contextlib
+import hashlib
+import io
+import json
+import os
+from pyHexDump.constants import Ret
+from pyHexDump.config_model import ConfigModel
+from pyHexDump.config_element import PaddingElement
+from pyHexDump.mem_access import mem_access_get_decoder
+from pyHexDump.version import __version__
+
+################################################################################
+# Variables
+################################################################################
+
+# Increase it if the layout plan format changes, to invalidate the cached plans.
+_LAYOUT_PLAN_FORMAT = 3
+
+# Sub directory in the cache directory.
+_CACHE_SUB_DIR = "layout_plan"
+
+# A single built-in element of the layout plan.
+# path: Keys to the element in the template element dictionary.
+# name: Full element name.
+# addr: Absolute address.
+# data_type: Built-in data type.
+# count: Number of values.
+# stride: Distance between two values in byte.
+LayoutEntry = namedtuple("LayoutEntry", ["path", "name", "addr", "data_type", "count", "stride"])
+
+# A array of structures, whose layout entries are located one after another
+# in the layout plan, structure by structure. Nested arrays are part of the
+# outermost one.
+# first_entry: Index of the first layout entry of the first structure.
+# entry_count: Number of layout entries per structure.
+# addr: Absolute address of the first structure.
+# count: Number of structures.
+# size: Size of a single structure in byte.
+StructureArray = namedtuple("StructureArray", ["first_entry", "entry_count", "addr", "count", \
+                                               "size"])
+
+################################################################################
+# Classes
+################################################################################
+
+class LayoutPlan():
+    """The layout plan holds all built-in elements of a configuration in
+        the order they are defined.
+    """
+    def __init__(self, entries, structure_arrays=(), warnings=""):
+        """Initialize the layout plan.
+
+        Args:
+            entries (iterable): Layout entries
+            structure_arrays (iterable, optional): Arrays of structures. Defaults to ().
+            warnings (str, optional): Warnings of the configuration. Defaults to "".
+        """
+        self._entries = tuple(entries)
+        self._structure_arrays = tuple(structure_arrays)
+        self._warnings = warnings
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def get(self):
+        """Get all layout entries.
+
+        Returns:
+            tuple: Layout entries
+        """
+        return self._entries
+
+    def get_structure_arrays(self):
+        """Get the arrays of structures.
+
+        Returns:
+            tuple: Structure arrays
+        """
+        return self._structure_arrays
+
+    def get_warnings(self):
+        """Get the warnings, which were printed while loading the configuration.
+
+        Returns:
+            str: Warnings, one per line
+        """
+        return self._warnings
+
+    def to_list(self):
+        """Convert the layout plan to a list, which can be stored in JSON format.
+
+        Returns:
+            list: Layout entries as lists, structure arrays as lists and warnings
+        """
+        entry_list = [[list(entry.path), entry.name, entry.addr, entry.data_type, entry.count, \
+            entry.stride] for entry in self._entries]
+
+        return [entry_list, [list(structure_array) for structure_array in self._structure_arrays], \
+                self._warnings]
+
+    @staticmethod
+    def from_list(plan_list):
+        """Create a layout plan from a list, see to_list().
+
+        Args:
+            plan_list (list): Layout entries as lists, structure arrays as lists and warnings
+
+        Returns:
+            LayoutPlan: Layout plan
+        """
+        entry_list, structure_array_list, warnings = plan_list
+
+        return LayoutPlan((LayoutEntry(tuple(item[0]), *item[1:]) for item in entry_list),
+                          (StructureArray(*item) for item in structure_array_list),
+                          warnings)
+
+################################################################################
+# Functions
+################################################################################
+
+def _compile_config_elements(cfg_elements_dict, path, offset, entries, structure_arrays):
+    """Add the built-in elements of the configuration elements to the layout
+        entries. Structures are resolved recursively.
+
+    Args:
+        cfg_elements_dict (dict): Configuration element objects
+        path (tuple): Keys of the parent structure
+        offset (int): Offset in the binary data
+        entries (list): Layout entries, where to add the elements.
+        structure_arrays (list): Structure arrays, where to add the arrays
+            of structures. None inside a array of structures.
+
+    Raises:
+        TypeError: If a data type is invalid.
+    """
+    for key, cfg_element in cfg_elements_dict.items():
+
+        # Padding element?
+        if isinstance(cfg_element, PaddingElement):
+            continue
+
+        # Built-in type?
+        if cfg_element.elements is None:
+            decoder = mem_access_get_decoder(cfg_element.data_type)
+
+            if decoder is None:
+                raise TypeError(f"Invalid type {cfg_element.data_type}.")
+
+            entries.append(LayoutEntry(path + (key,),
+                                       cfg_element.name,
+                                       cfg_element.addr + offset,
+                                       cfg_element.data_type,
+                                       cfg_element.count,
+                                       decoder.get_size()))
+
+        # Single structure?
+        elif cfg_element.count == 1:
+            _compile_config_elements(cfg_element.elements, path + (key,), offset, entries, \
+                                     structure_arrays)
+
+        # List of elements with the same structure?
+        elif cfg_element.count > 1:
+            single_cfg_element_size = cfg_element.size // cfg_element.count
+            first_entry = len(entries)
+
+            for idx in range(cfg_element.count):
+                extended_key = key + "._" + str(idx) + "_"
+                _compile_config_elements(cfg_element.elements,
+                                         path + (extended_key,),
+                                         idx * single_cfg_element_size + offset,
+                                         entries,
+                                         None)
+
+            entry_count = (len(entries) - first_entry) // cfg_element.count
+
+            if (structure_arrays is not None) and (entry_count > 0):
+                structure_arrays.append(StructureArray(first_entry,
+                                                       entry_count,
+                                                       cfg_element.addr + offset,
+                                                       cfg_element.count,
+                                                       single_cfg_element_size))
+
+def layout_plan_compile(cfg_elements_dict, warnings=""):
+    """Compile the configuration elements to a layout plan.
+
+    Args:
+        cfg_elements_dict (dict): Configuration element objects
+        warnings (str, optional): Warnings of the configuration. Defaults to "".
+
+    Returns:
+        LayoutPlan: Layout plan
+    """
+    entries = []
+    structure_arrays = []
+    _compile_config_elements(cfg_elements_dict, (), 0, entries, structure_arrays)
+
+    return LayoutPlan(entries, structure_arrays, warnings)
+
+def _get_cache_file_name(cache_dir, config_content):
+    """Get the file name of the cached layout plan for the given configuration.
+
+    Args:
+        cache_dir (str): Cache directory
+        config_content (bytes): Content of the configuration file
+
+    Returns:
+        str: Cache file name
+    """
+    hash_obj = hashlib.sha256()
+    hash_obj.update(f"{__version__}:{_LAYOUT_PLAN_FORMAT}:".encode("utf-8"))
+    hash_obj.update(config_content)
+
+    return os.path.join(cache_dir, _CACHE_SUB_DIR, hash_obj.hexdigest() + ".json")
+
+def _load_cached_layout_plan(cache_file_name):
+    """Load a cached layout plan.
+
+    Args:
+        cache_file_name (str): Cache file name
+
+    Returns:
+        LayoutPlan: Layout plan or None if not available.
+    """
+    layout_plan = None
+
+    try:
+        with open(cache_file_name, encoding="utf-8") as file_descriptor:
+            layout_plan = LayoutPlan.from_list(json.load(file_descriptor))
+    except (OSError, ValueError, TypeError, IndexError):
+        # Not cached yet or invalid, which is handled like not cached.
+        layout_plan = None
+
+    return layout_plan
+
+def _store_cached_layout_plan(cache_file_name, layout_plan):
+    """Store the layout plan in the cache. A failure is ignored, because
+        the cache is only a optimization.
+
+    Args:
+        cache_file_name (str): Cache file name
+        layout_plan (LayoutPlan): Layout plan
+    """
+    tmp_file_name = f"{cache_file_name}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+
+        with open(tmp_file_name, "w", encoding="utf-8") as file_descriptor:
+            json.dump(layout_plan.to_list(), file_descriptor)
+
+        # Replace it atomically, because other processes may read it in parallel.
+        os.replace(tmp_file_name, cache_file_name)
+    except OSError:
+        pass
+
+def layout_plan_load(config_file, cache_dir=None):
+    """Load the layout plan of a configuration file. If a cache directory is
+        given, the compiled layout plan is taken from there if available,
+        otherwise it is compiled and stored there.
+
+        The warnings of the configuration are printed on every load, also
+        if the layout plan is taken from the cache.
+
+    Args:
+        config_file (str): File name of the configuration file
+        cache_dir (str, optional): Cache directory. Defaults to None.
+
+    Returns:
+        Ret, LayoutPlan: Status information and layout plan
+    """
+    layout_plan = None
+    cache_file_name = None
+
+    try:
+        with open(config_file, "rb") as file_descriptor:
+            config_content = file_descriptor.read()
+    except FileNotFoundError:
+        return Ret.ERROR_CONFIG_FILE_NOT_FOUND, None
+
+    if cache_dir is not None:
+        cache_file_name = _get_cache_file_name(cache_dir, config_content)
+        layout_plan = _load_cached_layout_plan(cache_file_name)
+
+    if layout_plan is None:
+        config_model = ConfigModel()
+        warnings = io.StringIO()
+
+        # The configuration model prints its warnings, which are kept for the cache.
+        with contextlib.redirect_stdout(warnings):
+            config_model.load_from_dict(json.loads(config_content))
+
+        layout_plan = layout_plan_compile(config_model.get(), warnings.getvalue())
+
+        if cache_file_name is not None:
+            _store_cached_layout_plan(cache_file_name, layout_plan)
+
+    print(layout_plan.get_warnings(), end="")
+
+    return Ret.OK, layout_plan
+
+################################################################################
+# Main
+################################################################################
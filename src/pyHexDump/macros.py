@@ -25,8 +25,9 @@
 ################################################################################
 # Imports
 ################################################################################
-from pyHexDump.mem_access import mem_access_get_api_by_data_type
-from pyHexDump.cmd_checksum import calc_checksum
+from collections import OrderedDict
+from pyHexDump.mem_access import mem_access_get_decoder, mem_access_read_string
+from pyHexDump.cmd_checksum import calc_checksum, calc_digests
 
 ################################################################################
 # Variables
@@ -34,14 +35,118 @@ from pyHexDump.cmd_checksum import calc_checksum
 
 BINARY_DATA = None
 
+# Maximum number of macro results, which are cached per binary data.
+_MACRO_CACHE_SIZE = 4096
+
 ################################################################################
 # Classes
 ################################################################################
 
+class MacroCache():
+    """Size bounded cache of macro results with least recently used eviction.
+        Templates call the macros often with the same arguments, e.g. in loops,
+        which are calculated only once this way.
+
+        Unhashable arguments like lists are converted to a hashable key. If
+        that is not possible, the result is calculated without cache and
+        counted as bypass. The macros add the binary data to every key.
+    """
+    def __init__(self, max_size):
+        """Initialize the macro cache.
+
+        Args:
+            max_size (int): Maximum number of cached results
+        """
+        self._max_size = max_size
+        self._results = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+
+    def clear(self):
+        """Remove all cached results and reset the statistics.
+        """
+        self._results.clear()
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+
+    def get(self, key, func, *args):
+        """Get the cached result of the key or call the function to get it.
+            Exceptions are not cached.
+
+        Args:
+            key (tuple): Key, which identifies the macro and its arguments.
+            func (function): Function, which provides the result.
+            args: Arguments of the function
+
+        Returns:
+            any: Result
+        """
+        try:
+            hash(key)
+        except TypeError:
+            key = _get_hashable(key)
+
+        try:
+            result = self._results[key]
+            self._results.move_to_end(key)
+            self._hits += 1
+
+        except KeyError:
+            result = func(*args)
+            self._misses += 1
+            self._results[key] = result
+
+            if len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+
+        except TypeError:
+            # The key contains a value, which can't be made hashable.
+            result = func(*args)
+            self._bypasses += 1
+
+        return result
+
+    def get_statistics(self):
+        """Get the cache statistics.
+
+        Returns:
+            int, int, int: Number of hits, misses and bypasses
+        """
+        return self._hits, self._misses, self._bypasses
+
+_MACRO_CACHE = MacroCache(_MACRO_CACHE_SIZE)
+
 ################################################################################
 # Functions
 ################################################################################
 
+def _get_hashable(value):
+    """Convert lists, dictionaries, sets and bytearrays recursively to a
+        hashable equivalent. The type is part of it, so e.g. a list and a
+        tuple with the same items are different.
+
+    Args:
+        value (any): Value
+
+    Returns:
+        any: Hashable value, if all contained values are hashable.
+    """
+    if isinstance(value, (list, tuple)):
+        return (type(value),) + tuple(_get_hashable(item) for item in value)
+
+    if isinstance(value, dict):
+        return (dict,) + tuple((key, _get_hashable(item)) for key, item in value.items())
+
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_get_hashable(item) for item in value))
+
+    if isinstance(value, bytearray):
+        return (bytearray, bytes(value))
+
+    return value
+
 def _compare_values(set_value, actual_value, value_format="{:02X}"):
     """Compares the set_value and the actual_value.
 
@@ -106,11 +211,16 @@ def _u32_swap_words(u32_value):
     result |= (u32_value & 0xFFFF0000) >> 16
     return result
 
+def _read_uncached(addr, data_type):
+    binary_data = globals()["BINARY_DATA"]
+    return mem_access_get_decoder(data_type).decode(binary_data, addr)
+
 def _read(addr, data_type):
-    mem_access = mem_access_get_api_by_data_type(data_type)
     binary_data = globals()["BINARY_DATA"]
-    mem_access.set_binary_data(binary_data)
-    return mem_access.get_value(addr)
+    # The binary data is part of every cache key, so a cached result can never
+    # belong to other binary data, even if the cache was not cleared.
+    return _MACRO_CACHE.get(("read", binary_data, addr, data_type), \
+                            _read_uncached, addr, data_type)
 
 def _read_u8(addr):
     return _read(addr, "uint8")
@@ -166,40 +276,58 @@ def _read_float64le(addr):
 def _read_float64be(addr):
     return _read(addr, "float64be")
 
-def _read_string(addr, encoding="utf-8"):
-    value_list = []
-    idx = 0
-    while True:
-        value = _read_u8(addr + idx)
-        if value == 0:
-            break
-        value_list.append(value)
-        idx += 1
-
-    byte_values = bytearray(value_list)
+def _read_string(addr, encoding="utf-8", max_length=None, is_terminated=True):
+    binary_data = globals()["BINARY_DATA"]
+    return _MACRO_CACHE.get(("read_string", binary_data, addr, encoding, max_length, \
+                             is_terminated), _read_string_uncached, addr, encoding, max_length, is_terminated)
 
-    return byte_values.decode(encoding)
+def _read_string_uncached(addr, encoding, max_length, is_terminated):
+    binary_data = globals()["BINARY_DATA"]
+    return mem_access_read_string(binary_data, addr, max_length, encoding, is_terminated)
 
 # pylint: disable=too-many-arguments
-def _calc_checksum(binary_data_endianess, start_address, end_address, polynomial, bit_width, seed, \
-    reverse_input, reverse_output, final_xor):
+def _calc_checksum(binary_data_endianess, start_address, end_address, polynomial=None, \
+    bit_width=None, seed=None, reverse_input=None, reverse_output=None, final_xor=None, \
+    preset=None):
+
+    binary_data = globals()["BINARY_DATA"]
+    parameters = (binary_data, binary_data_endianess, start_address, end_address, polynomial, \
+                  bit_width, seed, reverse_input, reverse_output, final_xor, preset)
+
+    # The parameters are typed in the key, because a final xor of True is different to 1.
+    key = ("calc_checksum",) + parameters + (type(final_xor),)
+
+    return _MACRO_CACHE.get(key, calc_checksum, *parameters)
+
+def _calc_digest(name, start_address, end_address):
 
     binary_data = globals()["BINARY_DATA"]
-    # pylint: disable=too-many-function-args
-    checksum = calc_checksum(binary_data, binary_data_endianess, start_address, end_address, \
-                             polynomial, bit_width, seed, reverse_input, reverse_output, \
-                             final_xor)
+    digests = _MACRO_CACHE.get(("calc_digest", binary_data, name, start_address, end_address), \
+                               calc_digests, binary_data, [name], start_address, end_address)
 
-    return checksum
+    return digests[name]
 
 def set_binary_data(binary_data):
     """Set the binary data to be used by all macros. This avoids to spawn the binary data
         access into the template.
 
+    The cached macro results belong to the previous binary data, therefore
+    they are removed.
+
     Args:
-        binary_data (IntelHex): Binary data
+        binary_data (IntelHex|BinaryImage): Binary data
     """
     globals()["BINARY_DATA"] = binary_data
+    _MACRO_CACHE.clear()
+
+def get_macro_cache_statistics():
+    """Get the statistics of the macro cache since the binary data was set.
+        A bypass is a call with arguments, which can't be used as cache key.
+
+    Returns:
+        int, int, int: Number of hits, misses and bypasses
+    """
+    return _MACRO_CACHE.get_statistics()
 
 def get_macro_dict():
     """Get the macro dictionary. The macros will be supported inside the template
@@ -236,6 +364,7 @@ def get_macro_dict():
     macro_dict["m_read_string"] = _read_string
 
     macro_dict["m_calc_checksum"] = _calc_checksum
+    macro_dict["m_calc_digest"] = _calc_digest
 
     macro_dict["m_swap_bytes_u16"] = _u16_swap_bytes # Used for LE/BE conversion
     macro_dict["m_swap_bytes_u32"] = _u32_swap_bytes # Used for LE/BE conversion
@@ -26,16 +26,268 @@
 # Imports
 ################################################################################
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from types import MappingProxyType
+import array
+import codecs
+import copy
 import struct
+import sys
+from pyHexDump.binary_image import binary_image_get_bytes
+
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional, without it all values are decoded by struct.
+    numpy = None
 
 ################################################################################
 # Variables
 ################################################################################
 
+# Number of bytes, which are read at once by a string without max. length.
+# It is a multiple of every code unit size.
+_STRING_CHUNK_SIZE = 256
+
+# NumPy type kind by struct format character.
+_NUMPY_TYPE_KINDS = {
+    "B": "u",
+    "H": "u",
+    "I": "u",
+    "Q": "u",
+    "b": "i",
+    "h": "i",
+    "i": "i",
+    "q": "i",
+    "f": "f",
+    "d": "f"
+}
+
 ################################################################################
 # Classes
 ################################################################################
 
+class Decoder():
+    """Stateless decoder of values with a specific struct format.
+        It is immutable and shared by all memory accesses of the same data
+        type, therefore it is safe to use it by several threads. The binary
+        data is given per call.
+    """
+    def __init__(self, size_byte, is_little_endian, format_char, default_value):
+        """Initialize the decoder.
+
+        Args:
+            size_byte (int): Data type size in byte
+            is_little_endian (bool): True for little endian, otherwise big endian.
+            format_char (str): Struct format character or None if not supported.
+            default_value (int|float): Value, if there is no binary data.
+        """
+        self._size_byte = size_byte
+        self._format_char = format_char
+        self._default_value = default_value
+        self._byte_order = "<" if is_little_endian is True else ">"
+        self._struct = None
+        self._numpy_type = None
+        self._typecode = None
+
+        # Precompile the struct, which is used to decode a single value.
+        if format_char is not None:
+            self._struct = struct.Struct(self._byte_order + format_char)
+            self._numpy_type = self._byte_order + _NUMPY_TYPE_KINDS[format_char] + str(size_byte)
+            self._typecode = _get_array_typecode(format_char, size_byte)
+
+    def _check_support(self):
+        """Check whether the decoder supports the data type. The base decoder
+            supports all data types with a struct format.
+        """
+
+    def decode(self, binary_data, addr):
+        """Decode a single value from the binary data at the given address.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): Binary data or None
+            addr (int): Address of the value
+
+        Returns:
+            int|float: Value
+        """
+        self._check_support()
+
+        if binary_data is None:
+            return self._default_value
+
+        return self._struct.unpack_from(binary_image_get_bytes(binary_data, addr, \
+                                                               self._size_byte))[0]
+
+    def decode_values(self, binary_data, addr, count):
+        """Decode a number of consecutive values from the binary data, starting
+            at the given address. All values are decoded at once.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): Binary data or None
+            addr (int): Address of the first value
+            count (int): Number of values
+
+        Returns:
+            list: Values
+        """
+        self._check_support()
+
+        if binary_data is None:
+            return [self._default_value] * count
+
+        values_format = self._byte_order + str(count) + self._format_char
+        data = binary_image_get_bytes(binary_data, addr, count * self._size_byte)
+
+        return list(struct.unpack_from(values_format, data))
+
+    def decode_value_array(self, binary_data, addr, count):
+        """Decode a number of consecutive values to a array.array, starting
+            at the given address. It stores the values without boxing them,
+            which needs much less memory than a list.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): Binary data or None
+            addr (int): Address of the first value
+            count (int): Number of values
+
+        Returns:
+            array.array|list: Values; a list if there is no array typecode
+                with the data type size on this platform.
+        """
+        self._check_support()
+
+        if self._typecode is None:
+            return self.decode_values(binary_data, addr, count)
+
+        if binary_data is None:
+            return array.array(self._typecode, [self._default_value]) * count
+
+        values = array.array(self._typecode)
+        values.frombytes(binary_image_get_bytes(binary_data, addr, count * self._size_byte))
+
+        if self.is_little_endian() != (sys.byteorder == "little"):
+            values.byteswap()
+
+        return values
+
+    def decode_array(self, binary_data, addr, count):
+        """Decode a number of consecutive values to a NumPy array, starting at
+            the given address. If the values are located in a single segment,
+            the read-only array refers to the binary data without copying it.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): Binary data or None
+            addr (int): Address of the first value
+            count (int): Number of values
+
+        Raises:
+            NotImplementedError: If NumPy is not available.
+
+        Returns:
+            numpy.ndarray: Values
+        """
+        self._check_support()
+
+        if numpy is None:
+            raise NotImplementedError("NumPy is not available.")
+
+        if binary_data is None:
+            return numpy.full(count, self._default_value, dtype=self._numpy_type)
+
+        data = binary_image_get_bytes(binary_data, addr, count * self._size_byte)
+
+        return numpy.frombuffer(data, dtype=self._numpy_type, count=count)
+
+    def get_numpy_type(self):
+        """Get the NumPy type string of the data type, e.g. "<u2".
+
+        Returns:
+            str: NumPy type string or None if not supported.
+        """
+        return self._numpy_type
+
+    def get_size(self):
+        """Get the data type size in byte.
+
+        Returns:
+            int: Data type size in byte
+        """
+        return self._size_byte
+
+    def is_little_endian(self):
+        """Is the data in little endian?
+
+        Returns:
+            bool: True for little endian, otherwise big endian.
+        """
+        return self._byte_order == "<"
+
+class IntegerDecoder(Decoder):
+    """Stateless decoder of integer values.
+    """
+
+    # Struct format character by data type size in byte
+    _FORMAT_CHARS = {
+        1: "B",
+        2: "H",
+        4: "I",
+        8: "Q"
+    }
+
+    def __init__(self, bit_width, is_little_endian, is_unsigned):
+        """Initialize the integer decoder.
+
+        Args:
+            bit_width (int): Bit width of the integer
+            is_little_endian (bool): True for little endian, otherwise big endian.
+            is_unsigned (bool): True for unsigned, otherwise signed.
+        """
+        format_char = self._FORMAT_CHARS[bit_width // 8]
+
+        if is_unsigned is False:
+            format_char = format_char.lower()
+
+        super().__init__(bit_width // 8, is_little_endian, format_char, 0)
+        self._is_unsigned = is_unsigned
+
+    def is_unsigned(self):
+        """Is the data unsigned?
+
+        Returns:
+            bool: True for unsigned, otherwise signed.
+        """
+        return self._is_unsigned
+
+class FloatDecoder(Decoder):
+    """Stateless decoder of float values.
+    """
+
+    # Struct format character by data type size in byte
+    _FORMAT_CHARS = {
+        4: "f",
+        8: "d"
+    }
+
+    def __init__(self, bit_width, is_little_endian):
+        """Initialize the float decoder.
+
+        Args:
+            bit_width (int): Bit width of the float
+            is_little_endian (bool): True for little endian, otherwise big endian.
+        """
+        super().__init__(bit_width // 8, is_little_endian,
+                         self._FORMAT_CHARS.get(bit_width // 8, None), 0.0)
+
+    def _check_support(self):
+        """Check whether the bit width is supported.
+
+        Raises:
+            NotImplementedError: If the bit width is not supported.
+        """
+        if self._struct is None:
+            raise NotImplementedError(f"Unsupported bit width of {self._size_byte * 8} for float")
+
 class IMemAccess(ABC):
     """Abstract memory access
 
@@ -48,7 +300,7 @@ class IMemAccess(ABC):
         """Set binary data which to access.
 
         Args:
-            binary_data (IntelHex): Binary data
+            binary_data (IntelHex|BinaryImage): Binary data
 
         Raises:
             NotImplementedError: Subclass implementation is missing.
@@ -82,6 +334,39 @@ class IMemAccess(ABC):
         """
         raise NotImplementedError("Subclass implementation missing.")
 
+    @abstractmethod
+    def get_values(self, addr, count):
+        """Get a number of consecutive values from the binary data, starting
+            at the given address.
+
+        Args:
+            addr (int): Address of the first value
+            count (int): Number of values
+
+        Raises:
+            NotImplementedError: Subclass implementation is missing.
+
+        Returns:
+            list: Values
+        """
+        raise NotImplementedError("Subclass implementation missing.")
+
+    @abstractmethod
+    def get_bytes(self, addr, length):
+        """Get the raw bytes from the binary data, starting at the given address.
+
+        Args:
+            addr (int): Start address
+            length (int): Number of bytes
+
+        Raises:
+            NotImplementedError: Subclass implementation is missing.
+
+        Returns:
+            memoryview|bytes: Raw bytes
+        """
+        raise NotImplementedError("Subclass implementation missing.")
+
     @abstractmethod
     def get_size(self):
         """Get the data type size in byte.
@@ -94,35 +379,64 @@ class IMemAccess(ABC):
         """
         raise NotImplementedError("Subclass implementation missing.")
 
-class MemAccessInteger(IMemAccess):
-    """Base class which realizes the abstract memory access interfaces
-        for integer values.
+class MemAccess(IMemAccess):
+    """Memory access, which binds the binary data to a shared decoder.
+        It is a cheap view, which holds no further state.
 
     Args:
         IMemAccess (obj): Abstract base class
     """
-    def __init__(self, binary_data, bit_width, is_little_endian, is_unsigned):
+    def __init__(self, binary_data, decoder):
         super().__init__()
         self._binary_data = binary_data
-        self._size_byte = bit_width // 8
-        self._is_little_endian = is_little_endian
-        self._is_unsigned = is_unsigned
+        self._decoder = decoder
+
+    def bind(self, binary_data):
+        """Get a memory access of the same data type for other binary data.
+            The memory access itself is not changed.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): Binary data
+
+        Returns:
+            MemAccess: Memory access
+        """
+        mem_access = copy.copy(self)
+        mem_access.set_binary_data(binary_data)
+
+        return mem_access
+
+    def get_decoder(self):
+        """Get the shared decoder.
+
+        Returns:
+            Decoder: Decoder
+        """
+        return self._decoder
 
     def set_binary_data(self, binary_data):
         """Set binary data which to access.
 
         Args:
-            binary_data (IntelHex): Binary data
+            binary_data (IntelHex|BinaryImage): Binary data
         """
         self._binary_data = binary_data
 
     def _set_endianess(self, is_little_endian):
-        """Set endianess of data which to access.
+        """Set endianess of data which to access. The shared decoder is not
+            changed, instead the shared decoder with the requested endianess
+            is used.
 
         Args:
             is_little_endian (bool): True for little endian, otherwise big endian.
         """
-        self._is_little_endian = is_little_endian
+        bit_width = self._decoder.get_size() * 8
+
+        if isinstance(self._decoder, FloatDecoder):
+            self._decoder = _get_float_decoder(bit_width, is_little_endian)
+        else:
+            self._decoder = _get_integer_decoder(bit_width, is_little_endian, \
+                                                 self._decoder.is_unsigned())
 
     def get_value(self, addr):
         """Get value from the binary data at the given address.
@@ -131,21 +445,80 @@ class MemAccessInteger(IMemAccess):
             addr (int): Address of the value
 
         Returns:
-            int: Value
+            int|float: Value
         """
-        value = 0
-        if self._is_little_endian is True:
-            if self._is_unsigned is True:
-                value = self._get_value_uxle(self._binary_data, addr, self._size_byte)
-            else:
-                value = self._get_value_sxle(self._binary_data, addr, self._size_byte)
-        else:
-            if self._is_unsigned is True:
-                value = self._get_value_uxbe(self._binary_data, addr, self._size_byte)
-            else:
-                value = self._get_value_sxbe(self._binary_data, addr, self._size_byte)
+        return self._decoder.decode(self._binary_data, addr)
+
+    def get_values(self, addr, count):
+        """Get a number of consecutive values from the binary data, starting
+            at the given address. All values are decoded at once.
 
-        return value
+        Args:
+            addr (int): Address of the first value
+            count (int): Number of values
+
+        Returns:
+            list: Values
+        """
+        return self._decoder.decode_values(self._binary_data, addr, count)
+
+    def get_value_array(self, addr, count):
+        """Get a number of consecutive values from the binary data as
+            array.array, starting at the given address.
+
+        Args:
+            addr (int): Address of the first value
+            count (int): Number of values
+
+        Returns:
+            array.array|list: Values
+        """
+        return self._decoder.decode_value_array(self._binary_data, addr, count)
+
+    def get_array(self, addr, count):
+        """Get a number of consecutive values from the binary data as NumPy
+            array, starting at the given address. Requires NumPy.
+
+        Args:
+            addr (int): Address of the first value
+            count (int): Number of values
+
+        Returns:
+            numpy.ndarray: Values
+        """
+        return self._decoder.decode_array(self._binary_data, addr, count)
+
+    def get_bytes(self, addr, length):
+        """Get the raw bytes from the binary data, starting at the given address.
+            Addresses without data are filled with padding.
+
+        Args:
+            addr (int): Start address
+            length (int): Number of bytes
+
+        Returns:
+            memoryview|bytes: Raw bytes
+        """
+        return binary_image_get_bytes(self._binary_data, addr, length)
+
+    def get_string(self, addr, max_length=None, encoding="utf-8", is_terminated=True):
+        """Get a string from the binary data, starting at the given address.
+            See mem_access_read_string().
+
+        Args:
+            addr (int): Start address
+            max_length (int, optional): Max. string length in byte or None
+                for no limit. Defaults to None.
+            encoding (str, optional): String encoding. Defaults to "utf-8".
+            is_terminated (bool, optional): If True, the string ends with a zero
+                code unit or at the max. length. If False, it is a field with
+                fixed length (max. length) without termination. Defaults to True.
+
+        Returns:
+            str: String
+        """
+        return mem_access_read_string(self._binary_data, addr, max_length, encoding, \
+                                      is_terminated)
 
     def get_size(self):
         """Get the data type size in byte.
@@ -153,173 +526,355 @@ class MemAccessInteger(IMemAccess):
         Returns:
             int: Data type size in byte
         """
-        return self._size_byte
+        return self._decoder.get_size()
 
-    def _get_value_uxle(self, intel_hex, addr, size):
-        value = 0
+    def is_little_endian(self):
+        """Is the data in little endian?
 
-        if intel_hex is not None:
-            if size == 1:
-                value = intel_hex[addr]
-            elif size > 1:
-                for offset in range(size - 1, -1, -1):
-                    value <<= 8
-                    value += intel_hex[addr + offset]
+        Returns:
+            bool: True for little endian, otherwise big endian.
+        """
+        return self._decoder.is_little_endian()
+
+class MemAccessInteger(MemAccess):
+    """Memory access for integer values.
+
+    Args:
+        MemAccess (obj): Memory access base class
+    """
+    def __init__(self, binary_data, bit_width, is_little_endian, is_unsigned):
+        super().__init__(binary_data, _get_integer_decoder(bit_width, is_little_endian, \
+                                                           is_unsigned))
+
+    def is_unsigned(self):
+        """Is the data unsigned?
+
+        Returns:
+            bool: True for unsigned, otherwise signed.
+        """
+        return self._decoder.is_unsigned()
 
-        return value
+class MemAccessFloat(MemAccess):
+    """Memory access for float values.
 
-    def _get_value_uxbe(self, intel_hex, addr, size):
-        value = 0
+    Args:
+        MemAccess (obj): Memory access base class
+    """
+    def __init__(self, binary_data, bit_width, is_little_endian):
+        super().__init__(binary_data, _get_float_decoder(bit_width, is_little_endian))
 
-        if intel_hex is not None:
-            if size == 1:
-                value = intel_hex[addr]
-            elif size > 1:
-                for offset in range(0, size, 1):
-                    value <<= 8
-                    value += intel_hex[addr + offset]
+################################################################################
+# Functions
+################################################################################
 
-        return value
+def _get_array_typecode(format_char, size_byte):
+    """Get the array.array typecode of a struct format character. The size of
+        the array types depends on the platform, therefore the typecode with
+        the same size is searched.
 
-    def _get_value_sxle(self, intel_hex, addr, size):
-        value = self._get_value_uxle(intel_hex, addr, size)
-        bit_width = size * 8
-        if value & (1 << (bit_width - 1)):
-            value -= 1 << bit_width
+    Args:
+        format_char (str): Struct format character
+        size_byte (int): Data type size in byte
 
-        return value
+    Returns:
+        str: Typecode or None if there is no typecode with the same size.
+    """
+    if format_char in "fd":
+        typecodes = format_char
+    elif format_char.isupper() is True:
+        typecodes = "BHILQ"
+    else:
+        typecodes = "bhilq"
 
-    def _get_value_sxbe(self, intel_hex, addr, size):
-        value = self._get_value_uxbe(intel_hex, addr, size)
-        bit_width = size * 8
-        if value & (1 << (bit_width - 1)):
-            value -= 1 << bit_width
+    for typecode in typecodes:
+        if array.array(typecode).itemsize == size_byte:
+            return typecode
 
-        return value
+    return None
 
-class MemAccessFloat(IMemAccess):
-    """Base class which realizes the abstract memory access interfaces
-        for float values.
+@lru_cache(maxsize=None)
+def _get_integer_decoder(bit_width, is_little_endian, is_unsigned):
+    """Get the shared integer decoder. It is created only once.
 
     Args:
-        IMemAccess (obj): Abstract base class
+        bit_width (int): Bit width of the integer
+        is_little_endian (bool): True for little endian, otherwise big endian.
+        is_unsigned (bool): True for unsigned, otherwise signed.
+
+    Returns:
+        IntegerDecoder: Integer decoder
     """
-    def __init__(self, binary_data, bit_width, is_little_endian):
-        super().__init__()
-        self._binary_data = binary_data
-        self._size_byte = bit_width // 8
-        self._is_little_endian = is_little_endian
+    return IntegerDecoder(bit_width, is_little_endian, is_unsigned)
 
-    def set_binary_data(self, binary_data):
-        """Set binary data which to access.
+@lru_cache(maxsize=None)
+def _get_float_decoder(bit_width, is_little_endian):
+    """Get the shared float decoder. It is created only once.
 
-        Args:
-            binary_data (IntelHex): Binary data
-        """
-        self._binary_data = binary_data
+    Args:
+        bit_width (int): Bit width of the float
+        is_little_endian (bool): True for little endian, otherwise big endian.
 
-    def _set_endianess(self, is_little_endian):
-        """Set endianess of data which to access.
+    Returns:
+        FloatDecoder: Float decoder
+    """
+    return FloatDecoder(bit_width, is_little_endian)
+
+# Immutable registry of the shared decoders by data type.
+_DECODERS = MappingProxyType({
+    "uint8": _get_integer_decoder(8, True, True),
+    "int8": _get_integer_decoder(8, True, False),
+    "uint16le": _get_integer_decoder(16, True, True),
+    "uint16be": _get_integer_decoder(16, False, True),
+    "int16le": _get_integer_decoder(16, True, False),
+    "int16be": _get_integer_decoder(16, False, False),
+    "uint32le": _get_integer_decoder(32, True, True),
+    "uint32be": _get_integer_decoder(32, False, True),
+    "int32le": _get_integer_decoder(32, True, False),
+    "int32be": _get_integer_decoder(32, False, False),
+    "uint64le": _get_integer_decoder(64, True, True),
+    "uint64be": _get_integer_decoder(64, False, True),
+    "int64le": _get_integer_decoder(64, True, False),
+    "int64be": _get_integer_decoder(64, False, False),
+    "float32le": _get_float_decoder(32, True),
+    "float32be": _get_float_decoder(32, False),
+    "float64le": _get_float_decoder(64, True),
+    "float64be": _get_float_decoder(64, False),
+    "utf8": _get_integer_decoder(8, True, True),
+    "utf16le": _get_integer_decoder(16, True, True),
+    "latin1": _get_integer_decoder(8, True, True)
+})
+
+def mem_access_get_decoder(data_type):
+    """Get the shared decoder of a data type. It gets the binary data per call
+        and can be used by several threads.
 
-        Args:
-            is_little_endian (bool): True for little endian, otherwise big endian.
-        """
-        self._is_little_endian = is_little_endian
+    Args:
+        data_type (str): Data type
 
-    def get_value(self, addr):
-        """Get value from the binary data at the given address.
+    Returns:
+        Decoder: Decoder; may be None in case there is no available
+    """
+    return _DECODERS.get(data_type, None)
 
-        Args:
-            addr (int): Address of the value
+def mem_access_is_numpy_available():
+    """Is NumPy available to decode arrays?
 
-        Returns:
-            int: Value
-        """
-        value = 0
-        if self._is_little_endian is True:
-            value = self._get_value_uxle(self._binary_data, addr, self._size_byte)
-        else:
-            value = self._get_value_uxbe(self._binary_data, addr, self._size_byte)
+    Returns:
+        bool: True if available, otherwise False.
+    """
+    return numpy is not None
+
+@lru_cache(maxsize=128)
+def _get_structure_dtype(size, fields):
+    """Get the NumPy structured data type of a structure. The fields are
+        named "f0", "f1", ... in the given order.
+
+    Args:
+        size (int): Size of a single structure in byte
+        fields (tuple): Tuple of (offset, data type, count) tuples. The offset
+            is relative to the begin of the structure.
+
+    Raises:
+        TypeError: If a data type is invalid.
+
+    Returns:
+        numpy.dtype: Structured data type
+    """
+    names = []
+    formats = []
+    offsets = []
+
+    for idx, (offset, data_type, field_count) in enumerate(fields):
+        decoder = _DECODERS.get(data_type, None)
+
+        if (decoder is None) or (decoder.get_numpy_type() is None):
+            raise TypeError(f"Invalid type {data_type}.")
+
+        names.append(f"f{idx}")
+        offsets.append(offset)
 
-        if self._size_byte == 4:
-            value = struct.unpack('!f', value.to_bytes(self._size_byte, byteorder="big"))[0]
-        elif self._size_byte == 8:
-            value = struct.unpack('!d', value.to_bytes(self._size_byte, byteorder="big"))[0]
+        if field_count == 1:
+            formats.append(decoder.get_numpy_type())
         else:
-            raise NotImplementedError(f"Unsupported bit width of {self._size_byte * 8} for float")
+            formats.append((decoder.get_numpy_type(), (field_count,)))
 
-        return value
+    return numpy.dtype({
+        "names": names,
+        "formats": formats,
+        "offsets": offsets,
+        "itemsize": size
+    })
 
-    def get_size(self):
-        """Get the data type size in byte.
+def mem_access_decode_structure_array(binary_data, addr, count, size, fields):
+    """Decode a array of structures at once with a NumPy structured data type.
+        Every field is returned as column, which contains the field values
+        of all structures. The columns refer to the decoded records, whose
+        data is not copied if it is located in a single segment.
 
-        Returns:
-            int: Data type size in byte
-        """
-        return self._size_byte
+    Args:
+        binary_data (IntelHex|BinaryImage): Binary data
+        addr (int): Address of the first structure
+        count (int): Number of structures
+        size (int): Size of a single structure in byte
+        fields (list): List of (offset, data type, count) tuples. The offset
+            is relative to the begin of the structure.
 
-    def _get_value_uxle(self, intel_hex, addr, size):
-        value = 0
+    Raises:
+        NotImplementedError: If NumPy is not available.
+        TypeError: If a data type is invalid.
 
-        if intel_hex is not None:
-            if size == 1:
-                value = intel_hex[addr]
-            elif size > 1:
-                for offset in range(size - 1, -1, -1):
-                    value <<= 8
-                    value += intel_hex[addr + offset]
+    Returns:
+        list: One NumPy array per field. The array has a second dimension,
+            if the field count is greater than 1.
+    """
+    if numpy is None:
+        raise NotImplementedError("NumPy is not available.")
 
-        return value
+    dtype = _get_structure_dtype(size, tuple(fields))
+    data = binary_image_get_bytes(binary_data, addr, count * size)
+    records = numpy.frombuffer(data, dtype=dtype, count=count)
 
-    def _get_value_uxbe(self, intel_hex, addr, size):
-        value = 0
+    return [records[name] for name in dtype.names]
 
-        if intel_hex is not None:
-            if size == 1:
-                value = intel_hex[addr]
-            elif size > 1:
-                for offset in range(0, size, 1):
-                    value <<= 8
-                    value += intel_hex[addr + offset]
+@lru_cache(maxsize=None)
+def _get_code_unit_size(encoding):
+    """Get the size of a code unit of a string encoding, e.g. 2 for UTF-16.
 
-        return value
+    Args:
+        encoding (str): String encoding
 
-################################################################################
-# Functions
-################################################################################
+    Raises:
+        LookupError: If the encoding is unknown.
+
+    Returns:
+        int: Code unit size in byte
+    """
+    # The difference avoids to count a byte order mark.
+    return len("\0\0".encode(encoding)) - len("\0".encode(encoding))
 
-def mem_access_get_api_by_data_type(data_type):
+def _find_termination(data, code_unit_size):
+    """Find the string termination, which is a zero code unit.
+
+    Args:
+        data (bytes): String data, starting at a code unit.
+        code_unit_size (int): Code unit size in byte
+
+    Returns:
+        int: Offset of the termination or -1 if not found.
+    """
+    termination = bytes(code_unit_size)
+    end = data.find(termination)
+
+    # The termination must start at a code unit.
+    while (end >= 0) and ((end % code_unit_size) != 0):
+        end = data.find(termination, end + 1)
+
+    return end
+
+def _read_unlimited_string_data(binary_data, addr, code_unit_size):
+    """Read the data of a terminated string without max. length. It is read
+        in chunks until the termination or the end of the binary data.
+
+    Args:
+        binary_data (IntelHex|BinaryImage): Binary data
+        addr (int): Start address
+        code_unit_size (int): Code unit size in byte
+
+    Returns:
+        bytes, bool: String data and whether the termination was found.
+    """
+    max_addr = binary_data.maxaddr()
+    chunks = []
+
+    while (max_addr is not None) and (addr <= max_addr):
+        # The padding after the end of the binary data is not part of the string.
+        chunk_size = min(_STRING_CHUNK_SIZE, max_addr + 1 - addr)
+        chunk = bytes(binary_image_get_bytes(binary_data, addr, chunk_size))
+        end = _find_termination(chunk, code_unit_size)
+
+        if end >= 0:
+            chunks.append(chunk[:end])
+            return b"".join(chunks), True
+
+        chunks.append(chunk)
+        addr += _STRING_CHUNK_SIZE
+
+    return b"".join(chunks), False
+
+def mem_access_read_string(binary_data, addr, max_length=None, encoding="utf-8", \
+    is_terminated=True):
+    """Read a string from the binary data. All bytes up to the max. length
+        are read at once and the string termination is searched in them,
+        instead of reading byte by byte. Without max. length the string is
+        read in chunks up to the termination or the end of the binary data.
+
+        If the string ends at the max. length or at the end of the binary
+        data, a incomplete character at its end is dropped.
+
+    Args:
+        binary_data (IntelHex|BinaryImage): Binary data
+        addr (int): Start address
+        max_length (int, optional): Max. string length in byte or None for
+            no limit. Defaults to None.
+        encoding (str, optional): String encoding. Defaults to "utf-8".
+        is_terminated (bool, optional): If True, the string ends with a zero
+            code unit or at the max. length. If False, it is a field with
+            fixed length (max. length) without termination. Defaults to True.
+
+    Raises:
+        LookupError: If the encoding is unknown.
+        ValueError: If a string without termination has no max. length.
+        UnicodeDecodeError: If the string can't be decoded.
+
+    Returns:
+        str: String
+    """
+    code_unit_size = _get_code_unit_size(encoding)
+    is_complete = False
+
+    if max_length is None:
+        if is_terminated is False:
+            raise ValueError("A string without termination needs a max. length.")
+
+        data, is_complete = _read_unlimited_string_data(binary_data, addr, code_unit_size)
+
+    else:
+        data = bytes(binary_image_get_bytes(binary_data, addr, max_length))
+
+        if is_terminated is True:
+            end = _find_termination(data, code_unit_size)
+
+            if end >= 0:
+                data = data[:end]
+                is_complete = True
+
+    if is_complete is True:
+        return data.decode(encoding)
+
+    # The string is cut at the end, which may be inside a character.
+    return codecs.getincrementaldecoder(encoding)().decode(data, final=False)
+
+def mem_access_get_api_by_data_type(data_type, binary_data=None):
     """Get API to access a memory depended on the data type.
+        It is a cheap view, which binds the binary data to the shared decoder.
 
     Args:
         data_type (str): Data type
+        binary_data (IntelHex|BinaryImage, optional): Binary data. Defaults to None.
 
     Returns:
         MemAccess: Memory access API; may be None in case there is no available
     """
-    mem_access_lookup = {
-        "uint8": MemAccessInteger(None, 8, True, True),
-        "int8": MemAccessInteger(None, 8, True, False),
-        "uint16le": MemAccessInteger(None, 16, True, True),
-        "uint16be": MemAccessInteger(None, 16, False, True),
-        "int16le": MemAccessInteger(None, 16, True, False),
-        "int16be": MemAccessInteger(None, 16, False, False),
-        "uint32le": MemAccessInteger(None, 32, True, True),
-        "uint32be": MemAccessInteger(None, 32, False, True),
-        "int32le": MemAccessInteger(None, 32, True, False),
-        "int32be": MemAccessInteger(None, 32, False, False),
-        "uint64le": MemAccessInteger(None, 64, True, True),
-        "uint64be": MemAccessInteger(None, 64, False, True),
-        "int64le": MemAccessInteger(None, 64, True, False),
-        "int64be": MemAccessInteger(None, 64, False, False),
-        "float32le": MemAccessFloat(None, 32, True),
-        "float32be": MemAccessFloat(None, 32, False),
-        "float64le": MemAccessFloat(None, 64, True),
-        "float64be": MemAccessFloat(None, 64, False),
-        "utf8": MemAccessInteger(None, 8, True, True)
-    }
+    decoder = _DECODERS.get(data_type, None)
+
+    if decoder is None:
+        return None
+
+    if isinstance(decoder, FloatDecoder):
+        return MemAccessFloat(binary_data, decoder.get_size() * 8, decoder.is_little_endian())
 
-    return mem_access_lookup.get(data_type, None)
+    return MemAccessInteger(binary_data, decoder.get_size() * 8, decoder.is_little_endian(), \
+                            decoder.is_unsigned())
 
 ################################################################################
 # Main
@@ -0,0 +1,165 @@
+"""Template cache
+    Compiling a Mako template to Python code is expensive. The compiled
+    templates are therefore cached in the process and on disk, keyed by the
+    template content and the Mako version.
+"""
+
+# MIT License
+#
+# Copyright (c) 2022 - 2025 Andreas Merkle (web@blue-andi.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+################################################################################
+# Imports
+################################################################################
+import hashlib
+import importlib.util
+import os
+import mako
+from mako.template import Template, ModuleTemplate
+from mako import codegen
+
+################################################################################
+# Variables
+################################################################################
+
+# Sub directory in the cache directory.
+_CACHE_SUB_DIR = "template"
+
+# Compiled templates of this process by their key.
+_TEMPLATE_CACHE = {}
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+def _get_template_key(template):
+    """Get the key of a template, which considers everything the generated
+        code depends on.
+
+    Args:
+        template (str): The template content
+
+    Returns:
+        str: Template key
+    """
+    hash_obj = hashlib.sha256()
+    hash_obj.update(f"{mako.__version__}:{codegen.MAGIC_NUMBER}:strict_undefined:".encode("utf-8"))
+    hash_obj.update(template.encode("utf-8"))
+
+    return hash_obj.hexdigest()
+
+def _load_cached_template(module_file_name, template):
+    """Load a compiled template from the cache.
+
+    Args:
+        module_file_name (str): File name of the compiled template module
+        template (str): The template content
+
+    Returns:
+        ModuleTemplate: Compiled template or None if not available.
+    """
+    tmpl = None
+
+    if os.path.isfile(module_file_name) is True:
+        try:
+            module_id = os.path.splitext(os.path.basename(module_file_name))[0]
+            spec = importlib.util.spec_from_file_location(module_id, module_file_name)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            with open(module_file_name, encoding="utf-8") as file_descriptor:
+                module_source = file_descriptor.read()
+
+            tmpl = ModuleTemplate(module,
+                                  module_filename=module_file_name,
+                                  module_source=module_source,
+                                  template_source=template)
+
+        except (OSError, ImportError, SyntaxError, AttributeError):
+            # Invalid cache entry, which is handled like not cached.
+            tmpl = None
+
+    return tmpl
+
+def _store_cached_template(module_file_name, tmpl):
+    """Store the compiled template in the cache. A failure is ignored,
+        because the cache is only a optimization.
+
+    Args:
+        module_file_name (str): File name of the compiled template module
+        tmpl (Template): Compiled template
+    """
+    tmp_file_name = f"{module_file_name}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(module_file_name), exist_ok=True)
+
+        with open(tmp_file_name, "w", encoding="utf-8") as file_descriptor:
+            file_descriptor.write(tmpl.code)
+
+        # Replace it atomically, because other processes may read it in parallel.
+        os.replace(tmp_file_name, module_file_name)
+    except OSError:
+        pass
+
+def tmpl_cache_get_template(template, cache_dir=None):
+    """Get the compiled template. It is taken from the cache of this process
+        or from the cache directory if available, otherwise it is compiled
+        and stored in both.
+
+    Args:
+        template (str): The template content
+        cache_dir (str, optional): Cache directory. Defaults to None.
+
+    Raises:
+        Exception: Any error of the template compilation, e.g. SyntaxException.
+
+    Returns:
+        Template|ModuleTemplate: Compiled template
+    """
+    key = _get_template_key(template)
+    tmpl = _TEMPLATE_CACHE.get(key, None)
+
+    if tmpl is None:
+        module_file_name = None
+
+        if cache_dir is not None:
+            module_file_name = os.path.join(cache_dir, _CACHE_SUB_DIR, f"tmpl_{key}.py")
+            tmpl = _load_cached_template(module_file_name, template)
+
+        if tmpl is None:
+            # The URI is part of the generated code, therefore it shall not differ between runs.
+            tmpl = Template(template, strict_undefined=True, uri=f"tmpl_{key}")
+
+            if module_file_name is not None:
+                _store_cached_template(module_file_name, tmpl)
+
+        _TEMPLATE_CACHE[key] = tmpl
+
+    return tmpl
+
+################################################################################
+# Main
+################################################################################
@@ -26,13 +26,54 @@
 ################################################################################
 # Imports
 ################################################################################
+from functools import lru_cache
+import array
 import struct
 import math
+import operator
 
 ################################################################################
 # Variables
 ################################################################################
 
+# Struct format characters of a float and the integer with the same size by bit width.
+_FLOAT_HEX_FORMAT_CHARS = {
+    32: ("f", "I"),
+    64: ("d", "Q")
+}
+
+# Operators of the template elements, which are forwarded by a lazy template element.
+_LAZY_FORWARDED_OPERATORS = {
+    "__bool__": bool,
+    "__int__": int,
+    "__float__": float,
+    "__str__": str,
+    "__add__": operator.add,
+    "__sub__": operator.sub,
+    "__mul__": operator.mul,
+    "__pow__": operator.pow,
+    "__truediv__": operator.truediv,
+    "__floordiv__": operator.floordiv,
+    "__mod__": operator.mod,
+    "__lshift__": operator.lshift,
+    "__rshift__": operator.rshift,
+    "__and__": operator.and_,
+    "__or__": operator.or_,
+    "__xor__": operator.xor,
+    "__divmod__": divmod,
+    "__lt__": operator.lt,
+    "__le__": operator.le,
+    "__eq__": operator.eq,
+    "__ne__": operator.ne,
+    "__gt__": operator.gt,
+    "__ge__": operator.ge,
+    "__abs__": abs,
+    "__invert__": operator.invert,
+    "__ceil__": math.ceil,
+    "__floor__": math.floor,
+    "__getitem__": operator.getitem
+}
+
 ################################################################################
 # Classes
 ################################################################################
@@ -43,6 +84,10 @@ class BaseTemplateElement():
     Args:
         ABC (obj): Abstract base class
     """
+
+    # Many template elements are created, therefore they have no instance dictionary.
+    __slots__ = ("_name", "_addr")
+
     def __init__(self, name, addr):
         super().__init__()
         self._name = name
@@ -64,13 +109,40 @@ class BaseTemplateElement():
         """
         return self._addr
 
-class TmplElementInt(BaseTemplateElement):
-    """Template element representing a single integer element with a address, value and bit width.
+class BaseTemplateValue(BaseTemplateElement):
+    """Base template element with a value and bit width. The bit width is
+        not stored per element, instead it is shared by a subclass per bit
+        width, which is created on the first use, e.g. TmplElementInt32.
     """
-    def __init__(self, name, addr, value, bit_width):
+
+    __slots__ = ("_value",)
+
+    # Bit width of all elements of the class, set by the subclass per bit width.
+    _bit_width = None
+
+    def __new__(cls, name, addr, value, bit_width): # pylint: disable=unused-argument
+        bit_width_class = cls
+
+        if cls._bit_width != bit_width:
+            base_class = cls if cls._bit_width is None else cls.__base__
+            bit_width_class = _get_bit_width_class(base_class, bit_width)
+
+        return super().__new__(bit_width_class)
+
+    def __init__(self, name, addr, value, bit_width): # pylint: disable=unused-argument
         super().__init__(name, addr)
         self._value = value
-        self._bit_width = bit_width
+
+    def __reduce__(self):
+        # The subclass per bit width can't be pickled, therefore the element
+        # is restored by its base class, which selects the subclass again.
+        return (type(self).__base__, (self._name, self._addr, self._value, self._bit_width))
+
+class TmplElementInt(BaseTemplateValue):
+    """Template element representing a single integer element with a address, value and bit width.
+    """
+
+    __slots__ = ()
 
     def __bool__(self):
         return bool(self._value)
@@ -170,49 +242,42 @@ class TmplElementInt(BaseTemplateElement):
         """
         return self._value_to_hex(self._value, prefix)
 
-class TmplElementIntList(BaseTemplateElement):
+class TmplElementIntList(BaseTemplateValue):
     """Template element representing a list of integer elements with a address, value and bit width.
+        The values may be a list, a array.array or a NumPy array, which behaves like a list.
     """
-    def __init__(self, name, addr, value, bit_width):
-        super().__init__(name, addr)
-        self._value = value
-        self._bit_width = bit_width
+
+    __slots__ = ()
 
     def __str__(self):
-        return str(self._value)
+        return "[" + ", ".join(map(str, _to_iterable(self._value))) + "]"
 
     def __add__(self, value):
-        return self._value + value
+        return _to_python(self._value) + value
 
     def __mul__(self, value):
-        return self._value * value
+        return _to_python(self._value) * value
 
     def __lt__(self, value):
-        return self._value < value
+        return _to_python(self._value) < value
 
     def __le__(self, value):
-        return self._value <= value
+        return _to_python(self._value) <= value
 
     def __eq__(self, value):
-        return self._value == value
+        return _to_python(self._value) == value
 
     def __ne__(self, value):
-        return self._value != value
+        return _to_python(self._value) != value
 
     def __gt__(self, value):
-        return self._value > value
+        return _to_python(self._value) > value
 
     def __ge__(self, value):
-        return self._value >= value
+        return _to_python(self._value) >= value
 
     def __getitem__(self, key):
-        return self._value[key]
-
-    def _value_to_hex(self, value, prefix):
-        if value < 0:
-            value &= (1 << self._bit_width) - 1
-
-        return f"{prefix}{value:0{self._bit_width // 4}X}"
+        return _to_python(self._value[key])
 
     def hex(self, prefix="0x"):
         """Get the value in hex format.
@@ -223,26 +288,18 @@ class TmplElementIntList(BaseTemplateElement):
         Returns:
             str: Hex value
         """
-        output = "["
-
-        for idx, value in enumerate(self._value):
+        # Negative values are shown in two's complement.
+        mask = (1 << self._bit_width) - 1
+        digits = self._bit_width // 4
 
-            if idx > 0:
-                output += ", "
+        return "[" + ", ".join(f"{prefix}{value & mask:0{digits}X}" \
+            for value in _to_iterable(self._value)) + "]"
 
-            output += self._value_to_hex(value, prefix)
-
-        output += "]"
-
-        return output
-
-class TmplElementFloat(BaseTemplateElement):
+class TmplElementFloat(BaseTemplateValue):
     """Template element representing a single float element with a address, value and bit width.
     """
-    def __init__(self, name, addr, value, bit_width):
-        super().__init__(name, addr)
-        self._value = value
-        self._bit_width = bit_width
+
+    __slots__ = ()
 
     def __bool__(self):
         return bool(self._value)
@@ -328,53 +385,42 @@ class TmplElementFloat(BaseTemplateElement):
         """
         return self._value_to_hex(self._value, prefix)
 
-class TmplElementFloatList(BaseTemplateElement):
+class TmplElementFloatList(BaseTemplateValue):
     """Template element representing a list of float elements with a address, value and bit width.
+        The values may be a list, a array.array or a NumPy array, which behaves like a list.
     """
-    def __init__(self, name, addr, value, bit_width):
-        super().__init__(name, addr)
-        self._value = value
-        self._bit_width = bit_width
+
+    __slots__ = ()
 
     def __str__(self):
-        return str(self._value)
+        return "[" + ", ".join(map(str, _to_iterable(self._value))) + "]"
 
     def __add__(self, value):
-        return self._value + value
+        return _to_python(self._value) + value
 
     def __mul__(self, value):
-        return self._value * value
+        return _to_python(self._value) * value
 
     def __lt__(self, value):
-        return self._value < value
+        return _to_python(self._value) < value
 
     def __le__(self, value):
-        return self._value <= value
+        return _to_python(self._value) <= value
 
     def __eq__(self, value):
-        return self._value == value
+        return _to_python(self._value) == value
 
     def __ne__(self, value):
-        return self._value != value
+        return _to_python(self._value) != value
 
     def __gt__(self, value):
-        return self._value > value
+        return _to_python(self._value) > value
 
     def __ge__(self, value):
-        return self._value >= value
+        return _to_python(self._value) >= value
 
     def __getitem__(self, key):
-        return self._value[key]
-
-    def _value_to_hex(self, value, prefix):
-        if self._bit_width == 32:
-            value = struct.unpack('<I', struct.pack('<f', value))[0]
-        elif self._bit_width == 64:
-            value = struct.unpack('<Q', struct.pack('<d', value))[0]
-        else:
-            raise NotImplementedError(f"Unsupported bit width of {self._bit_width} for float")
-
-        return f"{prefix}{value:0{self._bit_width // 4}X}"
+        return _to_python(self._value[key])
 
     def hex(self, prefix="0x"):
         """Get the value in hex format.
@@ -382,29 +428,32 @@ class TmplElementFloatList(BaseTemplateElement):
         Args:
             prefix (str, optional): Prefix. Defaults to "0x".
 
+        Raises:
+            NotImplementedError: If the bit width is not supported.
+
         Returns:
             str: Hex value
         """
-        output = "["
-
-        for idx, value in enumerate(self._value):
-
-            if idx > 0:
-                output += ", "
+        format_chars = _FLOAT_HEX_FORMAT_CHARS.get(self._bit_width, None)
 
-            output += self._value_to_hex(value, prefix)
+        if format_chars is None:
+            raise NotImplementedError(f"Unsupported bit width of {self._bit_width} for float")
 
-        output += "]"
+        # Reinterpret all floats at once as integers with the same size.
+        values = _to_iterable(self._value)
+        count = len(values)
+        float_format_char, int_format_char = format_chars
+        int_values = struct.unpack(f"<{count}{int_format_char}",
+                                   struct.pack(f"<{count}{float_format_char}", *values))
+        digits = self._bit_width // 4
 
-        return output
+        return "[" + ", ".join(f"{prefix}{value:0{digits}X}" for value in int_values) + "]"
 
-class TmplElementStr(BaseTemplateElement):
+class TmplElementStr(BaseTemplateValue):
     """Template element representing a single integer element with a address, value and bit width.
     """
-    def __init__(self, name, addr, value, bit_width):
-        super().__init__(name, addr)
-        self._value = value
-        self._bit_width = bit_width
+
+    __slots__ = ()
 
     def __int__(self):
         return int(self._value)
@@ -457,23 +506,140 @@ class TmplElementStr(BaseTemplateElement):
         Returns:
             str: Hex value
         """
-        output = "["
+        return "[" + ", ".join(self._value_to_hex(ord(value), prefix) for value in self._value) \
+            + "]"
+
+class TmplElementLazy(BaseTemplateElement):
+    """Template element, which creates the real template element not before
+        it is used the first time, e.g. by a operator or method call in the
+        template. The real template element is created only once.
+        Name and address are available without creating it.
+    """
+
+    __slots__ = ("_factory", "_tmpl_element")
+
+    def __init__(self, name, addr, factory):
+        """Initialize the lazy template element.
+
+        Args:
+            name (str): Element name
+            addr (int): Element address
+            factory (callable): Creates the real template element, called without arguments.
+        """
+        super().__init__(name, addr)
+        self._factory = factory
+        self._tmpl_element = None
+
+    def __getattr__(self, name):
+        # Called only for attributes, which are not found in the lazy element itself.
+        if name.startswith("_") is True:
+            raise AttributeError(name)
+
+        return getattr(self.resolve(), name)
+
+    __hash__ = None
+
+    def resolve(self):
+        """Get the real template element. It will be created on first call.
+
+        Returns:
+            BaseTemplateElement: Template element
+        """
+        if self._tmpl_element is None:
+            self._tmpl_element = self._factory()
+            self._factory = None
+
+        return self._tmpl_element
 
-        for idx, value in enumerate(self._value):
+class TmplElementLazyList(list):
+    """List of lazy template elements, which provides the real template
+        elements on iteration and index access. Every real template element
+        is created not before it is accessed the first time.
+    """
 
-            if idx > 0:
-                output += ", "
+    __slots__ = ()
 
-            output += self._value_to_hex(ord(value), prefix)
+    def __iter__(self):
+        return (tmpl_element.resolve() for tmpl_element in super().__iter__())
 
-        output += "]"
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [tmpl_element.resolve() for tmpl_element in super().__getitem__(index)]
 
-        return output
+        return super().__getitem__(index).resolve()
 
 ################################################################################
 # Functions
 ################################################################################
 
+@lru_cache(maxsize=None)
+def _get_bit_width_class(base_class, bit_width):
+    """Get the subclass of a template element class for a specific bit width.
+        It is created only once per bit width.
+
+    Args:
+        base_class (class): Template element class, e.g. TmplElementInt
+        bit_width (int): Bit width
+
+    Returns:
+        class: Subclass with the bit width
+    """
+    return type(f"{base_class.__name__}{bit_width}", (base_class,), {
+        "__slots__": (),
+        "__doc__": base_class.__doc__,
+        "_bit_width": bit_width
+    })
+
+def _to_python(value):
+    """Convert a NumPy array or NumPy scalar to the Python equivalent, which is
+        a list or a int/float. Any other value is returned unchanged.
+
+    Args:
+        value (any): Value
+
+    Returns:
+        any: Python value
+    """
+    to_list = getattr(value, "tolist", None)
+
+    if to_list is None:
+        return value
+
+    return to_list()
+
+def _to_iterable(value):
+    """Get the values of a list element as iterable of Python values. Lists
+        and arrays are used directly, a NumPy array is converted to a list.
+
+    Args:
+        value (list|array.array|numpy.ndarray): Values
+
+    Returns:
+        list|array.array: Values
+    """
+    if isinstance(value, (list, array.array)):
+        return value
+
+    return _to_python(value)
+
+def _lazy_forward(forward_func):
+    """Create a operator method for the lazy template element, which applies the
+        operator to the real template element.
+
+    Args:
+        forward_func (callable): Operator function
+
+    Returns:
+        callable: Operator method
+    """
+    def operator_method(self, *args):
+        return forward_func(self.resolve(), *args)
+
+    return operator_method
+
 ################################################################################
 # Main
 ################################################################################
+
+for _operator_name, _operator_func in _LAZY_FORWARDED_OPERATORS.items():
+    setattr(TmplElementLazy, _operator_name, _lazy_forward(_operator_func))
@@ -26,18 +26,34 @@
 ################################################################################
 # Imports
 ################################################################################
+from functools import partial
 from pyHexDump.tmpl_element import TmplElementInt, \
                                     TmplElementIntList, \
                                     TmplElementFloat, \
                                     TmplElementFloatList, \
-                                    TmplElementStr
-from pyHexDump.mem_access import mem_access_get_api_by_data_type
-from pyHexDump.config_element import PaddingElement
+                                    TmplElementStr, \
+                                    TmplElementLazy, \
+                                    TmplElementLazyList
+from pyHexDump.mem_access import mem_access_get_api_by_data_type, \
+                                  mem_access_is_numpy_available, \
+                                  mem_access_decode_structure_array
+from pyHexDump.layout_plan import layout_plan_compile
 
 ################################################################################
 # Variables
 ################################################################################
 
+# String encoding by string data type.
+_STRING_ENCODINGS = {
+    "utf8": "utf-8",
+    "utf16le": "utf-16-le",
+    "latin1": "latin-1"
+}
+
+# Minimum number of values of a element list, which are decoded to a NumPy
+# array instead of a list. Small lists are faster decoded by struct.
+_ARRAY_MIN_COUNT = 64
+
 ################################################################################
 # Classes
 ################################################################################
@@ -45,8 +61,18 @@ from pyHexDump.config_element import PaddingElement
 class TmplModel():
     """The template model holds the template elements, which are provided to the
         template engine.
+        In lazy mode the values are not read from the binary data before a
+        template element is used the first time. Iterating over the list of
+        template elements provides the real template elements.
     """
-    def __init__(self):
+    def __init__(self, is_lazy=False):
+        """Initialize the template model.
+
+        Args:
+            is_lazy (bool, optional): Create the template elements on first use.
+                Defaults to False.
+        """
+        self._is_lazy = is_lazy
         self._tmpl_element_dict = {}
 
         # List of all template elements to be able to iterate in the template over all.
@@ -56,11 +82,37 @@ class TmplModel():
         """Load the template element model from configuration elements.
 
         Args:
-            binary_data (IntelHex): The binary data used to retrieve the value.
+            binary_data (IntelHex|BinaryImage): The binary data used to retrieve the value.
             cfg_elements_dict (dict): Configuration element objects
         """
-        self._tmpl_element_dict = self._get_tmpl_element_dict(binary_data, cfg_elements_dict)
-        self._tmpl_element_list = self._flatten_tmpl_dict(self._tmpl_element_dict)
+        self.load_from_layout_plan(binary_data, layout_plan_compile(cfg_elements_dict))
+
+    def load_from_layout_plan(self, binary_data, layout_plan):
+        """Load the template element model from a layout plan.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): The binary data used to retrieve the value.
+            layout_plan (LayoutPlan): Compiled configuration
+        """
+        self._tmpl_element_dict = {}
+        self._tmpl_element_list = TmplElementLazyList() if self._is_lazy is True else []
+        values = {}
+
+        # Arrays of structures are decoded at once, except in lazy mode,
+        # which shall only read the used elements.
+        if (self._is_lazy is False) and (mem_access_is_numpy_available() is True):
+            values = self._decode_structure_arrays(binary_data, layout_plan)
+
+        for idx, layout_entry in enumerate(layout_plan):
+            tmpl_element = self._get_tmpl_element(binary_data, layout_entry, values.get(idx, None))
+
+            # Create the structures along the path, the last key is the element itself.
+            tmpl_element_dict = self._tmpl_element_dict
+            for key in layout_entry.path[:-1]:
+                tmpl_element_dict = tmpl_element_dict.setdefault(key, {})
+
+            tmpl_element_dict[layout_entry.path[-1]] = tmpl_element
+            self._tmpl_element_list.append(tmpl_element)
 
     def get(self):
         """Get dictionary of configuration elements.
@@ -71,13 +123,65 @@ class TmplModel():
         return self._tmpl_element_dict
 
     def get_list(self):
-        """Get list of configuration elements.
+        """Get list of configuration elements. In lazy mode every element
+            is created on iteration or index access.
 
         Returns:
-            list: Configuration elements
+            list|TmplElementLazyList: Configuration elements
         """
         return self._tmpl_element_list
 
+    def _decode_structure_arrays(self, binary_data, layout_plan):
+        """Decode the arrays of structures of the layout plan with NumPy.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): The binary data used to retrieve the value.
+            layout_plan (LayoutPlan): Compiled configuration
+
+        Returns:
+            dict: Values by layout entry index
+        """
+        values = {}
+
+        for structure_array in layout_plan.get_structure_arrays():
+            self._decode_structure_array(binary_data, layout_plan.get(), structure_array, values)
+
+        return values
+
+    def _decode_structure_array(self, binary_data, layout_entries, structure_array, values):
+        """Decode a array of structures at once with NumPy. Strings are not
+            decoded, because they are read up to the string termination.
+
+        Args:
+            binary_data (IntelHex|BinaryImage): The binary data used to retrieve the value.
+            layout_entries (tuple): All layout entries of the layout plan
+            structure_array (StructureArray): Array of structures
+            values (dict): Values by layout entry index, where to add the values.
+        """
+        first_entries = layout_entries[structure_array.first_entry:
+                                       structure_array.first_entry + structure_array.entry_count]
+        field_entries = [(idx, layout_entry) for idx, layout_entry in enumerate(first_entries)
+                         if self._is_str(layout_entry.data_type) is False]
+        fields = [(layout_entry.addr - structure_array.addr,
+                   layout_entry.data_type,
+                   layout_entry.count) for _, layout_entry in field_entries]
+
+        columns = mem_access_decode_structure_array(binary_data,
+                                                    structure_array.addr,
+                                                    structure_array.count,
+                                                    structure_array.size,
+                                                    fields)
+
+        for (field_idx, layout_entry), column in zip(field_entries, columns):
+            # Single values and small element lists are used as Python values.
+            if layout_entry.count < _ARRAY_MIN_COUNT:
+                column = column.tolist()
+
+            for structure_idx, value in enumerate(column):
+                entry_idx = structure_array.first_entry + \
+                            structure_idx * structure_array.entry_count + field_idx
+                values[entry_idx] = value
+
     def _is_integer(self, data_type):
         """Check if the data type is an integer.
 
@@ -115,17 +219,16 @@ class TmplModel():
         Returns:
             bool: True if it is a string, otherwise False.
         """
-        data_types = ["utf8"]
+        return data_type in _STRING_ENCODINGS
 
-        return data_type in data_types
-
-    def _create_template_element_single(self, cfg_element, mem_access, offset):
+    def _create_template_element_single(self, cfg_element, mem_access, offset, value=None):
         """Create a single template element.
 
         Args:
-            cfg_element (ConfigElement): Configuration element
+            cfg_element (ConfigElement|LayoutEntry): Configuration element
             mem_access (MemAccess): Memory access object
             offset (int): Offset in the binary data
+            value (int|float, optional): Already decoded value. Defaults to None.
 
         Raises:
             NotImplementedError: If the data type is not supported.
@@ -134,9 +237,11 @@ class TmplModel():
            BaseTemplateElement: Template element
         """
         real_addr = cfg_element.addr + offset
-        value = mem_access.get_value(real_addr)
         bit_width = mem_access.get_size() * 8
 
+        if value is None:
+            value = mem_access.get_value(real_addr)
+
         if self._is_integer(cfg_element.data_type) is True:
             tmpl_element = TmplElementInt(cfg_element.name, real_addr, value, bit_width)
         elif self._is_float(cfg_element.data_type) is True:
@@ -148,38 +253,17 @@ class TmplModel():
 
         return tmpl_element
 
-    def _read_string_(self, mem_access, addr, max_length = 256, encoding="utf-8"):
-        """Read a string from the memory.
+    def _create_template_element_list(self, cfg_element, mem_access, offset, value_list=None):
+        """Create a list of template elements. The values are stored in a
+            array.array. Large lists are decoded to a NumPy array instead,
+            if NumPy is available.
 
         Args:
-            mem_access (MemAccess): Memory access object
-            addr (int): Start address
-            max_length (int, optional): Max. string length. Defaults to 256.
-            encoding (str, optional): The string encoding. Defaults to "utf-8".
-
-        Returns:
-            str: The string.
-        """
-        value_list = []
-        idx = 0
-        while max_length > idx:
-            value = mem_access.get_value(addr + idx)
-            if value == 0:
-                break
-            value_list.append(value)
-            idx += 1
-
-        byte_values = bytearray(value_list)
-
-        return byte_values.decode(encoding)
-
-    def _create_template_element_list(self, cfg_element, mem_access, offset):
-        """Create a list of template elements.
-
-        Args:
-            cfg_element (ConfigElement): Configuration element
+            cfg_element (ConfigElement|LayoutEntry): Configuration element
             mem_access (MemAccess): Memory access object
             offset (int): Offset in the binary data
+            value_list (list|array.array|numpy.ndarray, optional): Already decoded values.
+                Defaults to None.
 
         Raises:
             NotImplementedError: If the data type is not supported.
@@ -192,14 +276,18 @@ class TmplModel():
 
         if self._is_str(cfg_element.data_type) is True:
             max_length = cfg_element.count * mem_access.get_size()
-            str_utf8 = self._read_string_(mem_access, real_addr, max_length, "utf-8")
-            tmpl_element = TmplElementStr(cfg_element.name, real_addr, str_utf8, bit_width)
+            value = mem_access.get_string(real_addr, max_length, \
+                                          _STRING_ENCODINGS[cfg_element.data_type])
+            tmpl_element = TmplElementStr(cfg_element.name, real_addr, value, bit_width)
 
         else:
 
-            value_list = []
-            for idx in range(cfg_element.count):
-                value_list.append(mem_access.get_value(real_addr + idx * mem_access.get_size()))         # pylint: disable=line-too-long
+            if value_list is None:
+                if (cfg_element.count >= _ARRAY_MIN_COUNT) and \
+                   (mem_access_is_numpy_available() is True):
+                    value_list = mem_access.get_array(real_addr, cfg_element.count)
+                else:
+                    value_list = mem_access.get_value_array(real_addr, cfg_element.count)
 
             if self._is_integer(cfg_element.data_type) is True:
                 tmpl_element = TmplElementIntList(cfg_element.name, real_addr, value_list, bit_width)    # pylint: disable=line-too-long
@@ -210,13 +298,15 @@ class TmplModel():
 
         return tmpl_element
 
-    def _create_template_element(self, cfg_element, mem_access, offset):
+    def _create_template_element(self, cfg_element, mem_access, offset, value=None):
         """Create a template element.
 
         Args:
-            cfg_element (ConfigElement): Configuration element
+            cfg_element (ConfigElement|LayoutEntry): Configuration element
             mem_access (MemAccess): Memory access object
             offset (int): Offset in the binary data
+            value (int|float|list|numpy.ndarray, optional): Already decoded value(s).
+                Defaults to None.
 
         Raises:
             TypeError: If the count is invalid.
@@ -225,78 +315,50 @@ class TmplModel():
             BaseTemplateElement: Template element
         """
         if cfg_element.count == 1:
-            tmpl_element = self._create_template_element_single(cfg_element, mem_access, offset)
+            tmpl_element = self._create_template_element_single(cfg_element, mem_access, offset, \
+                                                                value)
 
         elif cfg_element.count > 1:
-            tmpl_element = self._create_template_element_list(cfg_element, mem_access, offset)
+            tmpl_element = self._create_template_element_list(cfg_element, mem_access, offset, \
+                                                              value)
 
         else:
             raise TypeError(f"Count of {cfg_element.count} is invalid.")
 
         return tmpl_element
 
-    def _get_tmpl_element_dict(self, binary_data, cfg_elements_dict, offset = 0):
-        """Get a dictionary of elements and its value.
+    def _get_tmpl_element(self, binary_data, layout_entry, value=None):
+        """Get the template element of a layout entry.
 
         Args:
-            binary_data (IntelHex): The binary data used to retrieve the value.
-            cfg_elements_dict (dict): Configuration element objects
-            offset (int, optional): Offset in the binary data. Defaults to 0.
-
-        Returns:
-            dict: Dictionary of elements and its value.
-        """
-        tmpl_element_dict = {}
-
-        for key, cfg_element in cfg_elements_dict.items():
-
-            # Padding element?
-            if isinstance(cfg_element, PaddingElement):
-                continue
+            binary_data (IntelHex|BinaryImage): The binary data used to retrieve the value.
+            layout_entry (LayoutEntry): Built-in element with its absolute address
+            value (int|float|list|numpy.ndarray, optional): Already decoded value(s).
+                Defaults to None.
 
-            # Built-in type?
-            if cfg_element.elements is None:
-                mem_access = mem_access_get_api_by_data_type(cfg_element.data_type)
-
-                if mem_access is None:
-                    raise TypeError(f"Invalid type {cfg_element.data_type}.")
-
-                mem_access.set_binary_data(binary_data)
-                tmpl_element_dict[key] = self._create_template_element(cfg_element, mem_access, offset)
-
-            # Single structure?
-            elif cfg_element.count == 1:
-                tmpl_element_dict[key] = self._get_tmpl_element_dict(binary_data, cfg_element.elements, offset)
-
-            # List of elements with the same structure?
-            elif cfg_element.count > 1:
-                for idx in range(cfg_element.count):
-                    extended_key = key + "._" + str(idx) + "_"
-                    single_cfg_element_size = cfg_element.size // cfg_element.count
-                    tmpl_element_dict[extended_key] = self._get_tmpl_element_dict(binary_data,
-                                                                                cfg_element.elements,
-                                                                                idx * single_cfg_element_size + offset)
-
-        return tmpl_element_dict
-
-    def _flatten_tmpl_dict(self, tmpl_element_dict):
-        """Flattens a template element dictionary and provides it as a list.
-
-        Args:
-            tmpl_element_dict (dict): Template elements dictionary
+        Raises:
+            TypeError: If the data type is invalid.
 
         Returns:
-            list: List of template elements
+            BaseTemplateElement: Template element
         """
-        tmpl_element_list = []
-
-        for key in tmpl_element_dict.keys():
-            if isinstance(tmpl_element_dict[key], dict):
-                tmpl_element_list.extend(self._flatten_tmpl_dict(tmpl_element_dict[key]))
-            else:
-                tmpl_element_list.append(tmpl_element_dict[key])
+        mem_access = mem_access_get_api_by_data_type(layout_entry.data_type, binary_data)
+
+        if mem_access is None:
+            raise TypeError(f"Invalid type {layout_entry.data_type}.")
+
+        # The layout entry provides the absolute address, therefore no offset is necessary.
+        if self._is_lazy is True:
+            tmpl_element = TmplElementLazy(layout_entry.name,
+                                           layout_entry.addr,
+                                           partial(self._create_template_element,
+                                                   layout_entry,
+                                                   mem_access,
+                                                   0))
+        else:
+            tmpl_element = self._create_template_element(layout_entry, mem_access, 0, value)
 
-        return tmpl_element_list
+        return tmpl_element
 
 ################################################################################
 # Functions
@@ -0,0 +1,22 @@
+"""Tests
+"""
+
+import pytest
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Use a temporary cache directory in every test, so the tests neither
+        write into a configured cache directory nor read stale results
+        from it.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory of the test
+        monkeypatch (pytest.MonkeyPatch): Monkeypatch of the test
+
+    Returns:
+        pathlib.Path: Cache directory
+    """
+    cache_path = tmp_path / "cache"
+    monkeypatch.setenv("PYHEXDUMP_CACHE_DIR", str(cache_path))
+
+    return cache_path
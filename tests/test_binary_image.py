@@ -0,0 +1,196 @@
+"""Tests
+"""
+
+from argparse import Namespace
+import os
+import shutil
+from intelhex import IntelHex
+import pyHexDump.binary_image
+from pyHexDump.constants import Ret
+from pyHexDump.binary_image import BinaryImage, binary_image_load_bin_file, \
+    binary_image_load_hex_file, binary_image_get_bytes, PADDING
+from pyHexDump.common import common_load_binary_file, common_get_cache_dir
+from pyHexDump.mem_access import mem_access_get_api_by_data_type
+
+def test_load_bin_file():
+    """Test loading a binary file via memory mapping.
+    """
+    ret_status, binary_data = common_load_binary_file("tests/data/data.txt")
+
+    assert ret_status == Ret.OK
+    assert isinstance(binary_data, BinaryImage) is True
+    assert binary_data[0] == ord("1")
+    assert binary_data[7] == ord("8")
+    assert binary_data.minaddr() == 0
+    assert binary_data.segments()[0][0] == 0
+
+    ret_status, binary_data = common_load_binary_file("tests/data/not_existing.bin")
+
+    assert ret_status == Ret.ERROR_INPUT_FILE_NOT_FOUND
+    assert binary_data is None
+
+def test_load_unreadable_file(tmp_path):
+    """Test loading a binary file, which can't be read.
+    """
+    ret_status, binary_data = common_load_binary_file(str(tmp_path))
+
+    assert ret_status == Ret.ERROR_INPUT_FILE_INVALID
+    assert binary_data is None
+
+    dir_name = tmp_path / "dir.hex"
+    dir_name.mkdir()
+    ret_status, binary_data = common_load_binary_file(str(dir_name))
+
+    assert ret_status == Ret.ERROR_INPUT_FILE_INVALID
+    assert binary_data is None
+
+def test_load_empty_bin_file(tmp_path):
+    """Test loading a empty binary file, which can not be mapped.
+    """
+    file_name = tmp_path / "empty.bin"
+    file_name.write_bytes(b"")
+
+    binary_data = binary_image_load_bin_file(str(file_name))
+
+    assert len(binary_data) == 0
+    assert binary_data.segments() == []
+    assert binary_data[0] == PADDING
+
+def test_mem_access():
+    """Test the memory access API with a binary image.
+    """
+    binary_data = BinaryImage([(0x1000, b"\x01\x02\x03\x04")])
+
+    mem_access = mem_access_get_api_by_data_type("uint32le")
+    mem_access.set_binary_data(binary_data)
+    assert mem_access.get_value(0x1000) == 0x04030201
+
+    mem_access = mem_access_get_api_by_data_type("uint16be")
+    mem_access.set_binary_data(binary_data)
+    assert mem_access.get_value(0x1002) == 0x0304
+
+    # Out of range access returns padding like IntelHex.
+    assert mem_access.get_value(0x1004) == 0xFFFF
+
+def test_load_hex_file():
+    """Test loading a intel hex file into contiguous segments.
+    """
+    intel_hex = IntelHex("examples/data/aurix_tc397.hex")
+    binary_data = binary_image_load_hex_file("examples/data/aurix_tc397.hex")
+
+    assert binary_data.segments() == intel_hex.segments()
+    assert binary_data.minaddr() == intel_hex.minaddr()
+    assert binary_data.maxaddr() == intel_hex.maxaddr()
+
+    for start_addr, end_addr in intel_hex.segments():
+        size = end_addr - start_addr
+        assert bytes(binary_data.get_bytes(start_addr, size)) == \
+            intel_hex.tobinstr(start=start_addr, size=size)
+
+def test_get_bytes():
+    """Test getting byte ranges across several segments.
+    """
+    binary_data = BinaryImage([(0x10, b"\x05\x06"), (0x0C, b"\x01\x02\x03")])
+
+    assert binary_data.segments() == [(0x0C, 0x0F), (0x10, 0x12)]
+
+    # Inside a single segment
+    assert bytes(binary_data.get_bytes(0x0D, 2)) == b"\x02\x03"
+
+    # Across a gap and beyond the last segment
+    assert bytes(binary_data.get_bytes(0x0B, 9)) == \
+        b"\xFF\x01\x02\x03\xFF\x05\x06\xFF\xFF"
+
+    # Same for any byte addressable binary data
+    intel_hex = IntelHex()
+    intel_hex[0x0C] = 0x01
+    assert binary_image_get_bytes(intel_hex, 0x0B, 3) == b"\xFF\x01\xFF"
+
+def test_load_cached_hex_file(tmp_path):
+    """Test that a parsed intel hex file is cached and invalidated if it changes.
+    """
+    file_name = tmp_path / "aurix_tc397.hex"
+    shutil.copyfile("examples/data/aurix_tc397.hex", file_name)
+    cache_dir = str(tmp_path / "cache")
+
+    binary_data = binary_image_load_hex_file(str(file_name), cache_dir)
+    cache_files = os.listdir(os.path.join(cache_dir, "binary_image"))
+    assert len(cache_files) == 1
+
+    cached_binary_data = binary_image_load_hex_file(str(file_name), cache_dir)
+    assert cached_binary_data.segments() == binary_data.segments()
+
+    for start_addr, end_addr in binary_data.segments():
+        size = end_addr - start_addr
+        assert bytes(cached_binary_data.get_bytes(start_addr, size)) == \
+            bytes(binary_data.get_bytes(start_addr, size))
+
+    # A changed modification time with the same content keeps it valid.
+    os.utime(file_name, ns=(0, 0))
+    cached_binary_data = binary_image_load_hex_file(str(file_name), cache_dir)
+    assert cached_binary_data.segments() == binary_data.segments()
+
+    # A changed content with the same size invalidates it.
+    file_size = file_name.stat().st_size
+    file_name.write_bytes(b":0100000001FE\n:00000001FF\n".ljust(file_size, b"\n"))
+    assert file_name.stat().st_size == file_size
+    assert binary_image_load_hex_file(str(file_name), cache_dir).segments() == [(0, 1)]
+
+    # A corrupt cached binary image is parsed again.
+    with open(os.path.join(cache_dir, "binary_image", cache_files[0]), "wb") as file_descriptor:
+        file_descriptor.write(b"PHDI")
+
+    binary_data = binary_image_load_hex_file(str(file_name), cache_dir)
+    assert binary_data.segments() == [(0, 1)]
+    assert binary_data[0] == 0x01
+
+def test_validate_cached_hex_file(tmp_path, monkeypatch):
+    """Test when the content of a intel hex file is hashed to validate the
+        cached binary image.
+    """
+    file_name = tmp_path / "aurix_tc397.hex"
+    shutil.copyfile("examples/data/aurix_tc397.hex", file_name)
+    cache_dir = str(tmp_path / "cache")
+
+    binary_data = binary_image_load_hex_file(str(file_name), cache_dir)
+    hashed_files = []
+
+    def get_file_digest(file_name):
+        hashed_files.append(file_name)
+        return get_file_digest_orig(file_name)
+
+    get_file_digest_orig = pyHexDump.binary_image._get_file_digest # pylint: disable=protected-access
+    monkeypatch.setattr(pyHexDump.binary_image, "_get_file_digest", get_file_digest)
+
+    # A changed modification time with the same content keeps it valid. The
+    # content is hashed only once, afterwards the cache knows the new time.
+    os.utime(file_name, ns=(0, 0))
+
+    for _ in range(2):
+        cached_binary_data = binary_image_load_hex_file(str(file_name), cache_dir)
+        assert cached_binary_data.segments() == binary_data.segments()
+
+    assert len(hashed_files) == 1
+
+    # A changed content with the same size and modification time is detected,
+    # if the modification happened in the same time granularity like the check.
+    os.utime(file_name)
+    binary_image_load_hex_file(str(file_name), cache_dir)
+    file_stat = file_name.stat()
+    file_name.write_bytes(file_name.read_bytes().replace(b":0200000480007A", b":02000004800179", 1))
+    os.utime(file_name, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    assert file_name.stat().st_size == file_stat.st_size
+    assert binary_image_load_hex_file(str(file_name), cache_dir).segments() != \
+        binary_data.segments()
+
+def test_get_cache_dir(tmp_path, monkeypatch):
+    """Test the cache directory selection by the command line arguments
+        and the environment variable.
+    """
+    monkeypatch.delenv("PYHEXDUMP_CACHE_DIR")
+    assert common_get_cache_dir(Namespace(cacheDir=None, noCache=False)) is None
+
+    monkeypatch.setenv("PYHEXDUMP_CACHE_DIR", str(tmp_path))
+    assert common_get_cache_dir(Namespace(cacheDir=None, noCache=False)) == str(tmp_path)
+    assert common_get_cache_dir(Namespace(cacheDir=str(tmp_path), noCache=False)) == str(tmp_path)
+    assert common_get_cache_dir(Namespace(cacheDir=str(tmp_path), noCache=True)) is None
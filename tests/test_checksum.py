@@ -1,9 +1,17 @@
 """Tests
 """
 
-from pyHexDump.cmd_checksum import cmd_register as cmd_checksum_register
+import hashlib
+import json
+import sys
+import pytest
+from pyHexDump.cmd_checksum import cmd_register as cmd_checksum_register, calc_checksum
 from pyHexDump.prg_arg_parser import PrgArgParser
 from pyHexDump.bunch import dict_to_bunch
+from pyHexDump.crc import Crc, crc_get_engine, crc_get_parameters, crc_get_preset, \
+    crc_get_preset_names
+from pyHexDump.constants import Ret
+from pyHexDump.binary_image import BinaryImage
 
 def test_cmd_registration():
     """Test the command registration.
@@ -101,3 +109,290 @@ def test_calc_checksum(capsys):
 
         # String compare to see the hex value in the assertion output
         assert f'{test_case["expected"]:02X}' == captured.out
+
+def test_calc_checksum_ranges(tmp_path, capsys):
+    """Test the checksum calculation of several address ranges, given by
+        the CLI and by a range file in JSON and TOML format.
+    """
+    main_prg_arg_parser = PrgArgParser()
+    cmd = cmd_checksum_register(main_prg_arg_parser.get_sub_parsers())
+
+    json_range_file = tmp_path / "ranges.json"
+    json_range_file.write_text("""{
+        "ranges": [{
+            "name": "reflected",
+            "saddr": "0x00",
+            "eaddr": "0x08",
+            "reverseOut": true
+        }]
+    }""", encoding="utf-8")
+
+    toml_range_file = tmp_path / "ranges.toml"
+    toml_range_file.write_text("""
+        [[ranges]]
+        name = "inverted"
+        saddr = 0
+        eaddr = 8
+        finalXOR = true
+    """, encoding="utf-8")
+
+    args = {
+        "binaryFile": [ "tests/data/data.txt" ],
+        "binaryDataEndianess": "uint8",
+        "saddr": None,
+        "eaddr": None,
+        "polynomial": 0x07,
+        "bitWidth": 8,
+        "seed": 0x00,
+        "reverseIn": False,
+        "reverseOut": False,
+        "finalXOR": False,
+        "range": [(0, 8)],
+        "rangeFile": str(json_range_file),
+        "outputFormat": "json"
+    }
+
+    assert cmd["execFunc"](dict_to_bunch(args)) == Ret.OK
+    captured = capsys.readouterr()
+    assert [(item["name"], item["checksum"]) for item in json.loads(captured.out)] == \
+        [("reflected", 0xE3), ("00000000-00000008", 0xC7)]
+
+    args["rangeFile"] = str(toml_range_file)
+    args["outputFormat"] = "table"
+
+    assert cmd["execFunc"](dict_to_bunch(args)) == Ret.OK
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        "Name              Start    End      Checksum",
+        "inverted          00000000 00000008 38",
+        "00000000-00000008 00000000 00000008 C7"
+    ]
+
+    args["rangeFile"] = str(tmp_path / "not_existing.json")
+    assert cmd["execFunc"](dict_to_bunch(args)) == Ret.ERROR_CONFIG_FILE_NOT_FOUND
+
+    # Digests are calculated in addition.
+    args["rangeFile"] = None
+    args["digest"] = ["sum8", "md5"]
+    args["outputFormat"] = "json"
+
+    assert cmd["execFunc"](dict_to_bunch(args)) == Ret.OK
+    captured = capsys.readouterr()
+    with open("tests/data/data.txt", "rb") as file_descriptor:
+        data = file_descriptor.read(8)
+    assert json.loads(captured.out)[0]["digests"] == \
+        {"sum8": f"{sum(data) & 0xFF:02x}", "md5": hashlib.md5(data).hexdigest()}
+
+def test_verify_checksums(tmp_path, capsys):
+    """Test the verification of the boot mode header CRCs, which are stored
+        in the binary data.
+    """
+    main_prg_arg_parser = PrgArgParser()
+    cmd = cmd_checksum_register(main_prg_arg_parser.get_sub_parsers())
+
+    range_file = tmp_path / "ranges.json"
+    range_file.write_text("""{
+        "ranges": [{
+            "name": "CRCBMHD",
+            "saddr": "0xAF400000",
+            "eaddr": "0xAF400008",
+            "finalXOR": true,
+            "verifyAddr": "0xAF400008"
+        }, {
+            "name": "CRCBMHD_N",
+            "saddr": "0xAF400000",
+            "eaddr": "0xAF400008",
+            "verifyAddr": "0xAF40000C"
+        }]
+    }""", encoding="utf-8")
+
+    args = {
+        "binaryFile": [ "examples/data/aurix_tc397.hex" ],
+        "binaryDataEndianess": "uint32le",
+        "saddr": None,
+        "eaddr": None,
+        "polynomial": 0x04C11DB7,
+        "bitWidth": 32,
+        "seed": 0xFFFFFFFF,
+        "reverseIn": True,
+        "reverseOut": True,
+        "finalXOR": False,
+        "verifyAddr": None,
+        "verifyDataType": "uint32le",
+        "range": None,
+        "rangeFile": str(range_file),
+        "outputFormat": "table"
+    }
+
+    assert cmd["execFunc"](dict_to_bunch(args)) == Ret.OK
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        "Name      Start    End      Checksum Expected Result",
+        "CRCBMHD   AF400000 AF400008 31795570 31795570 OK",
+        "CRCBMHD_N AF400000 AF400008 CE86AA8F CE86AA8F OK"
+    ]
+
+    # The stored CRC is read with the wrong endianess.
+    args["verifyDataType"] = "uint32be"
+    args["outputFormat"] = "json"
+
+    assert cmd["execFunc"](dict_to_bunch(args)) == Ret.ERROR_CHECKSUM_MISMATCH
+    captured = capsys.readouterr()
+    assert [item["valid"] for item in json.loads(captured.out)] == [False, False]
+
+def test_crc_presets():
+    """Test the CRC presets against their check values and the usage of
+        a preset with explicit parameters.
+    """
+    check_data = b"123456789"
+
+    for name in crc_get_preset_names():
+        preset = crc_get_preset(name)
+        assert preset is not None
+
+        for use_native in [True, False]:
+            assert Crc(*preset[:6], use_native=use_native).calc(check_data) == preset.check, name
+
+    assert crc_get_preset("crc-32p4") == crc_get_preset("CRC-32/AUTOSAR")
+    assert crc_get_preset("CRC-3") is None
+
+    # Explicit parameters override the preset.
+    assert crc_get_parameters("CRC-32", seed=0, final_xor=0x12345678) == \
+        (0x04C11DB7, 32, 0, True, True, 0x12345678)
+
+    with pytest.raises(ValueError):
+        crc_get_parameters(None, 0x07, 8)
+
+    with pytest.raises(ValueError):
+        crc_get_parameters("CRC-3")
+
+    # The engines are created once per parameter set.
+    assert crc_get_engine(0x07, 8, 0, False, False, True) is \
+        crc_get_engine(0x07, 8, 0, False, False, True)
+    assert crc_get_engine(0x07, 8, 0, False, False, True) is not \
+        crc_get_engine(0x07, 8, 0, False, False, 1)
+
+    # A arbitrary final xor value.
+    assert Crc(0x04C11DB7, 32, 0xFFFFFFFF, True, True, 0x12345678).calc(check_data) == \
+        0xCBF43926 ^ 0xFFFFFFFF ^ 0x12345678
+
+    binary_data = BinaryImage([(0x1000, check_data)])
+    assert calc_checksum(binary_data, "uint8", 0x1000, 0x1009, preset="CRC-32C") == 0xE3069283
+    assert calc_checksum(binary_data, "uint8", 0x1000, 0x1009, final_xor=False, \
+        preset="CRC-32C") == 0xE3069283 ^ 0xFFFFFFFF
+
+def test_crc_engine_parallel():
+    """Test that the combination of chunk CRCs and the parallel calculation
+        are the same like the sequential calculation.
+    """
+    data = bytes(range(256)) * 9000
+
+    # Combine the CRC of two chunks for different widths and reflections.
+    for polynomial, bit_width in [(0x05, 5), (0x07, 8), (0x8005, 16), (0x864CFB, 24), \
+        (0x04C11DB7, 32), (0x42F0E1EBA9EA3693, 64)]:
+        for reverse_input in [False, True]:
+            crc = Crc(polynomial, bit_width, 0x15, reverse_input, not reverse_input, True)
+            register = crc.feed(0x15 << max(8 - bit_width, 0), data[:1000])
+            register = crc.combine(register, crc.feed(0, data[1000:2345]), 1345)
+
+            assert crc.finalize(register) == crc.calc(data[:2345])
+
+    # Parallel calculation in threads (native) and processes (table driven).
+    for name in ["CRC-32", "CRC-16/ARC"]:
+        crc = Crc(*crc_get_preset(name)[:6])
+        assert crc.calc(data, jobs=3) == crc.calc(data)
+
+def _calc_crc_bitwise(data, polynomial, bit_width, seed):
+    """Reference CRC calculation bit by bit, MSB first.
+    """
+    mask = (1 << bit_width) - 1
+    crc = seed
+
+    for byte in data:
+        crc ^= byte << (bit_width - 8)
+
+        for _ in range(8):
+            if crc & (1 << (bit_width - 1)):
+                crc = ((crc << 1) ^ polynomial) & mask
+            else:
+                crc = (crc << 1) & mask
+
+    return crc
+
+def test_crc_engine():
+    """Test the table driven CRC engine against well known check values
+        and the bit by bit calculation.
+    """
+    check_data = b"123456789"
+
+    # CRC-8
+    assert Crc(0x07, 8, 0x00, False, False, False).calc(check_data) == 0xF4
+    # CRC-16/CCITT-FALSE
+    assert Crc(0x1021, 16, 0xFFFF, False, False, False).calc(check_data) == 0x29B1
+    # CRC-32
+    assert Crc(0x04C11DB7, 32, 0xFFFFFFFF, True, True, True).calc(check_data) == 0xCBF43926
+    # CRC-64/ECMA-182
+    assert Crc(0x42F0E1EBA9EA3693, 64, 0, False, False, False).calc(check_data) == \
+        0x6C40DF5F0B497347
+
+    # Different widths, with and without slicing-by-N, and a not aligned length.
+    data = bytes(range(7, 250, 3))
+    for polynomial, bit_width in [(0x1D, 8), (0x8005, 16), (0x864CFB, 24), \
+        (0x04C11DB7, 32), (0x42F0E1EBA9EA3693, 64)]:
+        seed = 0x5A5A5A5A5A5A5A5A & ((1 << bit_width) - 1)
+        expected = _calc_crc_bitwise(data, polynomial, bit_width, seed)
+        assert Crc(polynomial, bit_width, seed, False, False, False).calc(data) == expected
+
+def test_crc_engine_native():
+    """Test the native CRC-32 and CRC-CCITT calculation against the table
+        driven engine for all seed and reflection combinations.
+    """
+    data = bytes(range(256)) * 3
+
+    for polynomial, bit_width in [(0x04C11DB7, 32), (0x1021, 16)]:
+        for seed in [0, 0x1234, (1 << bit_width) - 1]:
+            for reverse_input in [False, True]:
+                for reverse_output in [False, True]:
+                    for final_xor in [False, True]:
+                        parameters = (polynomial, bit_width, seed, reverse_input, \
+                            reverse_output, final_xor)
+
+                        assert Crc(*parameters).calc(data) == \
+                            Crc(*parameters, use_native=False).calc(data)
+
+def test_crc_engine_blocks():
+    """Test that data larger than a feed block provides the same CRC like
+        the native calculation, which processes it at once.
+    """
+    data = bytes(range(256)) * 769 + b"\x01\x02\x03"
+
+    for reverse_input in [False, True]:
+        parameters = (0x04C11DB7, 32, 0xFFFFFFFF, reverse_input, reverse_input, True)
+
+        assert Crc(*parameters).calc(data) == Crc(*parameters, use_native=False).calc(data)
+
+def test_calc_checksum_preset_override(capsys, monkeypatch):
+    """Test that the reflection and the final xor of a preset can be
+        disabled by the command line arguments.
+    """
+    main_prg_arg_parser = PrgArgParser()
+    cmd = cmd_checksum_register(main_prg_arg_parser.get_sub_parsers())
+
+    def parse_args(argv):
+        monkeypatch.setattr(sys, "argv", ["pyHexDump"] + argv)
+        main_prg_arg_parser.parse_args()
+        return main_prg_arg_parser.get_args()
+
+    args = parse_args(["checksum", "tests/data/data.txt", "-sa", "0", "-ea", "8", \
+                       "-ps", "CRC-32", "-nri", "-nro", "-nfx"])
+
+    assert (args.reverseIn, args.reverseOut, args.finalXOR) == (False, False, False)
+    assert cmd["execFunc"](args) == Ret.OK
+
+    expected = Crc(0x04C11DB7, 32, 0xFFFFFFFF, False, False, False).calc(b"12345678")
+    assert capsys.readouterr().out == f"{expected:02X}"
+
+    # Without them the preset is used.
+    args = parse_args(["checksum", "tests/data/data.txt", "-sa", "0", "-ea", "8", "-ps", "CRC-32"])
+
+    assert (args.reverseIn, args.reverseOut, args.finalXOR) == (None, None, None)
@@ -0,0 +1,37 @@
+"""Tests
+"""
+
+import hashlib
+import zlib
+import pytest
+from pyHexDump.digest import SumDigest, digest_calc, digest_get_names, digest_register
+
+def test_digest_calc():
+    """Test several digests in a single pass against reference values.
+    """
+    data = bytes(range(256)) * 1000 + b"abc"
+
+    digests = digest_calc(memoryview(data), ["sha256", "sha1", "md5", "adler32", "sum8", "sum32"])
+
+    assert digests["sha256"] == hashlib.sha256(data).hexdigest()
+    assert digests["sha1"] == hashlib.sha1(data).hexdigest()
+    assert digests["md5"] == hashlib.md5(data).hexdigest()
+    assert digests["adler32"] == f"{zlib.adler32(data):08x}"
+    assert digests["sum8"] == f"{sum(data) & 0xFF:02x}"
+    assert digests["sum32"] == f"{sum(data):08x}"
+
+    # Well known values of the Fletcher checksums, also with a incomplete word.
+    assert digest_calc(b"abcde", ["fletcher16", "fletcher32"]) == \
+        {"fletcher16": "c8f0", "fletcher32": "f04fc729"}
+    assert digest_calc(b"abcdef", ["fletcher32"]) == {"fletcher32": "56502d2a"}
+
+    with pytest.raises(ValueError):
+        digest_calc(data, ["unknown"])
+
+def test_digest_register():
+    """Test the registration of a additional digest.
+    """
+    digest_register("SUM4", lambda: SumDigest(4))
+
+    assert "sum4" in digest_get_names()
+    assert digest_calc(b"\x0F\x02", ["sum4"]) == {"sum4": "1"}
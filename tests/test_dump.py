@@ -1,10 +1,12 @@
 """Tests
 """
 
+import io
 from intelhex import IntelHex
 from pyHexDump.constants import Ret
+from pyHexDump.binary_image import BinaryImage
 from pyHexDump.mem_access import mem_access_get_api_by_data_type
-from pyHexDump.common import common_dump_intel_hex
+from pyHexDump.common import common_dump_intel_hex, common_dump_stream
 from pyHexDump.prg_arg_parser import PrgArgParser
 from pyHexDump.cmd_dump import _exec, cmd_register as cmd_dump_register
 from pyHexDump.bunch import dict_to_bunch
@@ -109,3 +111,128 @@ def test_dump(capsys):
 
     assert ret_status == Ret.OK
     assert captured.out == "0000: 31 32 33 34\n0004: 35 36 37 38"
+
+def test_batch(capsys):
+    """Test the batch processing of several binary files to stdout."""
+    args = {
+        "binaryFile": [ "tests/data/data.txt", "tests/data/data.txt" ],
+        "addr": 0,
+        "count": 4,
+        "dataType": "uint8"
+    }
+
+    ret_status = _exec(dict_to_bunch(args))
+
+    captured = capsys.readouterr()
+
+    assert ret_status == Ret.OK
+    assert captured.out == "==> tests/data/data.txt <==\n0000: 31 32 33 34\n\n" \
+                           "==> tests/data/data.txt <==\n0000: 31 32 33 34\n"
+
+def test_dump_incomplete_line(capsys):
+    """Test the dump with a incomplete last line.
+    """
+    binary_data = IntelHex()
+    test_data = "0123456789ABCDEFGHIJ"
+
+    # Prepare binary data
+    for idx, _ in enumerate(test_data):
+        binary_data[idx] = ord(test_data[idx])
+
+    mem_access_api = mem_access_get_api_by_data_type("uint16le")
+    mem_access_api.set_binary_data(binary_data)
+
+    ret_status = common_dump_intel_hex(mem_access_api, 0, len(test_data) // 2)
+
+    captured = capsys.readouterr()
+
+    assert ret_status == Ret.OK
+    assert captured.out == "0000: 3130 3332 3534 3736 3938 4241 4443 4645\n" \
+                           "0010: 4847 4A49"
+
+    # Signed values are not supported by the dump command, but by the dump function.
+    mem_access_api = mem_access_get_api_by_data_type("int8")
+    mem_access_api.set_binary_data(binary_data)
+
+    ret_status = common_dump_intel_hex(mem_access_api, 0x10, 4)
+
+    captured = capsys.readouterr()
+
+    assert ret_status == Ret.OK
+    assert captured.out == "0010: 47 48 49 4A"
+
+def test_dump_stream(capsys):
+    """Test that the streamed dump is the same like the dump of the loaded binary file.
+    """
+    args = {
+        "binaryFile": [ "tests/data/data.txt" ],
+        "addr": 1,
+        "count": 0,
+        "dataType": "uint16le"
+    }
+
+    ret_status = _exec(dict_to_bunch(args))
+    captured = capsys.readouterr()
+
+    assert ret_status == Ret.OK
+
+    args["stream"] = True
+    stream_ret_status = _exec(dict_to_bunch(args))
+    stream_captured = capsys.readouterr()
+
+    assert stream_ret_status == Ret.OK
+    assert stream_captured.out == captured.out
+
+    # A count beyond the end of the stream is padded like the dump of the file.
+    args["count"] = 20
+    args["dataType"] = "uint32le"
+    outputs = []
+
+    for is_stream in [False, True]:
+        args["stream"] = is_stream
+        assert _exec(dict_to_bunch(args)) == Ret.OK
+        outputs.append(capsys.readouterr().out)
+
+    assert outputs[1] == outputs[0]
+    assert outputs[1].split("\n")[4] == "0041: FFFFFFFF FFFFFFFF FFFFFFFF FFFFFFFF"
+
+    # A stream which is not seekable, like stdin. Chunks are shorter than a line.
+    class PipeStream(io.BytesIO):
+        """Stream which provides only a few bytes per read."""
+        def seekable(self):
+            return False
+
+        def read(self, size=-1):
+            return super().read(min(size, 3))
+
+    mem_access_api = mem_access_get_api_by_data_type("uint8")
+    ret_status = common_dump_stream(mem_access_api, PipeStream(bytes(range(40))), 4, 0)
+
+    captured = capsys.readouterr()
+
+    assert ret_status == Ret.OK
+    assert captured.out == "0004: 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F 10 11 12 13\n" \
+                           "0014: 14 15 16 17 18 19 1A 1B 1C 1D 1E 1F 20 21 22 23\n" \
+                           "0024: 24 25 26 27"
+
+def test_dump_skip_gaps(capsys):
+    """Test the dump, which skips the lines without data and squeezes repeated lines.
+    """
+    binary_data = BinaryImage([(0x10, bytes(range(16))), (0x80, bytes(48)), (0xB8, b"\x01\x02")])
+
+    mem_access_api = mem_access_get_api_by_data_type("uint8")
+    mem_access_api.set_binary_data(binary_data)
+
+    ret_status = common_dump_intel_hex(mem_access_api, 0, 0xD0, segments=binary_data.segments(),
+                                       squeeze=True)
+
+    captured = capsys.readouterr()
+
+    assert ret_status == Ret.OK
+    assert captured.out == "-- gap 0x00000000 - 0x00000010 (16 bytes) --\n" \
+                           "0010: 00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F\n" \
+                           "-- gap 0x00000020 - 0x00000080 (96 bytes) --\n" \
+                           "0080: 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00\n" \
+                           "*\n" \
+                           "00B0: FF FF FF FF FF FF FF FF 01 02 FF FF FF FF FF FF\n" \
+                           "-- gap 0x000000C0 - 0x000000D0 (16 bytes) --"
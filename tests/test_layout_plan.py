@@ -0,0 +1,76 @@
+"""Tests
+"""
+
+import json
+import os
+from pyHexDump.constants import Ret
+from pyHexDump.config_model import ConfigModel
+from pyHexDump.layout_plan import LayoutPlan, StructureArray, layout_plan_compile, \
+                                  layout_plan_load
+
+def test_layout_plan_compile():
+    """Test the compilation of a configuration with nested structure arrays.
+    """
+    config_model = ConfigModel()
+    config_model.load("tests/data/config_structure_nested_array.json")
+
+    layout_plan = layout_plan_compile(config_model.get())
+
+    assert len(layout_plan) == 8
+    assert [entry.addr for entry in layout_plan] == list(range(8))
+
+    entry = layout_plan.get()[5]
+    assert entry.path == ("ubyte_list._1_", "element._0_", "b")
+    assert entry.name == "ubyte_list.element.b"
+    assert entry.data_type == "uint8"
+    assert entry.count == 1
+    assert entry.stride == 1
+
+    # Only the outermost array of structures is part of the plan.
+    assert layout_plan.get_structure_arrays() == (StructureArray(0, 4, 0, 2, 4),)
+
+    loaded_layout_plan = LayoutPlan.from_list(layout_plan.to_list())
+    assert loaded_layout_plan.get() == layout_plan.get()
+    assert loaded_layout_plan.get_structure_arrays() == layout_plan.get_structure_arrays()
+
+def test_layout_plan_cache(tmp_path):
+    """Test that the layout plan is stored in the cache and loaded from there.
+    """
+    config_file = "tests/data/config_structure_nested_array.json"
+    cache_dir = str(tmp_path)
+
+    ret_status, layout_plan = layout_plan_load(config_file, cache_dir)
+    assert ret_status == Ret.OK
+
+    cache_files = os.listdir(os.path.join(cache_dir, "layout_plan"))
+    assert len(cache_files) == 1
+
+    ret_status, cached_layout_plan = layout_plan_load(config_file, cache_dir)
+    assert ret_status == Ret.OK
+    assert cached_layout_plan.get() == layout_plan.get()
+
+    ret_status, layout_plan = layout_plan_load("tests/data/not_existing.json", cache_dir)
+    assert ret_status == Ret.ERROR_CONFIG_FILE_NOT_FOUND
+    assert layout_plan is None
+
+def test_layout_plan_cache_warnings(tmp_path, capsys):
+    """Test that the warnings of the configuration are printed on every load,
+        also if the layout plan is taken from the cache.
+    """
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "elements": [{
+            "name": "invalid",
+            "addr": 0,
+            "dataType": "nosuchtype",
+            "count": 1
+        }]
+    }))
+    cache_dir = str(tmp_path / "cache")
+
+    for _ in range(2):
+        ret_status, _ = layout_plan_load(str(config_file), cache_dir)
+        assert ret_status == Ret.OK
+        assert capsys.readouterr().out == "Warning: Data type nosuchtype not found.\n"
+
+    assert len(os.listdir(os.path.join(cache_dir, "layout_plan"))) == 1
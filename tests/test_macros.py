@@ -3,7 +3,9 @@
 
 import struct
 from intelhex import IntelHex
-from pyHexDump.macros import get_macro_dict, set_binary_data
+import pyHexDump.macros
+from pyHexDump.macros import get_macro_dict, set_binary_data, get_macro_cache_statistics, \
+    MacroCache
 
 def test_macros_read_unsigned_integers():
     """Test macros to read unsigned integer values.
@@ -267,3 +269,120 @@ def test_macro_string():
     value = macro_dict["m_read_string"](0)
 
     assert test_string == value
+
+    # The string is limited by the max. length, even without termination.
+    assert macro_dict["m_read_string"](0, max_length=5) == "Hello"
+
+    # Field with fixed length, which contains the termination.
+    assert macro_dict["m_read_string"](0, "latin-1", test_string_len + 2, False) == \
+        test_string + "\0\xFF"
+
+    for idx, value in enumerate("\u0100\u20AC".encode("utf-16-le") + bytes(2)):
+        binary_data[0x100 + idx] = value
+
+    assert macro_dict["m_read_string"](0x100, "utf-16-le") == "\u0100\u20AC"
+
+    # By default a long string is not limited.
+    long_string = "L" * 1000
+    for idx, value in enumerate(long_string.encode("utf-8") + b"\0"):
+        binary_data[0x1000 + idx] = value
+
+    assert macro_dict["m_read_string"](0x1000) == long_string
+
+def test_macro_calc_checksum():
+    """Test the checksum macro with explicit CRC parameters and with a preset.
+    """
+    binary_data = IntelHex()
+
+    for idx, value in enumerate(b"123456789"):
+        binary_data[idx] = value
+
+    macro_dict = get_macro_dict()
+    set_binary_data(binary_data)
+
+    assert macro_dict["m_calc_checksum"]("uint8", 0, 9, 0x1021, 16, 0xFFFF, False, False, False) \
+        == 0x29B1
+    assert macro_dict["m_calc_checksum"]("uint8", 0, 9, preset="CRC-16/CCITT-FALSE") == 0x29B1
+    assert macro_dict["m_calc_checksum"]("uint8", 0, 9, preset="CRC-8/AUTOSAR") == 0xDF
+
+def test_macro_calc_digest():
+    """Test the digest macro.
+    """
+    binary_data = IntelHex()
+
+    for idx, value in enumerate(b"abcde"):
+        binary_data[idx] = value
+
+    macro_dict = get_macro_dict()
+    set_binary_data(binary_data)
+
+    assert macro_dict["m_calc_digest"]("md5", 0, 5) == "ab56b4d92b40713acc5af89985d4b786"
+    assert macro_dict["m_calc_digest"]("fletcher16", 0, 5) == "c8f0"
+
+def test_macro_cache():
+    """Test that repeated macro calls are taken from the cache and that
+        the cache is bounded.
+    """
+    binary_data = IntelHex()
+
+    for idx, value in enumerate(b"abcde\0"):
+        binary_data[idx] = value
+
+    macro_dict = get_macro_dict()
+    set_binary_data(binary_data)
+
+    for _ in range(3):
+        assert macro_dict["m_read_uint16le"](0) == 0x6261
+        assert macro_dict["m_read_string"](0) == "abcde"
+        assert macro_dict["m_calc_checksum"]("uint8", 0, 5, preset="CRC-32") == 0x8587D865
+
+    assert get_macro_cache_statistics() == (6, 3, 0)
+
+    # New binary data invalidates the cache.
+    binary_data[0] = 0x41
+    set_binary_data(binary_data)
+    assert get_macro_cache_statistics() == (0, 0, 0)
+    assert macro_dict["m_read_string"](0) == "Abcde"
+
+    # The least recently used result is removed.
+    macro_cache = MacroCache(2)
+    assert macro_cache.get(1, lambda: "a") == "a"
+    assert macro_cache.get(2, lambda: "b") == "b"
+    assert macro_cache.get(1, lambda: "x") == "a"
+    assert macro_cache.get(3, lambda: "c") == "c"
+    assert macro_cache.get(2, lambda: "y") == "y"
+    assert macro_cache.get_statistics() == (1, 4, 0)
+
+    # Lists are converted to a hashable key, but differ from tuples.
+    assert macro_cache.get([1, 2], lambda: "l") == "l"
+    assert macro_cache.get([1, 2], lambda: "x") == "l"
+    assert macro_cache.get((1, 2), lambda: "t") == "t"
+    assert macro_cache.get_statistics() == (2, 6, 0)
+
+    # Keys, which can't be made hashable, are counted as bypass.
+    assert macro_cache.get([{}.keys()], lambda: "k") == "k"
+    assert macro_cache.get_statistics() == (2, 6, 1)
+
+def test_macro_cache_binary_data():
+    """Test that a cached macro result never belongs to other binary data.
+    """
+    binary_data_a = IntelHex()
+    binary_data_a[0] = 0x01
+    binary_data_b = IntelHex()
+    binary_data_b[0] = 0x02
+
+    macro_dict = get_macro_dict()
+
+    set_binary_data(binary_data_a)
+    assert macro_dict["m_read_uint8"](0) == 0x01
+    assert macro_dict["m_calc_digest"]("sum8", 0, 1) == "01"
+
+    set_binary_data(binary_data_b)
+    assert macro_dict["m_read_uint8"](0) == 0x02
+    assert macro_dict["m_calc_digest"]("sum8", 0, 1) == "02"
+
+    # Even without clearing the cache, the other binary data is not mixed up.
+    pyHexDump.macros.BINARY_DATA = binary_data_a
+    assert macro_dict["m_read_uint8"](0) == 0x01
+    assert macro_dict["m_calc_digest"]("sum8", 0, 1) == "01"
+    assert get_macro_cache_statistics() == (0, 4, 0)
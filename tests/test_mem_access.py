@@ -0,0 +1,172 @@
+"""Tests
+"""
+
+import struct
+from pyHexDump.binary_image import BinaryImage
+import pytest
+from pyHexDump.mem_access import mem_access_get_api_by_data_type, mem_access_get_decoder, \
+    mem_access_decode_structure_array, mem_access_read_string, _DECODERS
+
+def test_get_values():
+    """Test decoding consecutive values at once.
+    """
+    values = [0, 1, -2, 32767, -32768]
+    binary_data = BinaryImage([(0x100, struct.pack("<5h", *values))])
+
+    mem_access = mem_access_get_api_by_data_type("int16le")
+    mem_access.set_binary_data(binary_data)
+    assert mem_access.get_values(0x100, len(values)) == values
+
+    # Must be the same as reading value by value.
+    for idx, value in enumerate(values):
+        assert mem_access.get_value(0x100 + idx * 2) == value
+
+    mem_access = mem_access_get_api_by_data_type("uint16be")
+    mem_access.set_binary_data(binary_data)
+    assert mem_access.get_values(0x100, 2) == [0x0000, 0x0100]
+
+    # Values without data are read as padding.
+    assert mem_access.get_values(0x109, 2) == [0x80FF, 0xFFFF]
+
+    # No values
+    assert mem_access.get_values(0x100, 0) == []
+
+def test_get_values_float():
+    """Test decoding consecutive float values at once.
+    """
+    values = [1.5, -2.25, 1024.0]
+    binary_data = BinaryImage([(0, struct.pack(">3d", *values))])
+
+    mem_access = mem_access_get_api_by_data_type("float64be")
+    mem_access.set_binary_data(binary_data)
+    assert mem_access.get_values(0, len(values)) == values
+    assert mem_access.get_value(8) == values[1]
+
+def test_get_bytes():
+    """Test getting the raw bytes.
+    """
+    binary_data = BinaryImage([(0, b"\x01\x02\x03\x04")])
+
+    mem_access = mem_access_get_api_by_data_type("uint32le")
+    mem_access.set_binary_data(binary_data)
+    assert bytes(mem_access.get_bytes(1, 4)) == b"\x02\x03\x04\xFF"
+
+def test_shared_decoder():
+    """Test that the decoders are shared and the binary data is bound to the view only.
+    """
+    decoder = mem_access_get_decoder("uint32le")
+    assert decoder is mem_access_get_decoder("uint32le")
+    assert mem_access_get_decoder("unknown") is None
+
+    binary_data_a = BinaryImage([(0, struct.pack("<I", 0x12345678))])
+    binary_data_b = BinaryImage([(0, struct.pack("<I", 0xCAFEBABE))])
+    assert decoder.decode(binary_data_a, 0) == 0x12345678
+    assert decoder.decode(binary_data_b, 0) == 0xCAFEBABE
+
+    mem_access = mem_access_get_api_by_data_type("uint32le", binary_data_a)
+    assert mem_access.get_decoder() is decoder
+
+    # Binding other binary data creates a new view and keeps the original one.
+    other_mem_access = mem_access.bind(binary_data_b)
+    assert other_mem_access.get_value(0) == 0xCAFEBABE
+    assert mem_access.get_value(0) == 0x12345678
+
+    # The registry can't be modified.
+    with pytest.raises(TypeError):
+        _DECODERS["uint32le"] = None
+
+    # Changing the endianess uses the shared decoder with the other endianess.
+    mem_access._set_endianess(False) # pylint: disable=protected-access
+    assert mem_access.get_decoder() is mem_access_get_decoder("uint32be")
+    assert mem_access.get_value(0) == 0x78563412
+    assert decoder.is_little_endian() is True
+
+    mem_access = mem_access_get_api_by_data_type("float32le", \
+        BinaryImage([(0, struct.pack(">f", 1.5))]))
+    mem_access._set_endianess(False) # pylint: disable=protected-access
+    assert mem_access.get_decoder() is mem_access_get_decoder("float32be")
+    assert mem_access.get_value(0) == 1.5
+
+def test_decode_array():
+    """Test decoding values and arrays of structures with NumPy.
+    """
+    pytest.importorskip("numpy")
+
+    values = [1.5, -2.25, 1e10, 0.0]
+    binary_data = BinaryImage([(0x100, struct.pack(">4f", *values))])
+
+    decoder = mem_access_get_decoder("float32be")
+    assert decoder.get_numpy_type() == ">f4"
+    assert decoder.decode_array(binary_data, 0x100, 4).tolist() == \
+        decoder.decode_values(binary_data, 0x100, 4)
+
+    # Array of 3 structures with a uint16le, a padding byte and 2x int8.
+    binary_data = BinaryImage([(0, struct.pack("<HxbbHxbbHxbb", 1, -1, 2, 3, 4, 5, 65535, 6, -7))])
+    columns = mem_access_decode_structure_array(binary_data, 0, 3, 5, [(0, "uint16le", 1), \
+                                                                      (3, "int8", 2)])
+    assert columns[0].tolist() == [1, 3, 65535]
+    assert columns[1].tolist() == [[-1, 2], [4, 5], [6, -7]]
+
+def test_decode_value_array():
+    """Test decoding values to a array.array.
+    """
+    values = [0, 1, -2, 32767, -32768]
+    binary_data = BinaryImage([(0x100, struct.pack(">5h", *values))])
+
+    mem_access = mem_access_get_api_by_data_type("int16be", binary_data)
+    value_array = mem_access.get_value_array(0x100, len(values))
+    assert value_array.itemsize == 2
+    assert value_array.tolist() == values
+
+    # Values without data are read as padding.
+    mem_access = mem_access_get_api_by_data_type("uint32le", binary_data)
+    assert mem_access.get_value_array(0x10A, 2).tolist() == mem_access.get_values(0x10A, 2)
+
+    mem_access = mem_access_get_api_by_data_type("float64le")
+    assert mem_access.get_value_array(0, 3).tolist() == [0.0, 0.0, 0.0]
+
+def test_read_string():
+    """Test reading strings with different encodings and lengths.
+    """
+    binary_data = BinaryImage([(0x100, b"abc\0def"), (0x200, "a\u0100".encode("utf-16-le") + bytes(4))])
+
+    assert mem_access_read_string(binary_data, 0x100, 16) == "abc"
+    assert mem_access_read_string(binary_data, 0x100, 2) == "ab"
+    assert mem_access_read_string(binary_data, 0x100, 7, "latin-1", False) == "abc\0def"
+
+    # The zero bytes inside a UTF-16 code unit are no termination.
+    assert mem_access_read_string(binary_data, 0x200, 16, "utf-16-le") == "a\u0100"
+
+    mem_access = mem_access_get_api_by_data_type("utf16le", binary_data)
+    assert mem_access.get_string(0x200, 2, "utf-16-le") == "a"
+
+    # Without max. length up to the termination or the end of the binary data.
+    assert mem_access_read_string(binary_data, 0x100) == "abc"
+    assert mem_access_read_string(BinaryImage([(0x100, b"abc\0def")]), 0x104) == "def"
+    assert mem_access_read_string(BinaryImage(), 0) == ""
+
+    # A long string is read across several chunks.
+    long_string = "x" * 1000
+    binary_data = BinaryImage([(0, long_string.encode("utf-8") + b"\0")])
+    assert mem_access_read_string(binary_data, 0) == long_string
+
+    with pytest.raises(ValueError):
+        mem_access_read_string(binary_data, 0, None, "utf-8", False)
+
+def test_read_string_cut_character():
+    """Test that a max. length inside a multi-byte character drops it.
+    """
+    binary_data = BinaryImage([(0, "a\u00e4\u20ac".encode("utf-8") + b"\0"),
+                               (0x100, "a\U0001f600".encode("utf-16-le"))])
+
+    # UTF-8: a (1 byte), a umlaut (2 byte), euro sign (3 byte)
+    assert mem_access_read_string(binary_data, 0, 2) == "a"
+    assert mem_access_read_string(binary_data, 0, 3) == "a\u00e4"
+    assert mem_access_read_string(binary_data, 0, 5) == "a\u00e4"
+    assert mem_access_read_string(binary_data, 0, 5, "utf-8", False) == "a\u00e4"
+    assert mem_access_read_string(binary_data, 0, 16) == "a\u00e4\u20ac"
+
+    # UTF-16: a (2 byte), surrogate pair (4 byte), also cut in a code unit
+    assert mem_access_read_string(binary_data, 0x100, 4, "utf-16-le") == "a"
+    assert mem_access_read_string(binary_data, 0x100, 5, "utf-16-le") == "a"
+    assert mem_access_read_string(binary_data, 0x100, 6, "utf-16-le") == "a\U0001f600"
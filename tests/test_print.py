@@ -126,3 +126,88 @@ def test_config_structure_nested_array(capsys):
     assert captured_lines[6] == "ubyte_list._1_.element._1_.a @ 00000006: 55"
     assert captured_lines[7] == "ubyte_list._1_.element._1_.b @ 00000007: 56"
     assert captured_lines[8] == ""
+
+def test_batch(capsys, tmp_path):
+    """Test the batch processing of several binary files with one output file per binary file."""
+    for name in ["a.bin", "b.bin"]:
+        (tmp_path / name).write_bytes(b"12345678")
+
+    (tmp_path / "manifest.txt").write_text("# Additional binary files\nmissing.bin\n")
+
+    args = {
+        "binaryFile": [ str(tmp_path / "*.bin") ],
+        "configFile": [ "tests/data/config.json" ],
+        "templateFile": None,
+        "onlyInHex": False,
+        "verbose": False,
+        "manifestFile": str(tmp_path / "manifest.txt"),
+        "output": str(tmp_path / "{stem}.txt")
+    }
+
+    ret_status = _exec(dict_to_bunch(args))
+
+    captured = capsys.readouterr()
+
+    # The missing file is reported, but doesn't abort the others.
+    assert ret_status == Ret.ERROR_INPUT_FILE_NOT_FOUND
+    assert "missing.bin" in captured.err
+
+    for name in ["a.txt", "b.txt"]:
+        output_lines = (tmp_path / name).read_text().split("\n")
+
+        assert output_lines[0] == "uint8_single @ 00000000: 49"
+        assert output_lines[1] == "uint8_array @ 00000001: [50, 51, 52]"
+        assert output_lines[2] == "utf8 @ 00000004: 567"
+
+def test_batch_parallel(capsys):
+    """Test that the parallel batch processing provides the same output like the sequential one."""
+    args = {
+        "binaryFile": [ "tests/data/data.txt", "tests/data/not_existing.bin", "tests/data/data.txt" ],
+        "configFile": [ "tests/data/config_structure_nested_array.json" ],
+        "templateFile": None,
+        "onlyInHex": False,
+        "verbose": False,
+        "jobs": 1
+    }
+
+    ret_status = _exec(dict_to_bunch(args))
+    captured = capsys.readouterr()
+
+    assert ret_status == Ret.ERROR_INPUT_FILE_NOT_FOUND
+
+    args["jobs"] = 2
+    parallel_ret_status = _exec(dict_to_bunch(args))
+    parallel_captured = capsys.readouterr()
+
+    assert parallel_ret_status == ret_status
+    assert parallel_captured.out == captured.out
+    assert parallel_captured.err == captured.err
+
+def test_template_config_elements(capsys, tmp_path):
+    """Test that the template gets the real template elements by iterating
+        over all configuration elements, although they are created lazily.
+    """
+    template_file = tmp_path / "report.mako"
+    template_file.write_text("% for element in config_elements:\n" \
+                             "${type(element).__name__.startswith('TmplElementLazy')} " \
+                             "${element.name()} @ ${'%08X' % element.addr()}: ${element}\n" \
+                             "% endfor\n")
+
+    args = {
+        "binaryFile": [ "tests/data/data.txt" ],
+        "configFile": [ "tests/data/config.json" ],
+        "templateFile": str(template_file),
+        "onlyInHex": False,
+        "verbose": False,
+        "noCache": True
+    }
+
+    ret_status = _exec(dict_to_bunch(args))
+
+    captured = capsys.readouterr()
+    captured_lines = captured.out.split("\n")
+
+    assert ret_status == Ret.OK
+    assert captured_lines[0] == "False uint8_single @ 00000000: 49"
+    assert captured_lines[1] == "False uint8_array @ 00000001: [50, 51, 52]"
+    assert captured_lines[2] == "False utf8 @ 00000004: 567"
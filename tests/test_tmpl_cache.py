@@ -0,0 +1,45 @@
+"""Tests
+"""
+
+import os
+from pyHexDump import tmpl_cache
+from pyHexDump.tmpl_cache import tmpl_cache_get_template
+
+def test_tmpl_cache(tmp_path):
+    """Test that a compiled template is cached in the process and on disk.
+    """
+    template = "${value * 2}"
+    cache_dir = str(tmp_path)
+
+    tmpl = tmpl_cache_get_template(template, cache_dir)
+    assert tmpl.render(value=21) == "42"
+
+    # Same template object within the process.
+    assert tmpl_cache_get_template(template, cache_dir) is tmpl
+
+    cache_files = os.listdir(os.path.join(cache_dir, "template"))
+    assert len(cache_files) == 1
+
+    # Loaded from disk in another process, simulated by clearing the process cache.
+    tmpl_cache._TEMPLATE_CACHE.clear() # pylint: disable=protected-access
+
+    cached_tmpl = tmpl_cache_get_template(template, cache_dir)
+    assert cached_tmpl is not tmpl
+    assert cached_tmpl.render(value=21) == "42"
+
+def test_tmpl_cache_invalid(tmp_path):
+    """Test that a invalid cache entry is replaced by a new compiled template.
+    """
+    template = "${value + 1}"
+    cache_dir = str(tmp_path)
+
+    tmpl_cache_get_template(template, cache_dir)
+    tmpl_cache._TEMPLATE_CACHE.clear() # pylint: disable=protected-access
+
+    cache_dir = os.path.join(cache_dir, "template")
+    cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+
+    with open(cache_file, "w", encoding="utf-8") as file_descriptor:
+        file_descriptor.write("this is no python code")
+
+    assert tmpl_cache_get_template(template, str(tmp_path)).render(value=1) == "2"
@@ -1,6 +1,9 @@
 """Tests
 """
 
+import array
+import copy
+import pickle
 import struct
 from pyHexDump.tmpl_element import TmplElementInt, TmplElementIntList, \
     TmplElementFloat, TmplElementFloatList, TmplElementStr
@@ -258,3 +261,57 @@ def test_tmpl_element_with_array_part_3():
     assert hex_str == tmpl_element.hex()
 
     assert test_values == tmpl_element
+
+def test_tmpl_element_slots():
+    """Test that the template elements have no instance dictionary and
+        share the bit width by a class per bit width.
+    """
+    tmpl_element = TmplElementInt("test", 0x10, -1, 16)
+    other_tmpl_element = TmplElementInt("other", 0x20, 2, 16)
+
+    assert hasattr(tmpl_element, "__dict__") is False
+    assert type(tmpl_element) is type(other_tmpl_element)
+    assert isinstance(tmpl_element, TmplElementInt) is True
+    assert tmpl_element.hex() == "0xFFFF"
+
+    tmpl_element = TmplElementFloat("test", 0x10, 1.0, 64)
+    assert hasattr(tmpl_element, "__dict__") is False
+    assert type(tmpl_element) is not type(TmplElementFloat("test", 0x10, 1.0, 32))
+
+    # Copies keep the bit width.
+    for tmpl_element in [TmplElementInt("test", 0x10, -1, 8),
+                         TmplElementIntList("test", 0x10, [1, -1], 32),
+                         TmplElementStr("test", 0x10, "abc", 8)]:
+        for tmpl_element_copy in [copy.copy(tmpl_element),
+                                  pickle.loads(pickle.dumps(tmpl_element))]:
+            assert type(tmpl_element_copy) is type(tmpl_element)
+            assert tmpl_element_copy.name() == tmpl_element.name()
+            assert tmpl_element_copy.addr() == tmpl_element.addr()
+            assert tmpl_element_copy.hex() == tmpl_element.hex()
+
+def test_tmpl_element_array():
+    """Test that list elements with a array.array behave like with a list.
+    """
+    test_values = [0, 1, -2, 32767, -32768]
+    tmpl_element = TmplElementIntList("test", 0, array.array("h", test_values), 16)
+    expected_tmpl_element = TmplElementIntList("test", 0, test_values, 16)
+
+    assert str(tmpl_element) == str(test_values)
+    assert tmpl_element.hex() == expected_tmpl_element.hex()
+    assert tmpl_element.hex() == "[0x0000, 0x0001, 0xFFFE, 0x7FFF, 0x8000]"
+    assert tmpl_element == test_values
+    assert tmpl_element[2] == -2
+    assert tmpl_element[1:3] == [1, -2]
+    assert isinstance(tmpl_element[1:3], list) is True
+    assert tmpl_element + [5] == test_values + [5]
+    assert tmpl_element * 2 == test_values * 2
+    assert list(tmpl_element) == test_values
+
+    test_values = [1.5, -0.25]
+    tmpl_element = TmplElementFloatList("test", 0, array.array("d", test_values), 64)
+    expected_tmpl_element = TmplElementFloatList("test", 0, test_values, 64)
+
+    assert str(tmpl_element) == str(test_values)
+    assert tmpl_element.hex() == expected_tmpl_element.hex()
+    assert tmpl_element.hex() == "[0x3FF8000000000000, 0xBFD0000000000000]"
+    assert tmpl_element[0:1] == [1.5]
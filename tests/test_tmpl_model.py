@@ -0,0 +1,179 @@
+"""Tests
+"""
+
+import random
+import pytest
+import pyHexDump.tmpl_model
+from pyHexDump.binary_image import BinaryImage
+from pyHexDump.common import common_load_binary_file
+from pyHexDump.config_model import ConfigModel
+from pyHexDump.tmpl_model import TmplModel
+from pyHexDump.tmpl_element import TmplElementInt, TmplElementLazy
+
+def test_lazy_tmpl_element():
+    """Test that the lazy template element creates the real one only once
+        and on first use.
+    """
+    created = []
+
+    def factory():
+        tmpl_element = TmplElementInt("test", 0x10, 42, 8)
+        created.append(tmpl_element)
+        return tmpl_element
+
+    tmpl_element = TmplElementLazy("test", 0x10, factory)
+
+    # Name and address don't need the real element.
+    assert tmpl_element.name() == "test"
+    assert tmpl_element.addr() == 0x10
+    assert len(created) == 0
+
+    assert tmpl_element == 42
+    assert tmpl_element + 1 == 43
+    assert (tmpl_element >> 1) == 21
+    assert str(tmpl_element) == "42"
+    assert tmpl_element.hex() == "0x2A"
+    assert len(created) == 1
+
+def test_lazy_tmpl_model():
+    """Test that the lazy template model provides the same values like the
+        eager one.
+    """
+    _, binary_data = common_load_binary_file("tests/data/data.txt")
+    config_model = ConfigModel()
+    config_model.load("tests/data/config_structure_nested_array.json")
+
+    tmpl_model = TmplModel()
+    tmpl_model.load_from_config_elements(binary_data, config_model.get())
+
+    lazy_tmpl_model = TmplModel(is_lazy=True)
+    lazy_tmpl_model.load_from_config_elements(binary_data, config_model.get())
+
+    tmpl_element_list = tmpl_model.get_list()
+    lazy_tmpl_element_list = lazy_tmpl_model.get_list()
+
+    assert len(tmpl_element_list) == len(lazy_tmpl_element_list)
+
+    # The structures hold the lazy template elements.
+    lazy_proxy = lazy_tmpl_model.get()["ubyte_list._1_"]["element._0_"]["b"]
+    assert isinstance(lazy_proxy, TmplElementLazy) is True
+
+    # Iterating over the list provides the real template elements.
+    for tmpl_element, lazy_tmpl_element in zip(tmpl_element_list, lazy_tmpl_element_list):
+        assert isinstance(lazy_tmpl_element, TmplElementLazy) is False
+        assert type(lazy_tmpl_element) is type(tmpl_element)
+        assert lazy_tmpl_element.name() == tmpl_element.name()
+        assert lazy_tmpl_element.addr() == tmpl_element.addr()
+        assert lazy_tmpl_element == tmpl_element
+        assert lazy_tmpl_element.hex() == tmpl_element.hex()
+
+    assert lazy_tmpl_element_list[5] is lazy_proxy.resolve()
+    assert lazy_tmpl_element_list[5:6] == [lazy_proxy.resolve()]
+
+def test_numpy_tmpl_model(monkeypatch):
+    """Test that the values decoded with NumPy are the same like the values
+        decoded without NumPy.
+    """
+    pytest.importorskip("numpy")
+
+    random.seed(0)
+    data = bytearray(random.getrandbits(8) for _ in range(4096))
+
+    # Avoid NaN in the float values and invalid characters in the strings.
+    for idx in range(100):
+        data[400 + idx * 4] = 0x3F
+
+    for idx in range(50):
+        data[1024 + idx * 22 + 4:1024 + idx * 22 + 8] = b"abc\0"
+        data[1024 + idx * 22 + 21] = 0x3F
+
+    binary_data = BinaryImage([(0, data)])
+    config_model = ConfigModel()
+    config_model.load_from_dict({
+        "elements": [{
+            "name": "table",
+            "addr": 0,
+            "dataType": "uint16le",
+            "count": 200
+        }, {
+            "name": "curve",
+            "addr": 400,
+            "dataType": "float32be",
+            "count": 100
+        }, {
+            "name": "records",
+            "addr": 1024,
+            "dataType": "record_t",
+            "count": 50
+        }],
+        "structures": [{
+            "name": "record_t",
+            "elements": [{
+                "name": "id",
+                "dataType": "uint32le",
+                "count": 1
+            }, {
+                "name": "name",
+                "dataType": "utf8",
+                "count": 4
+            }, {
+                "name": "values",
+                "dataType": "int16be",
+                "count": 3
+            }, {
+                "name": "factor",
+                "dataType": "float64le",
+                "count": 1
+            }]
+        }]
+    })
+
+    tmpl_model = TmplModel()
+    tmpl_model.load_from_config_elements(binary_data, config_model.get())
+
+    monkeypatch.setattr(pyHexDump.tmpl_model, "mem_access_is_numpy_available", lambda: False)
+    expected_tmpl_model = TmplModel()
+    expected_tmpl_model.load_from_config_elements(binary_data, config_model.get())
+
+    # The large lists are kept as NumPy arrays.
+    assert type(tmpl_model.get()["table"]._value).__name__ == "ndarray"
+    assert type(tmpl_model.get()["curve"]._value).__name__ == "ndarray"
+    assert isinstance(tmpl_model.get()["table"][0], int) is True
+
+    tmpl_element_list = tmpl_model.get_list()
+    expected_tmpl_element_list = expected_tmpl_model.get_list()
+
+    assert len(tmpl_element_list) == 2 + 50 * 4
+
+    for tmpl_element, expected_tmpl_element in zip(tmpl_element_list, expected_tmpl_element_list):
+        assert tmpl_element.name() == expected_tmpl_element.name()
+        assert tmpl_element.addr() == expected_tmpl_element.addr()
+        assert str(tmpl_element) == str(expected_tmpl_element)
+        assert tmpl_element.hex() == expected_tmpl_element.hex()
+        assert tmpl_element == expected_tmpl_element
+
+def test_string_tmpl_elements():
+    """Test strings with different encodings, which are limited by the element count.
+    """
+    binary_data = BinaryImage([(0, "Hi\u20AC".encode("utf-16-le") + bytes(2) + b"\xC4pfel!")])
+    config_model = ConfigModel()
+    config_model.load_from_dict({
+        "elements": [{
+            "name": "utf16",
+            "addr": 0,
+            "dataType": "utf16le",
+            "count": 8
+        }, {
+            "name": "latin1",
+            "addr": 8,
+            "dataType": "latin1",
+            "count": 5
+        }]
+    })
+
+    tmpl_model = TmplModel()
+    tmpl_model.load_from_config_elements(binary_data, config_model.get())
+
+    assert str(tmpl_model.get()["utf16"]) == "Hi\u20AC"
+    assert tmpl_model.get()["utf16"].hex() == "[0x0048, 0x0069, 0x20AC]"
+    assert str(tmpl_model.get()["latin1"]) == "\xC4pfel"
@@ -0,0 +1,127 @@
+"""Utilities
+    Memory benchmark of the template model with a large synthetic configuration.
+    Run it from the root path: "python ./util/benchmark_memory.py"
+"""
+
+import sys
+import tracemalloc
+
+sys.path.insert(0, "./src")
+
+# pylint: disable=wrong-import-position
+from pyHexDump.binary_image import BinaryImage
+from pyHexDump.config_model import ConfigModel
+from pyHexDump.tmpl_model import TmplModel
+
+# Number of structures in the synthetic configuration.
+STRUCTURE_COUNT = 50000
+
+class DictTemplateElement(): # pylint: disable=too-few-public-methods
+    """Template element with a instance dictionary and the bit width per
+        instance, which is used as reference.
+    """
+    def __init__(self, name, addr, value, bit_width):
+        self._name = name
+        self._addr = addr
+        self._value = value
+        self._bit_width = bit_width
+
+def get_config_model(structure_count):
+    """Get a configuration with a array of structures.
+
+    Args:
+        structure_count (int): Number of structures
+
+    Returns:
+        ConfigModel: Configuration model
+    """
+    config_model = ConfigModel()
+    config_model.load_from_dict({
+        "elements": [{
+            "name": "records",
+            "addr": 0,
+            "dataType": "record_t",
+            "count": structure_count
+        }],
+        "structures": [{
+            "name": "record_t",
+            "elements": [{
+                "name": "id",
+                "dataType": "uint32le",
+                "count": 1
+            }, {
+                "name": "flags",
+                "dataType": "uint8",
+                "count": 1
+            }, {
+                "name": "offset",
+                "dataType": "int16le",
+                "count": 1
+            }, {
+                "name": "factor",
+                "dataType": "float32le",
+                "count": 1
+            }]
+        }]
+    })
+
+    return config_model
+
+def create_tmpl_elements(tmpl_element_class, tmpl_element_list):
+    """Create a copy of all template elements with the given class.
+
+    Args:
+        tmpl_element_class (class|None): Template element class or None to use
+            the class of the original template element.
+        tmpl_element_list (list): Template elements
+
+    Returns:
+        list: Created template elements
+    """
+    # pylint: disable=protected-access
+    return [(tmpl_element_class or tmpl_element.__class__)(tmpl_element.name(),
+                                                           tmpl_element.addr(),
+                                                           tmpl_element._value,
+                                                           tmpl_element._bit_width)
+            for tmpl_element in tmpl_element_list]
+
+def measure(func):
+    """Measure the memory, which is allocated by a function and still in use
+        after it returns.
+
+    Args:
+        func (callable): Function without arguments
+
+    Returns:
+        any, int: Result of the function and allocated memory in byte
+    """
+    tracemalloc.start()
+    result = func()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, allocated
+
+def main():
+    """Measure the memory of the template elements and compare it with
+        template elements, which have a instance dictionary.
+    """
+    config_model = get_config_model(STRUCTURE_COUNT)
+    binary_data = BinaryImage([(0, bytes(config_model.get()["records"].size))])
+
+    tmpl_model = TmplModel()
+    tmpl_model.load_from_config_elements(binary_data, config_model.get())
+    tmpl_element_list = tmpl_model.get_list()
+    element_count = len(tmpl_element_list)
+
+    _, allocated = measure(lambda: create_tmpl_elements(None, tmpl_element_list))
+    _, reference_allocated = measure(lambda: create_tmpl_elements(DictTemplateElement,
+                                                                  tmpl_element_list))
+
+    print(f"Template elements: {element_count}")
+    print(f"With instance dictionary: {reference_allocated // element_count} byte per element")
+    print(f"With slots: {allocated // element_count} byte per element")
+    print(f"Reduction: {100 - (100 * allocated) // reference_allocated} %")
+
+if __name__ == "__main__":
+    main()